@@ -0,0 +1,102 @@
+"""Add user_spend_summary table
+
+Revision ID: a4b5c6d7e8f9
+Revises: f3a4b5c6d7e8
+Create Date: 2026-10-16 13:00:00.000000
+
+Existing finished orders are backfilled; the order workflow keeps the rows current from then on.
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a4b5c6d7e8f9"
+down_revision: str | None = "f3a4b5c6d7e8"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "user_spend_summary",
+        sa.Column("user_id", sa.UUID(), nullable=False),
+        sa.Column("group_id", sa.UUID(), nullable=False),
+        sa.Column("orders_participated", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("items_spent", sa.Numeric(precision=12, scale=2), server_default="0", nullable=False),
+        sa.Column("delivery_spent", sa.Numeric(precision=12, scale=2), server_default="0", nullable=False),
+        sa.Column(
+            "restaurant_counts",
+            postgresql.JSONB(astext_type=sa.Text()),
+            server_default=sa.text("'{}'::jsonb"),
+            nullable=False,
+        ),
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.ForeignKeyConstraint(["group_id"], ["groups.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("user_id", "group_id", name="uq_user_spend_summary_user_group"),
+    )
+    op.create_index(op.f("ix_user_spend_summary_group_id"), "user_spend_summary", ["group_id"], unique=False)
+    # Same figures as UserSpendSummaryRepository.rebuild_for_groups, for every group at once
+    op.execute(
+        """
+        WITH per_order AS (
+            SELECT
+                order_items.user_id,
+                orders.group_id,
+                orders.restaurant_name,
+                coalesce(orders.delivery_fee_per_person, 0) AS delivery_spent,
+                sum(order_items.price * order_items.quantity) AS items_spent
+            FROM order_items
+            JOIN orders ON orders.id = order_items.order_id
+            WHERE orders.status = 'finished'
+            GROUP BY order_items.user_id, orders.id
+        ),
+        totals AS (
+            SELECT
+                user_id,
+                group_id,
+                count(*) AS orders_participated,
+                sum(items_spent) AS items_spent,
+                sum(delivery_spent) AS delivery_spent
+            FROM per_order
+            GROUP BY user_id, group_id
+        ),
+        restaurant_stats AS (
+            SELECT user_id, group_id, jsonb_object_agg(restaurant_name, order_count) AS restaurant_counts
+            FROM (
+                SELECT user_id, group_id, restaurant_name, count(*) AS order_count
+                FROM per_order
+                WHERE restaurant_name IS NOT NULL
+                GROUP BY user_id, group_id, restaurant_name
+            ) per_restaurant
+            GROUP BY user_id, group_id
+        )
+        INSERT INTO user_spend_summary (
+            id, user_id, group_id, orders_participated, items_spent, delivery_spent, restaurant_counts
+        )
+        SELECT
+            gen_random_uuid(),
+            t.user_id,
+            t.group_id,
+            t.orders_participated,
+            t.items_spent,
+            t.delivery_spent,
+            coalesce(r.restaurant_counts, '{}'::jsonb)
+        FROM totals t
+        LEFT JOIN restaurant_stats r ON r.user_id = t.user_id AND r.group_id = t.group_id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_user_spend_summary_group_id"), table_name="user_spend_summary")
+    op.drop_table("user_spend_summary")
@@ -0,0 +1,61 @@
+"""Add group_daily_spend table
+
+Revision ID: b5c6d7e8f9a0
+Revises: a4b5c6d7e8f9
+Create Date: 2026-10-16 14:00:00.000000
+
+Existing finished orders are backfilled; the order workflow keeps the rows current from then on.
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b5c6d7e8f9a0"
+down_revision: str | None = "a4b5c6d7e8f9"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "group_daily_spend",
+        sa.Column("group_id", sa.UUID(), nullable=False),
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("orders_count", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("items_spent", sa.Numeric(precision=12, scale=2), server_default="0", nullable=False),
+        sa.Column("delivery_spent", sa.Numeric(precision=12, scale=2), server_default="0", nullable=False),
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.ForeignKeyConstraint(["group_id"], ["groups.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("group_id", "day", name="uq_group_daily_spend_group_day"),
+    )
+    # Same figures as GroupDailySpendRepository.rebuild_for_groups: orders count on the UTC day they finished
+    op.execute(
+        """
+        INSERT INTO group_daily_spend (id, group_id, day, orders_count, items_spent, delivery_spent)
+        SELECT gen_random_uuid(), group_id, day, count(*), sum(items_spent), sum(delivery_spent)
+        FROM (
+            SELECT
+                orders.group_id,
+                (orders.updated_at AT TIME ZONE 'UTC')::date AS day,
+                coalesce(orders.delivery_fee_total, 0) AS delivery_spent,
+                coalesce(sum(order_items.price * order_items.quantity), 0) AS items_spent
+            FROM orders
+            LEFT JOIN order_items ON order_items.order_id = orders.id
+            WHERE orders.status = 'finished'
+            GROUP BY orders.id
+        ) per_order
+        GROUP BY group_id, day
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("group_daily_spend")
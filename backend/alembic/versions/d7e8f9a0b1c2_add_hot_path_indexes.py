@@ -0,0 +1,44 @@
+"""Add indexes on hot filter and pagination columns
+
+Revision ID: d7e8f9a0b1c2
+Revises: c6d7e8f9a0b1
+Create Date: 2026-10-16 16:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d7e8f9a0b1c2"
+down_revision: str | None = "c6d7e8f9a0b1"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# (index name, table, columns). Keyset-paginated lists end in (created_at, id).
+INDEXES = [
+    ("ix_orders_group_id_status", "orders", ["group_id", "status"]),
+    ("ix_orders_group_id_created_at", "orders", ["group_id", "created_at", "id"]),
+    ("ix_order_items_order_id", "order_items", ["order_id"]),
+    ("ix_order_items_user_id", "order_items", ["user_id"]),
+    ("ix_group_members_group_id_created_at", "group_members", ["group_id", "created_at", "id"]),
+    ("ix_balance_history_balance_id_created_at", "balance_history", ["balance_id", "created_at", "id"]),
+    ("ix_dishes_restaurant_id_created_at", "dishes", ["restaurant_id", "created_at", "id"]),
+    ("ix_restaurants_group_id", "restaurants", ["group_id"]),
+    (
+        "ix_group_invitations_invitee_email_group_id_status",
+        "group_invitations",
+        ["invitee_email", "group_id", "status"],
+    ),
+]
+
+
+def upgrade() -> None:
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns)
+
+
+def downgrade() -> None:
+    for name, table, _columns in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
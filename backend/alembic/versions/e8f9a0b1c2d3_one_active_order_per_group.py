@@ -0,0 +1,55 @@
+"""Allow at most one active order per group
+
+Revision ID: e8f9a0b1c2d3
+Revises: d7e8f9a0b1c2
+Create Date: 2026-10-16 17:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e8f9a0b1c2d3"
+down_revision: str | None = "d7e8f9a0b1c2"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+ACTIVE = "status NOT IN ('finished', 'cancelled')"
+
+
+def upgrade() -> None:
+    # Races could leave several active orders in a group; keep the newest and cancel the rest,
+    # counting them in the analytics rollup as the order workflow does on cancellation
+    op.execute(
+        f"""
+        WITH cancelled AS (
+            UPDATE orders SET status = 'cancelled', updated_at = now()
+            WHERE {ACTIVE}
+              AND id NOT IN (
+                SELECT DISTINCT ON (group_id) id FROM orders
+                WHERE {ACTIVE}
+                ORDER BY group_id, created_at DESC, id DESC
+              )
+            RETURNING group_id
+        )
+        UPDATE group_analytics_rollup r
+        SET cancelled_orders = r.cancelled_orders + c.cancelled, updated_at = now()
+        FROM (SELECT group_id, count(*) AS cancelled FROM cancelled GROUP BY group_id) c
+        WHERE r.group_id = c.group_id
+        """
+    )
+    op.create_index(
+        "uq_orders_active_group",
+        "orders",
+        ["group_id"],
+        unique=True,
+        postgresql_where=sa.text(ACTIVE),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("uq_orders_active_group", table_name="orders")
@@ -0,0 +1,96 @@
+"""Add group_analytics_rollup table
+
+Revision ID: f3a4b5c6d7e8
+Revises: e2f3a4b5c6d7
+Create Date: 2026-10-16 12:00:00.000000
+
+Existing groups are backfilled from their orders; the order workflows keep the rows current from then on.
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f3a4b5c6d7e8"
+down_revision: str | None = "e2f3a4b5c6d7"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "group_analytics_rollup",
+        sa.Column("group_id", sa.UUID(), nullable=False),
+        sa.Column("total_orders", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("completed_orders", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("cancelled_orders", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("items_spent", sa.Numeric(precision=12, scale=2), server_default="0", nullable=False),
+        sa.Column("delivery_spent", sa.Numeric(precision=12, scale=2), server_default="0", nullable=False),
+        sa.Column(
+            "restaurant_counts",
+            postgresql.JSONB(astext_type=sa.Text()),
+            server_default=sa.text("'{}'::jsonb"),
+            nullable=False,
+        ),
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.ForeignKeyConstraint(["group_id"], ["groups.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("group_id", name="uq_group_analytics_rollup_group"),
+    )
+    # Same figures as GroupAnalyticsRollupRepository.rebuild_for_groups, for every group at once
+    op.execute(
+        """
+        INSERT INTO group_analytics_rollup (
+            id, group_id, total_orders, completed_orders, cancelled_orders,
+            items_spent, delivery_spent, restaurant_counts
+        )
+        SELECT
+            gen_random_uuid(),
+            g.id,
+            coalesce(o.total_orders, 0),
+            coalesce(o.completed_orders, 0),
+            coalesce(o.cancelled_orders, 0),
+            coalesce(i.items_spent, 0),
+            coalesce(o.delivery_spent, 0),
+            coalesce(r.restaurant_counts, '{}'::jsonb)
+        FROM groups g
+        LEFT JOIN (
+            SELECT
+                group_id,
+                count(*) AS total_orders,
+                count(*) FILTER (WHERE status = 'finished') AS completed_orders,
+                count(*) FILTER (WHERE status = 'cancelled') AS cancelled_orders,
+                coalesce(sum(delivery_fee_total) FILTER (WHERE status = 'finished'), 0) AS delivery_spent
+            FROM orders
+            GROUP BY group_id
+        ) o ON o.group_id = g.id
+        LEFT JOIN (
+            SELECT orders.group_id, sum(order_items.price * order_items.quantity) AS items_spent
+            FROM order_items
+            JOIN orders ON orders.id = order_items.order_id
+            WHERE orders.status = 'finished'
+            GROUP BY orders.group_id
+        ) i ON i.group_id = g.id
+        LEFT JOIN (
+            SELECT group_id, jsonb_object_agg(restaurant_name, order_count) AS restaurant_counts
+            FROM (
+                SELECT group_id, restaurant_name, count(*) AS order_count
+                FROM orders
+                WHERE restaurant_name IS NOT NULL
+                GROUP BY group_id, restaurant_name
+            ) per_restaurant
+            GROUP BY group_id
+        ) r ON r.group_id = g.id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("group_analytics_rollup")
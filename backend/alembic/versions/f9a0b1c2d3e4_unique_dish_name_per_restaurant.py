@@ -0,0 +1,49 @@
+"""Make dish names unique per restaurant
+
+Revision ID: f9a0b1c2d3e4
+Revises: e8f9a0b1c2d3
+Create Date: 2026-10-16 18:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f9a0b1c2d3e4"
+down_revision: str | None = "e8f9a0b1c2d3"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Every duplicate dish paired with the newest dish of the same name in its restaurant, which is kept
+DUPLICATES = """
+    SELECT id, keep_id FROM (
+        SELECT id, first_value(id) OVER (
+            PARTITION BY restaurant_id, name ORDER BY created_at DESC, id DESC
+        ) AS keep_id
+        FROM dishes
+    ) ranked
+    WHERE id <> keep_id
+"""
+
+
+def upgrade() -> None:
+    op.execute(f"UPDATE order_items SET dish_id = d.keep_id FROM ({DUPLICATES}) d WHERE order_items.dish_id = d.id")
+    # Carry favorites over to the kept dish; those left on duplicates go with them via ON DELETE CASCADE
+    op.execute(
+        f"""
+        INSERT INTO favorite_dishes (id, user_id, dish_id, is_favorite, created_at, updated_at)
+        SELECT DISTINCT ON (f.user_id, d.keep_id) gen_random_uuid(), f.user_id, d.keep_id, f.is_favorite, now(), now()
+        FROM favorite_dishes f JOIN ({DUPLICATES}) d ON f.dish_id = d.id
+        ORDER BY f.user_id, d.keep_id, f.updated_at DESC
+        ON CONFLICT ON CONSTRAINT uq_favorite_dish_user_dish DO NOTHING
+        """
+    )
+    op.execute(f"DELETE FROM dishes WHERE id IN (SELECT id FROM ({DUPLICATES}) d)")
+
+    op.create_unique_constraint("uq_dish_restaurant_name", "dishes", ["restaurant_id", "name"])
+
+
+def downgrade() -> None:
+    op.drop_constraint("uq_dish_restaurant_name", "dishes", type_="unique")
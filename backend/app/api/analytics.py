@@ -1,166 +1,166 @@
 import uuid
+from collections import Counter
+from datetime import UTC, date, datetime, timedelta
 from decimal import Decimal
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.exceptions import ForbiddenError
+from app.core.cache import group_analytics_cache, user_analytics_cache
+from app.core.exceptions import ForbiddenError, NotFoundError, ValidationError
 from app.database import get_db
-from app.dependencies import get_current_user, get_group_member_repository
+from app.dependencies import (
+    get_current_user,
+    get_group_daily_spend_repository,
+    get_group_member_repository,
+    get_user_spend_summary_repository,
+)
+from app.models.analytics import GroupAnalyticsRollup
 from app.models.balance import Balance
-from app.models.enums import AnalyticsScope, OrderStatus, PermissionType
-from app.models.group import GroupMember
-from app.models.order import Order, OrderItem
-from app.models.user import User
+from app.models.enums import AnalyticsScope, PermissionType, TimeBucket
+from app.models.group import Group, GroupMember
+from app.repositories.analytics import GroupDailySpendRepository, UserSpendSummaryRepository
 from app.repositories.group import GroupMemberRepository
-from app.schemas.analytics import GroupAnalytics, UserAnalytics
+from app.schemas.analytics import GroupAnalytics, SpendingPoint, SpendingTimeseries, UserAnalytics
+from app.schemas.user import CurrentUser
 
 router = APIRouter(tags=["analytics"])
 
 
+async def _ensure_can_view_analytics(
+    current_user: CurrentUser,
+    group_id: uuid.UUID,
+    group_member_repository: GroupMemberRepository,
+) -> None:
+    if current_user.is_admin:
+        return
+    membership = await group_member_repository.get_permissions(current_user.id, group_id)
+    if membership is None:
+        raise ForbiddenError(detail="You are not a member of this group")
+    analytics_level = membership.get_permission(PermissionType.ANALYTICS)
+    if analytics_level == AnalyticsScope.NONE or analytics_level is None:
+        raise ForbiddenError(detail="You do not have permission to view analytics")
+
+
 @router.get("/groups/{group_id}/analytics", response_model=GroupAnalytics)
 async def get_group_analytics(
     group_id: uuid.UUID,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     group_member_repository: GroupMemberRepository = Depends(get_group_member_repository),
     session: AsyncSession = Depends(get_db),
 ) -> GroupAnalytics:
-    # Permission check
-    if not current_user.is_admin:
-        membership = await group_member_repository.get_membership(current_user.id, group_id)
-        if membership is None:
-            raise ForbiddenError(detail="You are not a member of this group")
-        analytics_level = membership.get_permission(PermissionType.ANALYTICS)
-        if analytics_level == AnalyticsScope.NONE or analytics_level is None:
-            raise ForbiddenError(detail="You do not have permission to view analytics")
-
-    # Total orders
-    total_query = select(func.count()).select_from(Order).where(Order.group_id == group_id)
-    total_orders = (await session.execute(total_query)).scalar_one()
-
-    # Completed orders
-    completed_query = (
-        select(func.count()).select_from(Order).where(Order.group_id == group_id, Order.status == OrderStatus.FINISHED)
-    )
-    completed_orders = (await session.execute(completed_query)).scalar_one()
+    await _ensure_can_view_analytics(current_user, group_id, group_member_repository)
 
-    # Cancelled
-    cancelled_query = (
-        select(func.count()).select_from(Order).where(Order.group_id == group_id, Order.status == OrderStatus.CANCELLED)
-    )
-    cancelled_orders = (await session.execute(cancelled_query)).scalar_one()
-
-    # Active
-    active_query = (
-        select(func.count())
-        .select_from(Order)
-        .where(
-            Order.group_id == group_id,
-            Order.status.notin_([OrderStatus.FINISHED, OrderStatus.CANCELLED]),
-        )
-    )
-    active_orders = (await session.execute(active_query)).scalar_one()
-
-    # Members
-    members_query = select(func.count()).select_from(GroupMember).where(GroupMember.group_id == group_id)
-    total_members = (await session.execute(members_query)).scalar_one()
+    cached = group_analytics_cache.get(group_id)
+    if cached is not None:
+        return cached
+    cache_version = group_analytics_cache.version
 
-    # Total spent (sum of all order items + delivery fees in finished orders)
-    items_spent_query = (
-        select(func.coalesce(func.sum(OrderItem.price), 0))
-        .join(Order, OrderItem.order_id == Order.id)
-        .where(Order.group_id == group_id, Order.status == OrderStatus.FINISHED)
+    # Order figures come from the incrementally maintained rollup; only the member count is live
+    member_count = (
+        select(func.count()).select_from(GroupMember).where(GroupMember.group_id == group_id).scalar_subquery()
     )
-    items_spent = (await session.execute(items_spent_query)).scalar_one()
-
-    delivery_spent_query = (
-        select(func.coalesce(func.sum(Order.delivery_fee_total), 0))
-        .where(Order.group_id == group_id, Order.status == OrderStatus.FINISHED)
+    query = (
+        select(GroupAnalyticsRollup, member_count.label("total_members"))
+        .select_from(Group)
+        .outerjoin(GroupAnalyticsRollup, GroupAnalyticsRollup.group_id == Group.id)
+        .where(Group.id == group_id)
     )
-    delivery_spent = (await session.execute(delivery_spent_query)).scalar_one()
+    row = (await session.execute(query)).first()
+    if row is None:
+        raise NotFoundError(detail="Group not found")
+
+    rollup, total_members = row
+    if rollup is None:
+        analytics = GroupAnalytics(total_members=total_members)
+    else:
+        total_spent = rollup.total_spent
+        completed_orders = rollup.completed_orders
+        avg_value = total_spent / Decimal(str(completed_orders)) if completed_orders > 0 else Decimal("0.00")
+
+        analytics = GroupAnalytics(
+            total_orders=rollup.total_orders,
+            completed_orders=completed_orders,
+            cancelled_orders=rollup.cancelled_orders,
+            active_orders=rollup.active_orders,
+            total_members=total_members,
+            total_spent=total_spent.quantize(Decimal("0.01")),
+            average_order_value=avg_value.quantize(Decimal("0.01")),
+            most_popular_restaurant=rollup.most_popular_restaurant,
+        )
 
-    total_spent = Decimal(str(items_spent)) + Decimal(str(delivery_spent))
+    group_analytics_cache.set(group_id, analytics, version=cache_version)
+    return analytics
 
-    avg_value = total_spent / Decimal(str(completed_orders)) if completed_orders > 0 else Decimal("0.00")
 
-    # Most popular restaurant
-    restaurant_query = (
-        select(Order.restaurant_name, func.count().label("cnt"))
-        .where(Order.group_id == group_id, Order.restaurant_name.isnot(None))
-        .group_by(Order.restaurant_name)
-        .order_by(func.count().desc())
-        .limit(1)
-    )
-    restaurant_result = (await session.execute(restaurant_query)).first()
-    most_popular = restaurant_result[0] if restaurant_result else None
-
-    return GroupAnalytics(
-        total_orders=total_orders,
-        completed_orders=completed_orders,
-        cancelled_orders=cancelled_orders,
-        active_orders=active_orders,
-        total_members=total_members,
-        total_spent=total_spent.quantize(Decimal("0.01")),
-        average_order_value=avg_value.quantize(Decimal("0.01")),
-        most_popular_restaurant=most_popular,
-    )
+@router.get("/groups/{group_id}/analytics/timeseries", response_model=SpendingTimeseries)
+async def get_group_spending_timeseries(
+    group_id: uuid.UUID,
+    bucket: TimeBucket = Query(default=TimeBucket.DAY),
+    date_from: date | None = Query(default=None, alias="from"),
+    date_to: date | None = Query(default=None, alias="to"),
+    current_user: CurrentUser = Depends(get_current_user),
+    group_member_repository: GroupMemberRepository = Depends(get_group_member_repository),
+    daily_spend_repository: GroupDailySpendRepository = Depends(get_group_daily_spend_repository),
+) -> SpendingTimeseries:
+    """Finished-order spend of a group per day, week or month. Defaults to the last year."""
+    await _ensure_can_view_analytics(current_user, group_id, group_member_repository)
+
+    if date_to is None:
+        date_to = datetime.now(UTC).date()
+    if date_from is None:
+        date_from = date_to - timedelta(days=364)
+    if date_from > date_to:
+        raise ValidationError(detail="'from' must not be after 'to'")
+
+    rows = await daily_spend_repository.get_series(group_id, bucket, date_from, date_to)
+    points = [
+        SpendingPoint(
+            period_start=period_start,
+            orders_count=orders_count,
+            items_spent=items_spent,
+            delivery_spent=delivery_spent,
+            total_spent=items_spent + delivery_spent,
+        )
+        for period_start, orders_count, items_spent, delivery_spent in rows
+    ]
+    return SpendingTimeseries(bucket=bucket, date_from=date_from, date_to=date_to, points=points)
 
 
 @router.get("/users/me/analytics", response_model=UserAnalytics)
 async def get_user_analytics(
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
+    user_spend_summary_repository: UserSpendSummaryRepository = Depends(get_user_spend_summary_repository),
     session: AsyncSession = Depends(get_db),
 ) -> UserAnalytics:
-    # Total groups
-    groups_query = select(func.count()).select_from(GroupMember).where(GroupMember.user_id == current_user.id)
-    total_groups = (await session.execute(groups_query)).scalar_one()
-
-    # Total orders participated in
-    orders_query = select(func.count(func.distinct(OrderItem.order_id))).where(OrderItem.user_id == current_user.id)
-    total_orders = (await session.execute(orders_query)).scalar_one()
-
-    # Total spent (items + delivery fee per person)
-    items_spent_query = (
-        select(func.coalesce(func.sum(OrderItem.price), 0))
-        .join(Order, OrderItem.order_id == Order.id)
-        .where(OrderItem.user_id == current_user.id, Order.status == OrderStatus.FINISHED)
-    )
-    items_spent = (await session.execute(items_spent_query)).scalar_one()
-
-    # Sum delivery_fee_per_person for each finished order the user participated in
-    user_orders_subquery = (
-        select(func.distinct(OrderItem.order_id))
-        .where(OrderItem.user_id == current_user.id)
-        .scalar_subquery()
+    cached = user_analytics_cache.get(current_user.id)
+    if cached is not None:
+        return cached
+    cache_version = user_analytics_cache.version
+
+    # Group count and balance stay live; spend figures come from the per-group summaries
+    groups_count = (
+        select(func.count()).select_from(GroupMember).where(GroupMember.user_id == current_user.id).scalar_subquery()
     )
-    delivery_spent_query = (
-        select(func.coalesce(func.sum(Order.delivery_fee_per_person), 0))
-        .where(Order.id.in_(user_orders_subquery), Order.status == OrderStatus.FINISHED)
+    balance_sum = (
+        select(func.coalesce(func.sum(Balance.amount), 0)).where(Balance.user_id == current_user.id).scalar_subquery()
     )
-    delivery_spent = (await session.execute(delivery_spent_query)).scalar_one()
+    total_groups, total_balance = (await session.execute(select(groups_count, balance_sum))).one()
 
-    total_spent = Decimal(str(items_spent)) + Decimal(str(delivery_spent))
+    summaries = await user_spend_summary_repository.get_for_user(current_user.id)
 
+    total_orders = sum(summary.orders_participated for summary in summaries)
+    total_spent = sum((summary.total_spent for summary in summaries), Decimal("0.00"))
     avg_value = total_spent / Decimal(str(total_orders)) if total_orders > 0 else Decimal("0.00")
 
-    # Favorite restaurant
-    fav_query = (
-        select(Order.restaurant_name, func.count().label("cnt"))
-        .join(OrderItem, Order.id == OrderItem.order_id)
-        .where(OrderItem.user_id == current_user.id, Order.restaurant_name.isnot(None))
-        .group_by(Order.restaurant_name)
-        .order_by(func.count().desc())
-        .limit(1)
-    )
-    fav_result = (await session.execute(fav_query)).first()
-    fav_restaurant = fav_result[0] if fav_result else None
-
-    # Total balance across groups
-    balance_query = select(func.coalesce(func.sum(Balance.amount), 0)).where(Balance.user_id == current_user.id)
-    total_balance = (await session.execute(balance_query)).scalar_one()
+    # Favorite restaurant across all groups
+    restaurant_counts: Counter[str] = Counter()
+    for summary in summaries:
+        restaurant_counts.update(summary.restaurant_counts)
+    fav_restaurant = restaurant_counts.most_common(1)[0][0] if restaurant_counts else None
 
-    return UserAnalytics(
+    analytics = UserAnalytics(
         total_groups=total_groups,
         total_orders_participated=total_orders,
         total_spent=total_spent.quantize(Decimal("0.01")),
@@ -168,3 +168,5 @@ async def get_user_analytics(
         favorite_restaurant=fav_restaurant,
         total_balance_across_groups=Decimal(str(total_balance)),
     )
+    user_analytics_cache.set(current_user.id, analytics, version=cache_version)
+    return analytics
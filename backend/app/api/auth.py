@@ -1,30 +1,36 @@
-from fastapi import APIRouter, Depends, Response
+from fastapi import APIRouter, Depends, Request, Response
 
 from app.dependencies import get_current_user, get_login_workflow, get_register_workflow
-from app.models.user import User
-from app.schemas.user import UserCreate, UserLogin, UserResponse
+from app.schemas.user import CurrentUser, UserCreate, UserLogin, UserResponse
 from app.workflows.user.login import LoginInput, LoginWorkflow
 from app.workflows.user.register import RegisterInput, RegisterWorkflow
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
 
+def _client_ip(request: Request) -> str:
+    """Client address; behind nginx this relies on uvicorn's --proxy-headers handling of X-Forwarded-For."""
+    return request.client.host if request.client else "unknown"
+
+
 @router.post("/register", response_model=UserResponse, status_code=201)
 async def register(
     data: UserCreate,
+    request: Request,
     workflow: RegisterWorkflow = Depends(get_register_workflow),
 ) -> UserResponse:
-    result = await workflow.execute(RegisterInput(data=data))
+    result = await workflow.execute(RegisterInput(data=data, client_ip=_client_ip(request)))
     return result.user
 
 
 @router.post("/login", response_model=UserResponse)
 async def login(
     data: UserLogin,
+    request: Request,
     response: Response,
     workflow: LoginWorkflow = Depends(get_login_workflow),
 ) -> UserResponse:
-    result = await workflow.execute(LoginInput(data=data))
+    result = await workflow.execute(LoginInput(data=data, client_ip=_client_ip(request)))
 
     response.set_cookie(
         key="access_token",
@@ -46,6 +52,6 @@ async def logout(response: Response) -> dict[str, str]:
 
 @router.get("/me", response_model=UserResponse)
 async def get_me(
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
 ) -> UserResponse:
     return UserResponse.model_validate(current_user)
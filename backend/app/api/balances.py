@@ -1,8 +1,14 @@
+import csv
+import io
 import uuid
+from collections.abc import AsyncIterator
+from typing import Literal
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
 
 from app.core.exceptions import ForbiddenError, NotFoundError
+from app.database import async_session_factory
 from app.dependencies import (
     get_adjust_balance_workflow,
     get_balance_history_repository,
@@ -11,24 +17,25 @@ from app.dependencies import (
     get_group_member_repository,
 )
 from app.models.enums import BalancesScope, PermissionType
-from app.models.user import User
 from app.repositories.balance import BalanceHistoryRepository, BalanceRepository
 from app.repositories.group import GroupMemberRepository
 from app.schemas.balance import BalanceAdjustment, BalanceHistoryResponse, BalanceResponse
+from app.schemas.base import CursorPage
+from app.schemas.user import CurrentUser
 from app.workflows.balance.adjust import AdjustBalanceInput, AdjustBalanceWorkflow
 
 router = APIRouter(prefix="/groups/{group_id}/balances", tags=["balances"])
 
 
 async def _check_balance_permission(
-    user: User,
+    user: CurrentUser,
     group_id: uuid.UUID,
     group_member_repository: GroupMemberRepository,
     require_editor: bool = False,
 ) -> None:
     if user.is_admin:
         return
-    membership = await group_member_repository.get_membership(user.id, group_id)
+    membership = await group_member_repository.get_permissions(user.id, group_id)
     if membership is None:
         raise ForbiddenError(detail="You are not a member of this group")
     balances_level = membership.get_permission(PermissionType.BALANCES)
@@ -41,7 +48,7 @@ async def _check_balance_permission(
 @router.get("", response_model=list[BalanceResponse])
 async def list_balances(
     group_id: uuid.UUID,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     group_member_repository: GroupMemberRepository = Depends(get_group_member_repository),
     balance_repository: BalanceRepository = Depends(get_balance_repository),
 ) -> list[BalanceResponse]:
@@ -59,12 +66,12 @@ async def list_balances(
 @router.get("/me", response_model=BalanceResponse)
 async def get_my_balance(
     group_id: uuid.UUID,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     group_member_repository: GroupMemberRepository = Depends(get_group_member_repository),
     balance_repository: BalanceRepository = Depends(get_balance_repository),
 ) -> BalanceResponse:
     if not current_user.is_admin:
-        membership = await group_member_repository.get_membership(current_user.id, group_id)
+        membership = await group_member_repository.get_permissions(current_user.id, group_id)
         if membership is None:
             raise ForbiddenError(detail="You are not a member of this group")
 
@@ -76,7 +83,7 @@ async def get_my_balance(
 async def adjust_balance(
     group_id: uuid.UUID,
     data: BalanceAdjustment,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     group_member_repository: GroupMemberRepository = Depends(get_group_member_repository),
     workflow: AdjustBalanceWorkflow = Depends(get_adjust_balance_workflow),
 ) -> BalanceResponse:
@@ -85,26 +92,81 @@ async def adjust_balance(
     return result.balance
 
 
-@router.get("/{user_id}/history", response_model=list[BalanceHistoryResponse])
+@router.get("/{user_id}/history", response_model=CursorPage[BalanceHistoryResponse])
 async def get_balance_history(
     group_id: uuid.UUID,
     user_id: uuid.UUID,
-    current_user: User = Depends(get_current_user),
+    cursor: str | None = Query(default=None),
+    limit: int = Query(default=50, ge=1, le=200),
+    estimate_total: bool = Query(default=False),
+    current_user: CurrentUser = Depends(get_current_user),
     group_member_repository: GroupMemberRepository = Depends(get_group_member_repository),
     balance_repository: BalanceRepository = Depends(get_balance_repository),
     balance_history_repository: BalanceHistoryRepository = Depends(get_balance_history_repository),
-) -> list[BalanceHistoryResponse]:
+) -> CursorPage[BalanceHistoryResponse]:
+    """Balance changes of a member, newest first.
+
+    Returns a CursorPage rather than a bare array; pass `next_cursor` back as `cursor` for the following page.
+    """
     await _check_balance_permission(current_user, group_id, group_member_repository)
 
     balance = await balance_repository.get_by_user_and_group(user_id, group_id)
     if balance is None:
         raise NotFoundError(detail="Balance not found")
 
-    history = await balance_history_repository.get_history_for_balance(balance.id)
-    return [
+    page = await balance_history_repository.get_history_for_balance(
+        balance.id, cursor=cursor, limit=limit, estimate_total=estimate_total
+    )
+    page.items = [
         BalanceHistoryResponse(
             **{k: getattr(h, k) for k in BalanceHistoryResponse.model_fields if hasattr(h, k)},
             created_by_name=h.created_by.full_name if h.created_by else None,
         )
-        for h in history
+        for h in page.items
     ]
+    return page
+
+
+_EXPORT_FIELDS = list(BalanceHistoryResponse.model_fields)
+
+
+async def _export_history(balance_id: uuid.UUID, export_format: str) -> AsyncIterator[str]:
+    # The request's session is closed once the endpoint returns, so the export reads in its own
+    async with async_session_factory() as session:
+        rows = BalanceHistoryRepository(session).stream_history_for_balance(balance_id)
+        if export_format == "csv":
+            buffer = io.StringIO()
+            writer = csv.DictWriter(buffer, fieldnames=_EXPORT_FIELDS)
+            writer.writeheader()
+            async for row in rows:
+                writer.writerow(BalanceHistoryResponse.model_validate(row._mapping).model_dump(mode="json"))
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+        else:
+            async for row in rows:
+                yield BalanceHistoryResponse.model_validate(row._mapping).model_dump_json() + "\n"
+
+
+@router.get("/{user_id}/history/export")
+async def export_balance_history(
+    group_id: uuid.UUID,
+    user_id: uuid.UUID,
+    export_format: Literal["ndjson", "csv"] = Query(default="ndjson", alias="format"),
+    current_user: CurrentUser = Depends(get_current_user),
+    group_member_repository: GroupMemberRepository = Depends(get_group_member_repository),
+    balance_repository: BalanceRepository = Depends(get_balance_repository),
+) -> StreamingResponse:
+    """Stream a member's full balance history, newest first, as NDJSON or CSV."""
+    await _check_balance_permission(current_user, group_id, group_member_repository)
+
+    balance = await balance_repository.get_by_user_and_group(user_id, group_id)
+    if balance is None:
+        raise NotFoundError(detail="Balance not found")
+
+    media_type = "text/csv" if export_format == "csv" else "application/x-ndjson"
+    return StreamingResponse(
+        _export_history(balance.id, export_format),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="balance-history-{user_id}.{export_format}"'},
+    )
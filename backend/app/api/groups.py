@@ -1,6 +1,6 @@
 import uuid
 
-from fastapi import APIRouter, Depends, UploadFile
+from fastapi import APIRouter, Depends, Query, UploadFile
 
 from app.core.exceptions import ForbiddenError, NotFoundError
 from app.core.storage import save_upload
@@ -13,9 +13,8 @@ from app.dependencies import (
     get_manage_members_workflow,
 )
 from app.models.enums import MembersScope, PermissionType
-from app.models.user import User
 from app.repositories.group import GroupMemberRepository, GroupRepository
-from app.schemas.base import MessageResponse
+from app.schemas.base import CursorPage, MessageResponse
 from app.schemas.group import (
     GroupCreate,
     GroupDetailResponse,
@@ -24,12 +23,15 @@ from app.schemas.group import (
     GroupMemberUpdate,
     GroupResponse,
     GroupUpdate,
+    InvitationBulkCreate,
+    InvitationBulkResponse,
     InvitationCreate,
     InvitationResponse,
     PermissionResponse,
 )
+from app.schemas.user import CurrentUser
 from app.workflows.group.create import CreateGroupInput, CreateGroupWorkflow
-from app.workflows.group.invite import AcceptInviteInput, InviteInput, InviteWorkflow
+from app.workflows.group.invite import AcceptInviteInput, BulkInviteInput, InviteInput, InviteWorkflow
 from app.workflows.group.manage_members import (
     AddMemberInput,
     ManageMembersWorkflow,
@@ -45,7 +47,7 @@ router = APIRouter(prefix="/groups", tags=["groups"])
 
 @router.get("", response_model=list[GroupResponse])
 async def list_groups(
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     group_repository: GroupRepository = Depends(get_group_repository),
 ) -> list[GroupResponse]:
     """List groups for the current user (admins see all)."""
@@ -60,7 +62,7 @@ async def list_groups(
 @router.post("", response_model=GroupResponse, status_code=201)
 async def create_group(
     data: GroupCreate,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     workflow: CreateGroupWorkflow = Depends(get_create_group_workflow),
 ) -> GroupResponse:
     result = await workflow.execute(CreateGroupInput(data=data, current_user=current_user))
@@ -70,7 +72,7 @@ async def create_group(
 @router.get("/{group_id}", response_model=GroupDetailResponse)
 async def get_group(
     group_id: uuid.UUID,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     group_repository: GroupRepository = Depends(get_group_repository),
     group_member_repository: GroupMemberRepository = Depends(get_group_member_repository),
 ) -> GroupDetailResponse:
@@ -80,7 +82,7 @@ async def get_group(
 
     # Check access
     if not current_user.is_admin:
-        membership = await group_member_repository.get_membership(current_user.id, group_id)
+        membership = await group_member_repository.get_permissions(current_user.id, group_id)
         if membership is None:
             raise ForbiddenError(detail="You are not a member of this group")
 
@@ -108,7 +110,7 @@ async def get_group(
 async def update_group(
     group_id: uuid.UUID,
     data: GroupUpdate,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     group_repository: GroupRepository = Depends(get_group_repository),
     group_member_repository: GroupMemberRepository = Depends(get_group_member_repository),
 ) -> GroupResponse:
@@ -118,7 +120,7 @@ async def update_group(
 
     # Only owner, members editors, or admins can update
     if not current_user.is_admin and group.owner_id != current_user.id:
-        membership = await group_member_repository.get_membership(current_user.id, group_id)
+        membership = await group_member_repository.get_permissions(current_user.id, group_id)
         if membership is None or membership.get_permission(PermissionType.MEMBERS) != MembersScope.EDITOR:
             raise ForbiddenError(detail="You do not have permission to update this group")
 
@@ -134,7 +136,7 @@ async def update_group(
 async def upload_group_logo(
     group_id: uuid.UUID,
     file: UploadFile,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     group_repository: GroupRepository = Depends(get_group_repository),
     group_member_repository: GroupMemberRepository = Depends(get_group_member_repository),
 ) -> GroupResponse:
@@ -143,7 +145,7 @@ async def upload_group_logo(
         raise NotFoundError(detail="Group not found")
 
     if not current_user.is_admin and group.owner_id != current_user.id:
-        membership = await group_member_repository.get_membership(current_user.id, group_id)
+        membership = await group_member_repository.get_permissions(current_user.id, group_id)
         if membership is None or membership.get_permission(PermissionType.MEMBERS) != MembersScope.EDITOR:
             raise ForbiddenError(detail="You do not have permission to update this group")
 
@@ -155,7 +157,7 @@ async def upload_group_logo(
 @router.delete("/{group_id}", response_model=MessageResponse)
 async def delete_group(
     group_id: uuid.UUID,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     group_repository: GroupRepository = Depends(get_group_repository),
 ) -> MessageResponse:
     group = await group_repository.get_by_id(group_id)
@@ -172,20 +174,29 @@ async def delete_group(
 # --- Members ---
 
 
-@router.get("/{group_id}/members", response_model=list[GroupMemberResponse])
+@router.get("/{group_id}/members", response_model=CursorPage[GroupMemberResponse])
 async def list_members(
     group_id: uuid.UUID,
-    current_user: User = Depends(get_current_user),
+    cursor: str | None = Query(default=None),
+    limit: int = Query(default=50, ge=1, le=200),
+    estimate_total: bool = Query(default=False),
+    current_user: CurrentUser = Depends(get_current_user),
     group_member_repository: GroupMemberRepository = Depends(get_group_member_repository),
-) -> list[GroupMemberResponse]:
+) -> CursorPage[GroupMemberResponse]:
+    """Members of a group, newest first.
+
+    Returns a CursorPage rather than a bare array; pass `next_cursor` back as `cursor` for the following page.
+    """
     # Check access
     if not current_user.is_admin:
-        membership = await group_member_repository.get_membership(current_user.id, group_id)
+        membership = await group_member_repository.get_permissions(current_user.id, group_id)
         if membership is None:
             raise ForbiddenError(detail="You are not a member of this group")
 
-    members = await group_member_repository.get_members_for_group(group_id)
-    return [
+    page = await group_member_repository.get_members_for_group(
+        group_id, cursor=cursor, limit=limit, estimate_total=estimate_total
+    )
+    page.items = [
         GroupMemberResponse(
             id=m.id,
             user_id=m.user_id,
@@ -196,15 +207,16 @@ async def list_members(
             user_full_name=m.user.full_name if m.user else None,
             user_email=m.user.email if m.user else None,
         )
-        for m in members
+        for m in page.items
     ]
+    return page
 
 
 @router.post("/{group_id}/members", response_model=GroupMemberResponse, status_code=201)
 async def add_member(
     group_id: uuid.UUID,
     data: GroupMemberCreate,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     workflow: ManageMembersWorkflow = Depends(get_manage_members_workflow),
 ) -> GroupMemberResponse:
     result = await workflow.add_member(AddMemberInput(group_id=group_id, data=data, current_user=current_user))
@@ -216,7 +228,7 @@ async def update_member(
     group_id: uuid.UUID,
     member_user_id: uuid.UUID,
     data: GroupMemberUpdate,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     workflow: ManageMembersWorkflow = Depends(get_manage_members_workflow),
 ) -> GroupMemberResponse:
     result = await workflow.update_member(
@@ -229,7 +241,7 @@ async def update_member(
 async def remove_member(
     group_id: uuid.UUID,
     member_user_id: uuid.UUID,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     workflow: ManageMembersWorkflow = Depends(get_manage_members_workflow),
 ) -> MessageResponse:
     removed = await workflow.remove_member(
@@ -247,17 +259,28 @@ async def remove_member(
 async def create_invitation(
     group_id: uuid.UUID,
     data: InvitationCreate,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     workflow: InviteWorkflow = Depends(get_invite_workflow),
 ) -> InvitationResponse:
     result = await workflow.create_invitation(InviteInput(group_id=group_id, data=data, current_user=current_user))
     return result.invitation
 
 
+@router.post("/{group_id}/invitations/bulk", response_model=InvitationBulkResponse, status_code=201)
+async def create_invitations(
+    group_id: uuid.UUID,
+    data: InvitationBulkCreate,
+    current_user: CurrentUser = Depends(get_current_user),
+    workflow: InviteWorkflow = Depends(get_invite_workflow),
+) -> InvitationBulkResponse:
+    result = await workflow.create_invitations(BulkInviteInput(group_id=group_id, data=data, current_user=current_user))
+    return result.result
+
+
 @router.post("/invitations/{token}/accept", response_model=MessageResponse)
 async def accept_invitation(
     token: str,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     workflow: InviteWorkflow = Depends(get_invite_workflow),
 ) -> MessageResponse:
     result = await workflow.accept_invitation(AcceptInviteInput(token=token, current_user=current_user))
@@ -267,7 +290,7 @@ async def accept_invitation(
 @router.post("/invitations/{token}/decline", response_model=MessageResponse)
 async def decline_invitation(
     token: str,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     workflow: InviteWorkflow = Depends(get_invite_workflow),
 ) -> MessageResponse:
     await workflow.decline_invitation(token, current_user)
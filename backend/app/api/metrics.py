@@ -0,0 +1,23 @@
+import os
+
+from fastapi import APIRouter, Depends
+
+from app.core.cache import get_cache_stats
+from app.core.security import get_password_pool_stats
+from app.dependencies import get_current_admin
+from app.schemas.metrics import CacheMetrics, MetricsResponse, PasswordPoolMetrics
+from app.schemas.user import CurrentUser
+
+router = APIRouter(prefix="/metrics", tags=["metrics"])
+
+
+@router.get("", response_model=MetricsResponse)
+async def get_metrics(
+    _current_user: CurrentUser = Depends(get_current_admin),
+) -> MetricsResponse:
+    """Admin-only: in-process counters of the worker handling this request."""
+    return MetricsResponse(
+        pid=os.getpid(),
+        caches=[CacheMetrics.model_validate(stats) for stats in get_cache_stats()],
+        password_pool=PasswordPoolMetrics.model_validate(get_password_pool_stats()),
+    )
@@ -1,8 +1,9 @@
 import uuid
+from datetime import UTC, date, datetime, time, timedelta
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
 
-from app.core.exceptions import ForbiddenError, NotFoundError
+from app.core.exceptions import ForbiddenError, NotFoundError, ValidationError
 from app.dependencies import (
     get_create_order_workflow,
     get_current_user,
@@ -13,10 +14,9 @@ from app.dependencies import (
     get_order_repository,
 )
 from app.models.enums import OrdersScope, OrderStatus, PermissionType
-from app.models.user import User
 from app.repositories.group import GroupMemberRepository
 from app.repositories.order import FavoriteDishRepository, OrderItemRepository, OrderRepository
-from app.schemas.base import MessageResponse
+from app.schemas.base import CursorPage, MessageResponse
 from app.schemas.order import (
     FavoriteDishResponse,
     OrderCreate,
@@ -26,8 +26,10 @@ from app.schemas.order import (
     OrderItemUpdate,
     OrderResponse,
     OrderSetDeliveryFee,
+    OrderSummaryResponse,
     OrderUpdateStatus,
 )
+from app.schemas.user import CurrentUser
 from app.workflows.order.create import CreateOrderInput, CreateOrderWorkflow
 from app.workflows.order.lifecycle import (
     OrderLifecycleWorkflow,
@@ -41,31 +43,61 @@ router = APIRouter(prefix="/groups/{group_id}/orders", tags=["orders"])
 # --- Order CRUD ---
 
 
-@router.get("", response_model=list[OrderResponse])
+@router.get("", response_model=CursorPage[OrderSummaryResponse])
 async def list_orders(
     group_id: uuid.UUID,
-    current_user: User = Depends(get_current_user),
+    status: OrderStatus | None = Query(default=None),
+    date_from: date | None = Query(default=None, alias="from"),
+    date_to: date | None = Query(default=None, alias="to"),
+    cursor: str | None = Query(default=None),
+    limit: int = Query(default=50, ge=1, le=200),
+    estimate_total: bool = Query(default=False),
+    current_user: CurrentUser = Depends(get_current_user),
     group_member_repository: GroupMemberRepository = Depends(get_group_member_repository),
     order_repository: OrderRepository = Depends(get_order_repository),
-) -> list[OrderResponse]:
+) -> CursorPage[OrderSummaryResponse]:
+    """Orders of a group, newest first, with item totals. `from` and `to` are inclusive UTC dates.
+
+    Returns a CursorPage rather than a bare array; pass `next_cursor` back as `cursor` for the following page.
+    """
     if not current_user.is_admin:
-        membership = await group_member_repository.get_membership(current_user.id, group_id)
+        membership = await group_member_repository.get_permissions(current_user.id, group_id)
         if membership is None:
             raise ForbiddenError(detail="You are not a member of this group")
-    orders = await order_repository.get_by_group(group_id)
-    return [OrderResponse.model_validate(o) for o in orders]
+    if date_from is not None and date_to is not None and date_from > date_to:
+        raise ValidationError(detail="'from' must not be after 'to'")
+
+    page = await order_repository.get_by_group(
+        group_id,
+        status=status,
+        created_from=datetime.combine(date_from, time.min, UTC) if date_from else None,
+        created_before=datetime.combine(date_to + timedelta(days=1), time.min, UTC) if date_to else None,
+        cursor=cursor,
+        limit=limit,
+        estimate_total=estimate_total,
+    )
+    page.items = [
+        OrderSummaryResponse(
+            **{k: getattr(order, k) for k in OrderResponse.model_fields},
+            item_count=item_count,
+            participant_count=participant_count,
+            total_amount=total_amount,
+        )
+        for order, item_count, participant_count, total_amount in page.items
+    ]
+    return page
 
 
 @router.get("/active", response_model=OrderDetailResponse | None)
 async def get_active_order(
     group_id: uuid.UUID,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     group_member_repository: GroupMemberRepository = Depends(get_group_member_repository),
     order_repository: OrderRepository = Depends(get_order_repository),
     lifecycle_workflow: OrderLifecycleWorkflow = Depends(get_order_lifecycle_workflow),
 ) -> OrderDetailResponse | None:
     if not current_user.is_admin:
-        membership = await group_member_repository.get_membership(current_user.id, group_id)
+        membership = await group_member_repository.get_permissions(current_user.id, group_id)
         if membership is None:
             raise ForbiddenError(detail="You are not a member of this group")
     order = await order_repository.get_active_for_group(group_id)
@@ -78,7 +110,7 @@ async def get_active_order(
 async def create_order(
     group_id: uuid.UUID,
     data: OrderCreate,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     workflow: CreateOrderWorkflow = Depends(get_create_order_workflow),
 ) -> OrderResponse:
     result = await workflow.execute(CreateOrderInput(group_id=group_id, data=data, current_user=current_user))
@@ -89,12 +121,12 @@ async def create_order(
 async def get_order(
     group_id: uuid.UUID,
     order_id: uuid.UUID,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     group_member_repository: GroupMemberRepository = Depends(get_group_member_repository),
     lifecycle_workflow: OrderLifecycleWorkflow = Depends(get_order_lifecycle_workflow),
 ) -> OrderDetailResponse:
     if not current_user.is_admin:
-        membership = await group_member_repository.get_membership(current_user.id, group_id)
+        membership = await group_member_repository.get_permissions(current_user.id, group_id)
         if membership is None:
             raise ForbiddenError(detail="You are not a member of this group")
     return await lifecycle_workflow.get_order_detail(order_id)
@@ -105,7 +137,7 @@ async def update_order_status(
     group_id: uuid.UUID,
     order_id: uuid.UUID,
     data: OrderUpdateStatus,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     lifecycle_workflow: OrderLifecycleWorkflow = Depends(get_order_lifecycle_workflow),
 ) -> OrderResponse:
     result = await lifecycle_workflow.transition(
@@ -119,7 +151,7 @@ async def set_delivery_fee(
     group_id: uuid.UUID,
     order_id: uuid.UUID,
     data: OrderSetDeliveryFee,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     lifecycle_workflow: OrderLifecycleWorkflow = Depends(get_order_lifecycle_workflow),
 ) -> OrderResponse:
     result = await lifecycle_workflow.set_delivery_fee(
@@ -135,12 +167,12 @@ async def set_delivery_fee(
 async def list_order_items(
     group_id: uuid.UUID,
     order_id: uuid.UUID,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     group_member_repository: GroupMemberRepository = Depends(get_group_member_repository),
     order_item_repository: OrderItemRepository = Depends(get_order_item_repository),
 ) -> list[OrderItemResponse]:
     if not current_user.is_admin:
-        membership = await group_member_repository.get_membership(current_user.id, group_id)
+        membership = await group_member_repository.get_permissions(current_user.id, group_id)
         if membership is None:
             raise ForbiddenError(detail="You are not a member of this group")
     items = await order_item_repository.get_items_for_order(order_id)
@@ -158,7 +190,7 @@ async def add_order_item(
     group_id: uuid.UUID,
     order_id: uuid.UUID,
     data: OrderItemCreate,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     group_member_repository: GroupMemberRepository = Depends(get_group_member_repository),
     order_repository: OrderRepository = Depends(get_order_repository),
     order_item_repository: OrderItemRepository = Depends(get_order_item_repository),
@@ -166,7 +198,7 @@ async def add_order_item(
     # Check permission
     membership = None
     if not current_user.is_admin:
-        membership = await group_member_repository.get_membership(current_user.id, group_id)
+        membership = await group_member_repository.get_permissions(current_user.id, group_id)
         if membership is None:
             raise ForbiddenError(detail="You are not a member of this group")
 
@@ -225,7 +257,7 @@ async def update_order_item(
     order_id: uuid.UUID,
     item_id: uuid.UUID,
     data: OrderItemUpdate,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     group_member_repository: GroupMemberRepository = Depends(get_group_member_repository),
     order_repository: OrderRepository = Depends(get_order_repository),
     order_item_repository: OrderItemRepository = Depends(get_order_item_repository),
@@ -236,7 +268,7 @@ async def update_order_item(
 
     membership = None
     if not current_user.is_admin:
-        membership = await group_member_repository.get_membership(current_user.id, group_id)
+        membership = await group_member_repository.get_permissions(current_user.id, group_id)
         if membership is None:
             raise ForbiddenError(detail="You are not a member of this group")
 
@@ -278,7 +310,7 @@ async def delete_order_item(
     group_id: uuid.UUID,
     order_id: uuid.UUID,
     item_id: uuid.UUID,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     group_member_repository: GroupMemberRepository = Depends(get_group_member_repository),
     order_repository: OrderRepository = Depends(get_order_repository),
     order_item_repository: OrderItemRepository = Depends(get_order_item_repository),
@@ -289,7 +321,7 @@ async def delete_order_item(
 
     membership = None
     if not current_user.is_admin:
-        membership = await group_member_repository.get_membership(current_user.id, group_id)
+        membership = await group_member_repository.get_permissions(current_user.id, group_id)
         if membership is None:
             raise ForbiddenError(detail="You are not a member of this group")
 
@@ -324,7 +356,7 @@ async def delete_order_item(
 async def get_favorites(
     group_id: uuid.UUID,
     restaurant_id: uuid.UUID,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     favorite_dish_repository: FavoriteDishRepository = Depends(get_favorite_dish_repository),
 ) -> list[FavoriteDishResponse]:
     favorites = await favorite_dish_repository.get_favorites_for_user(current_user.id, restaurant_id)
@@ -346,7 +378,7 @@ async def get_favorites(
 async def toggle_favorite(
     group_id: uuid.UUID,
     dish_id: uuid.UUID,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     favorite_dish_repository: FavoriteDishRepository = Depends(get_favorite_dish_repository),
 ) -> MessageResponse:
     existing = await favorite_dish_repository.get_by_user_and_dish(current_user.id, dish_id)
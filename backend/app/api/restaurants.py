@@ -1,8 +1,9 @@
 import uuid
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.exc import IntegrityError
 
-from app.core.exceptions import ForbiddenError, NotFoundError
+from app.core.exceptions import ConflictError, ForbiddenError, NotFoundError
 from app.dependencies import (
     get_current_user,
     get_dish_repository,
@@ -10,10 +11,9 @@ from app.dependencies import (
     get_restaurant_repository,
 )
 from app.models.enums import PermissionType, RestaurantsScope
-from app.models.user import User
 from app.repositories.group import GroupMemberRepository
 from app.repositories.restaurant import DishRepository, RestaurantRepository
-from app.schemas.base import MessageResponse
+from app.schemas.base import CursorPage, MessageResponse
 from app.schemas.restaurant import (
     DishCreate,
     DishResponse,
@@ -23,19 +23,20 @@ from app.schemas.restaurant import (
     RestaurantResponse,
     RestaurantUpdate,
 )
+from app.schemas.user import CurrentUser
 
 router = APIRouter(prefix="/groups/{group_id}/restaurants", tags=["restaurants"])
 
 
 async def _check_restaurant_permission(
-    user: User,
+    user: CurrentUser,
     group_id: uuid.UUID,
     group_member_repository: GroupMemberRepository,
     require_editor: bool = False,
 ) -> None:
     if user.is_admin:
         return
-    membership = await group_member_repository.get_membership(user.id, group_id)
+    membership = await group_member_repository.get_permissions(user.id, group_id)
     if membership is None:
         raise ForbiddenError(detail="You are not a member of this group")
     if require_editor and membership.get_permission(PermissionType.RESTAURANTS) != RestaurantsScope.EDITOR:
@@ -48,7 +49,7 @@ async def _check_restaurant_permission(
 @router.get("", response_model=list[RestaurantResponse])
 async def list_restaurants(
     group_id: uuid.UUID,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     group_member_repository: GroupMemberRepository = Depends(get_group_member_repository),
     restaurant_repository: RestaurantRepository = Depends(get_restaurant_repository),
 ) -> list[RestaurantResponse]:
@@ -61,7 +62,7 @@ async def list_restaurants(
 async def create_restaurant(
     group_id: uuid.UUID,
     data: RestaurantCreate,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     group_member_repository: GroupMemberRepository = Depends(get_group_member_repository),
     restaurant_repository: RestaurantRepository = Depends(get_restaurant_repository),
 ) -> RestaurantResponse:
@@ -80,7 +81,7 @@ async def create_restaurant(
 async def get_restaurant(
     group_id: uuid.UUID,
     restaurant_id: uuid.UUID,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     group_member_repository: GroupMemberRepository = Depends(get_group_member_repository),
     restaurant_repository: RestaurantRepository = Depends(get_restaurant_repository),
 ) -> RestaurantDetailResponse:
@@ -100,7 +101,7 @@ async def update_restaurant(
     group_id: uuid.UUID,
     restaurant_id: uuid.UUID,
     data: RestaurantUpdate,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     group_member_repository: GroupMemberRepository = Depends(get_group_member_repository),
     restaurant_repository: RestaurantRepository = Depends(get_restaurant_repository),
 ) -> RestaurantResponse:
@@ -119,7 +120,7 @@ async def update_restaurant(
 async def delete_restaurant(
     group_id: uuid.UUID,
     restaurant_id: uuid.UUID,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     group_member_repository: GroupMemberRepository = Depends(get_group_member_repository),
     restaurant_repository: RestaurantRepository = Depends(get_restaurant_repository),
 ) -> MessageResponse:
@@ -134,17 +135,32 @@ async def delete_restaurant(
 # --- Dish CRUD ---
 
 
-@router.get("/{restaurant_id}/dishes", response_model=list[DishResponse])
+def _raise_if_duplicate_dish(exc: IntegrityError) -> None:
+    if "uq_dish_restaurant_name" in str(exc.orig):
+        raise ConflictError(detail="A dish with this name already exists in this restaurant") from None
+
+
+@router.get("/{restaurant_id}/dishes", response_model=CursorPage[DishResponse])
 async def list_dishes(
     group_id: uuid.UUID,
     restaurant_id: uuid.UUID,
-    current_user: User = Depends(get_current_user),
+    cursor: str | None = Query(default=None),
+    limit: int = Query(default=50, ge=1, le=200),
+    estimate_total: bool = Query(default=False),
+    current_user: CurrentUser = Depends(get_current_user),
     group_member_repository: GroupMemberRepository = Depends(get_group_member_repository),
     dish_repository: DishRepository = Depends(get_dish_repository),
-) -> list[DishResponse]:
+) -> CursorPage[DishResponse]:
+    """Dishes of a restaurant, newest first.
+
+    Returns a CursorPage rather than a bare array; pass `next_cursor` back as `cursor` for the following page.
+    """
     await _check_restaurant_permission(current_user, group_id, group_member_repository)
-    dishes = await dish_repository.get_by_restaurant(restaurant_id)
-    return [DishResponse.model_validate(d) for d in dishes]
+    page = await dish_repository.get_by_restaurant(
+        restaurant_id, cursor=cursor, limit=limit, estimate_total=estimate_total
+    )
+    page.items = [DishResponse.model_validate(d) for d in page.items]
+    return page
 
 
 @router.post("/{restaurant_id}/dishes", response_model=DishResponse, status_code=201)
@@ -152,7 +168,7 @@ async def create_dish(
     group_id: uuid.UUID,
     restaurant_id: uuid.UUID,
     data: DishCreate,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     group_member_repository: GroupMemberRepository = Depends(get_group_member_repository),
     restaurant_repository: RestaurantRepository = Depends(get_restaurant_repository),
     dish_repository: DishRepository = Depends(get_dish_repository),
@@ -162,14 +178,18 @@ async def create_dish(
     restaurant = await restaurant_repository.get_by_id(restaurant_id)
     if restaurant is None or restaurant.group_id != group_id:
         raise NotFoundError(detail="Restaurant not found")
-    dish = await dish_repository.create(
-        {
-            "name": data.name,
-            "detail": data.detail,
-            "price": data.price,
-            "restaurant_id": restaurant_id,
-        }
-    )
+    try:
+        dish = await dish_repository.create(
+            {
+                "name": data.name,
+                "detail": data.detail,
+                "price": data.price,
+                "restaurant_id": restaurant_id,
+            }
+        )
+    except IntegrityError as exc:
+        _raise_if_duplicate_dish(exc)
+        raise
     return DishResponse.model_validate(dish)
 
 
@@ -179,7 +199,7 @@ async def update_dish(
     restaurant_id: uuid.UUID,
     dish_id: uuid.UUID,
     data: DishUpdate,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     group_member_repository: GroupMemberRepository = Depends(get_group_member_repository),
     dish_repository: DishRepository = Depends(get_dish_repository),
 ) -> DishResponse:
@@ -190,7 +210,11 @@ async def update_dish(
     update_data = data.model_dump(exclude_unset=True)
     if not update_data:
         return DishResponse.model_validate(dish)
-    updated = await dish_repository.update(dish_id, update_data)
+    try:
+        updated = await dish_repository.update(dish_id, update_data)
+    except IntegrityError as exc:
+        _raise_if_duplicate_dish(exc)
+        raise
     return DishResponse.model_validate(updated)
 
 
@@ -199,7 +223,7 @@ async def delete_dish(
     group_id: uuid.UUID,
     restaurant_id: uuid.UUID,
     dish_id: uuid.UUID,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     group_member_repository: GroupMemberRepository = Depends(get_group_member_repository),
     dish_repository: DishRepository = Depends(get_dish_repository),
 ) -> MessageResponse:
@@ -2,14 +2,15 @@ import uuid
 
 from fastapi import APIRouter, Depends, Query
 
+from app.core.cache import current_user_cache
 from app.core.exceptions import ConflictError, ForbiddenError, NotFoundError
-from app.core.security import hash_password
+from app.core.invalidation import publish_invalidation
+from app.core.security import hash_password_async
 from app.dependencies import get_current_admin, get_current_user, get_user_repository
 from app.models.enums import UserRole
-from app.models.user import User
 from app.repositories.user import UserRepository
 from app.schemas.base import PaginatedResponse
-from app.schemas.user import AdminUserCreate, AdminUserUpdate, UserResponse, UserUpdate
+from app.schemas.user import AdminUserCreate, AdminUserUpdate, CurrentUser, UserResponse, UserUpdate
 
 router = APIRouter(prefix="/users", tags=["users"])
 
@@ -18,7 +19,7 @@ router = APIRouter(prefix="/users", tags=["users"])
 async def list_users(
     page: int = Query(default=1, ge=1),
     page_size: int = Query(default=20, ge=1, le=100),
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     user_repository: UserRepository = Depends(get_user_repository),
 ) -> PaginatedResponse[UserResponse]:
     # Only admins can list all users
@@ -32,7 +33,7 @@ async def list_users(
 @router.post("", response_model=UserResponse, status_code=201)
 async def create_user(
     data: AdminUserCreate,
-    _current_user: User = Depends(get_current_admin),
+    _current_user: CurrentUser = Depends(get_current_admin),
     user_repository: UserRepository = Depends(get_user_repository),
 ) -> UserResponse:
     """Admin-only: create a new user."""
@@ -42,7 +43,7 @@ async def create_user(
     user = await user_repository.create(
         {
             "email": data.email,
-            "hashed_password": hash_password(data.password),
+            "hashed_password": await hash_password_async(data.password),
             "full_name": data.full_name,
             "role": data.role,
         }
@@ -53,7 +54,7 @@ async def create_user(
 @router.get("/{user_id}", response_model=UserResponse)
 async def get_user(
     user_id: uuid.UUID,
-    _current_user: User = Depends(get_current_user),
+    _current_user: CurrentUser = Depends(get_current_user),
     user_repository: UserRepository = Depends(get_user_repository),
 ) -> UserResponse:
     user = await user_repository.get_by_id(user_id)
@@ -66,7 +67,7 @@ async def get_user(
 async def update_user(
     user_id: uuid.UUID,
     data: UserUpdate,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     user_repository: UserRepository = Depends(get_user_repository),
 ) -> UserResponse:
     # Users can only update their own profile (admins can update anyone)
@@ -83,6 +84,7 @@ async def update_user(
     user = await user_repository.update(user_id, update_data)
     if user is None:
         raise NotFoundError(detail="User not found")
+    await publish_invalidation(user_repository.session, current_user_cache, [user_id])
     return UserResponse.model_validate(user)
 
 
@@ -90,7 +92,7 @@ async def update_user(
 async def admin_update_user(
     user_id: uuid.UUID,
     data: AdminUserUpdate,
-    _current_user: User = Depends(get_current_admin),
+    _current_user: CurrentUser = Depends(get_current_admin),
     user_repository: UserRepository = Depends(get_user_repository),
 ) -> UserResponse:
     """Admin-only: update any user's details including role."""
@@ -104,4 +106,5 @@ async def admin_update_user(
     user = await user_repository.update(user_id, update_data)
     if user is None:
         raise NotFoundError(detail="User not found")
+    await publish_invalidation(user_repository.session, current_user_cache, [user_id])
     return UserResponse.model_validate(user)
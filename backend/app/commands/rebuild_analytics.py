@@ -0,0 +1,56 @@
+"""Recompute analytics rollups from raw order data.
+
+Walks over all groups in id order and rebuilds their rollups in batches, committing after each batch.
+Used to repair drift; the migrations that add the tables backfill them.
+
+Usage: python -m app.commands.rebuild_analytics [--batch-size N]
+"""
+
+import argparse
+import asyncio
+import logging
+
+from app.database import async_session_factory
+from app.repositories.analytics import (
+    GroupAnalyticsRollupRepository,
+    GroupDailySpendRepository,
+    UserSpendSummaryRepository,
+)
+from app.repositories.group import GroupRepository
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 200
+
+
+async def rebuild_analytics(batch_size: int = DEFAULT_BATCH_SIZE) -> int:
+    """Rebuild all analytics tables group by group. Returns the number of groups processed."""
+    processed = 0
+    last_id = None
+    while True:
+        async with async_session_factory() as session:
+            group_ids = await GroupRepository(session).get_ids_after(last_id, batch_size)
+            if not group_ids:
+                break
+            await GroupAnalyticsRollupRepository(session).rebuild_for_groups(group_ids)
+            await UserSpendSummaryRepository(session).rebuild_for_groups(group_ids)
+            await GroupDailySpendRepository(session).rebuild_for_groups(group_ids)
+            await session.commit()
+
+        processed += len(group_ids)
+        last_id = group_ids[-1]
+        logger.info("Rebuilt analytics for %d groups", processed)
+    return processed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Recompute analytics rollups from raw order data.")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE, help="Groups per transaction")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    asyncio.run(rebuild_analytics(args.batch_size))
+
+
+if __name__ == "__main__":
+    main()
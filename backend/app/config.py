@@ -19,6 +19,17 @@ class Settings(BaseSettings):
     jwt_algorithm: str = "HS256"
     jwt_access_token_expire_minutes: int = 6000
 
+    # Threads per worker process for bcrypt hashing and verification
+    password_hash_workers: int = 2
+
+    # Login/registration admission control, shared by all workers. The per-IP limit is generous because
+    # a whole office signs in from one NAT address at lunchtime; the per-email limit guards each account.
+    auth_rate_limit_ip_burst: int = 200
+    auth_rate_limit_ip_per_minute: float = 60
+    auth_rate_limit_email_burst: int = 5
+    auth_rate_limit_email_per_minute: float = 2
+    password_check_concurrency: int = 8
+
     # File Storage
     upload_dir: str = "/var/www/lunchtogether/uploads"
     max_upload_size: int = 10485760  # 10MB
@@ -31,10 +42,34 @@ class Settings(BaseSettings):
     smtp_from_email: str = "noreply@lunchtogether.app"
     smtp_from_name: str = "LunchTogether"
     smtp_use_tls: bool = True
+    # Open connections reused across messages per process; also caps concurrent sends
+    smtp_pool_size: int = 2
+    smtp_idle_timeout_seconds: float = 60
 
     # Frontend URL (used in email links)
     frontend_url: str = "http://localhost:5173"
 
+    # Authenticated user cache (per worker process, invalidated via LISTEN/NOTIFY)
+    auth_cache_ttl_seconds: int = 30
+    auth_cache_max_entries: int = 10000
+
+    # Membership permission cache (per worker process, invalidated via LISTEN/NOTIFY)
+    permission_cache_ttl_seconds: int = 300
+    permission_cache_max_entries: int = 10000
+
+    # Analytics response cache (per worker process)
+    analytics_cache_ttl_seconds: int = 60
+    analytics_cache_max_entries: int = 1024
+
+    # Background jobs; set JOB_WORKER_IN_PROCESS=false when running `python -m app.worker` separately
+    job_worker_in_process: bool = True
+    job_poll_interval_seconds: float = 1.0
+    job_batch_size: int = 10
+    job_max_attempts: int = 5
+    job_retry_base_seconds: int = 10
+    job_retry_max_seconds: int = 3600
+    job_lock_timeout_seconds: int = 300
+
     # Sentry
     sentry_dsn: str = ""
 
@@ -0,0 +1,148 @@
+import time
+from collections import OrderedDict
+from collections.abc import Hashable, Iterable
+from dataclasses import dataclass
+from typing import Generic, TypeVar
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.database import run_after_commit
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    name: str
+    size: int
+    max_entries: int
+    hits: int
+    misses: int
+
+
+class TTLCache(Generic[K, V]):
+    """Bounded in-process cache with per-entry expiry and least-recently-used eviction.
+
+    Each worker process holds its own copy; use `app.core.invalidation.publish_invalidation` to drop
+    keys in all workers. The TTL bounds staleness if an invalidation is missed.
+
+    `version` changes on every invalidation. Readers pass the version they saw before loading a value
+    to `set`, which then skips storing it if an invalidation raced with the load.
+    """
+
+    def __init__(self, name: str, max_entries: int, ttl_seconds: float):
+        self.name = name
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self.version = 0
+        self._entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        _caches[name] = self
+
+    def get(self, key: K) -> V | None:
+        entry = self._entries.get(key)
+        if entry is None or entry[0] <= time.monotonic():
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def set(self, key: K, value: V, *, version: int | None = None, ttl_seconds: float | None = None) -> None:
+        """Store `value`; `ttl_seconds` can shorten the cache-wide TTL for this entry."""
+        if version is not None and version != self.version:
+            return
+        ttl = self.ttl_seconds if ttl_seconds is None else min(ttl_seconds, self.ttl_seconds)
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, *keys: K) -> None:
+        self.version += 1
+        for key in keys:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self.version += 1
+        self._entries.clear()
+
+    def stats(self) -> CacheStats:
+        return CacheStats(
+            name=self.name,
+            size=len(self._entries),
+            max_entries=self.max_entries,
+            hits=self.hits,
+            misses=self.misses,
+        )
+
+
+_caches: dict[str, TTLCache] = {}
+
+
+def get_cache(name: str) -> TTLCache | None:
+    return _caches.get(name)
+
+
+def get_cache_stats() -> list[CacheStats]:
+    return [cache.stats() for cache in _caches.values()]
+
+
+def clear_all_caches() -> None:
+    for cache in _caches.values():
+        cache.clear()
+
+
+def invalidate_on_commit(session: AsyncSession, cache: TTLCache[K, V], keys: Iterable[K]) -> None:
+    """Drop `keys` now and again once the session commits.
+
+    The second pass discards values that concurrent requests cached from the pre-commit state.
+    """
+    keys = tuple(keys)
+    cache.invalidate(*keys)
+    run_after_commit(session, lambda: cache.invalidate(*keys))
+
+
+# --- Authentication ---
+
+# Access token -> user id, so valid tokens are not re-verified on every request
+access_token_cache: TTLCache = TTLCache(
+    "access_tokens",
+    settings.auth_cache_max_entries,
+    settings.auth_cache_ttl_seconds,
+)
+# Keyed by user id; holds CurrentUser snapshots
+current_user_cache: TTLCache = TTLCache(
+    "current_users",
+    settings.auth_cache_max_entries,
+    settings.auth_cache_ttl_seconds,
+)
+
+# --- Permissions ---
+
+# Keyed by (user_id, group_id); only existing memberships are cached
+member_permissions_cache: TTLCache = TTLCache(
+    "member_permissions",
+    settings.permission_cache_max_entries,
+    settings.permission_cache_ttl_seconds,
+)
+
+# --- Analytics ---
+
+# Keyed by group id
+group_analytics_cache: TTLCache = TTLCache(
+    "group_analytics",
+    settings.analytics_cache_max_entries,
+    settings.analytics_cache_ttl_seconds,
+)
+# Keyed by user id
+user_analytics_cache: TTLCache = TTLCache(
+    "user_analytics",
+    settings.analytics_cache_max_entries,
+    settings.analytics_cache_ttl_seconds,
+)
@@ -1,4 +1,9 @@
+import asyncio
+import contextlib
 import logging
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from email.message import EmailMessage
 
 import aiosmtplib
@@ -8,11 +13,92 @@ from app.config import settings
 logger = logging.getLogger(__name__)
 
 
+class SMTPConnectionPool:
+    """Keeps up to `max_size` authenticated SMTP connections open and reuses them across messages.
+
+    Each connection serves one sender at a time, so `max_size` also bounds concurrent sends. Connections
+    idle for longer than `idle_timeout` seconds are closed instead of reused, as servers drop them anyway.
+    """
+
+    def __init__(self, max_size: int, idle_timeout: float):
+        self.idle_timeout = idle_timeout
+        self._slots = asyncio.Semaphore(max_size)
+        self._idle: list[tuple[float, aiosmtplib.SMTP]] = []
+
+    async def _connect(self) -> aiosmtplib.SMTP:
+        client = aiosmtplib.SMTP(
+            hostname=settings.smtp_host,
+            port=settings.smtp_port,
+            username=settings.smtp_user or None,
+            password=settings.smtp_password or None,
+            start_tls=settings.smtp_use_tls,
+        )
+        # Connects, upgrades with STARTTLS and authenticates
+        await client.connect()
+        return client
+
+    @staticmethod
+    async def _close(client: aiosmtplib.SMTP) -> None:
+        with contextlib.suppress(aiosmtplib.SMTPException, OSError):
+            await client.quit()
+        client.close()
+
+    async def _checkout(self) -> aiosmtplib.SMTP:
+        """Reuse the most recently idle connection that still answers NOOP, or open a new one.
+
+        Probing before the message is sent means a connection the server dropped while pooled is replaced
+        without any risk of delivering the message twice.
+        """
+        while self._idle:
+            idle_since, client = self._idle.pop()
+            if not client.is_connected or time.monotonic() - idle_since >= self.idle_timeout:
+                await self._close(client)
+                continue
+            try:
+                await client.noop()
+            except (aiosmtplib.SMTPException, OSError):
+                await self._close(client)
+                continue
+            return client
+        return await self._connect()
+
+    @asynccontextmanager
+    async def connection(self) -> AsyncIterator[aiosmtplib.SMTP]:
+        async with self._slots:
+            client = await self._checkout()
+            healthy = True
+            try:
+                yield client
+            except (aiosmtplib.SMTPException, OSError):
+                # The connection may be mid-transaction or already gone; never hand it out again
+                healthy = False
+                await self._close(client)
+                raise
+            finally:
+                # Other errors, cancellation included, say nothing about the connection; NOOP vets it on reuse
+                if healthy and client.is_connected:
+                    self._idle.append((time.monotonic(), client))
+
+    async def send(self, message: EmailMessage) -> None:
+        """Send one message. Not retried once the message transaction has started, as it may have been accepted."""
+        async with self.connection() as client:
+            await client.send_message(message)
+
+    async def close(self) -> None:
+        while self._idle:
+            _idle_since, client = self._idle.pop()
+            await self._close(client)
+
+
+# Shared by everything sending mail in this process (normally the job worker)
+smtp_pool = SMTPConnectionPool(settings.smtp_pool_size, settings.smtp_idle_timeout_seconds)
+
+
 class EmailService:
     """Async email service using SMTP."""
 
     async def send_email(self, to: str, subject: str, html_body: str) -> None:
-        """Send an HTML email. Silently logs errors in development mode."""
+        """Send an HTML email. Failures are logged and re-raised so that the calling job is retried."""
         message = EmailMessage()
         message["From"] = f"{settings.smtp_from_name} <{settings.smtp_from_email}>"
         message["To"] = to
@@ -20,19 +106,11 @@ class EmailService:
         message.set_content(html_body, subtype="html")
 
         try:
-            await aiosmtplib.send(
-                message,
-                hostname=settings.smtp_host,
-                port=settings.smtp_port,
-                username=settings.smtp_user or None,
-                password=settings.smtp_password or None,
-                start_tls=settings.smtp_use_tls,
-            )
+            await smtp_pool.send(message)
             logger.info("Email sent to %s: %s", to, subject)
         except Exception:
             logger.exception("Failed to send email to %s: %s", to, subject)
-            if not settings.is_development:
-                raise
+            raise
 
     async def send_invitation_email(
         self,
@@ -31,3 +31,8 @@ class ForbiddenError(AppException):
 class ConflictError(AppException):
     def __init__(self, detail: str = "Resource already exists"):
         super().__init__(status_code=status.HTTP_409_CONFLICT, detail=detail)
+
+
+class TooManyRequestsError(AppException):
+    def __init__(self, detail: str = "Too many requests"):
+        super().__init__(status_code=status.HTTP_429_TOO_MANY_REQUESTS, detail=detail)
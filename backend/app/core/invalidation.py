@@ -0,0 +1,96 @@
+"""Cross-process cache invalidation over Postgres LISTEN/NOTIFY.
+
+Every worker keeps its own in-process caches. Writers publish the keys they changed with `pg_notify`
+inside their transaction, so Postgres delivers the message to every listening worker only once the
+transaction commits; each worker then drops those keys from its local cache.
+"""
+
+import asyncio
+import contextlib
+import json
+import logging
+import uuid
+from collections.abc import Hashable, Iterable
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import TTLCache, clear_all_caches, get_cache, invalidate_on_commit
+from app.database import engine
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = "cache_invalidation"
+RECONNECT_DELAY_SECONDS = 5
+
+_listener_task: asyncio.Task | None = None
+
+
+def _encode_key(key: Hashable) -> str | list[str]:
+    if isinstance(key, tuple):
+        return [str(part) for part in key]
+    return str(key)
+
+
+def _decode_key(key: str | list[str]) -> Hashable:
+    # Cache keys are UUIDs or tuples of UUIDs
+    if isinstance(key, list):
+        return tuple(uuid.UUID(part) for part in key)
+    return uuid.UUID(key)
+
+
+async def publish_invalidation(session: AsyncSession, cache: TTLCache, keys: Iterable[Hashable]) -> None:
+    """Drop `keys` from `cache` in this process now and in every worker once the session commits."""
+    keys = list(keys)
+    if not keys:
+        return
+    invalidate_on_commit(session, cache, keys)
+    payload = json.dumps({"cache": cache.name, "keys": [_encode_key(key) for key in keys]})
+    await session.execute(select(func.pg_notify(CHANNEL, payload)))
+
+
+def _handle_notification(connection, pid, channel, payload: str) -> None:
+    try:
+        message = json.loads(payload)
+        cache = get_cache(message["cache"])
+        if cache is not None:
+            cache.invalidate(*(_decode_key(key) for key in message["keys"]))
+    except (ValueError, KeyError, TypeError):
+        logger.warning("Ignoring malformed cache invalidation message: %s", payload)
+
+
+async def _listen() -> None:
+    while True:
+        try:
+            async with engine.connect() as conn:
+                raw_connection = await conn.get_raw_connection()
+                driver_connection = raw_connection.driver_connection
+                terminated = asyncio.Event()
+                driver_connection.add_termination_listener(lambda _connection, event=terminated: event.set())
+                await driver_connection.add_listener(CHANNEL, _handle_notification)
+                logger.info("Listening for cache invalidations on %r", CHANNEL)
+                await terminated.wait()
+                logger.warning("Cache invalidation listener connection closed")
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception("Cache invalidation listener failed")
+
+        # Messages may have been missed while disconnected
+        clear_all_caches()
+        await asyncio.sleep(RECONNECT_DELAY_SECONDS)
+
+
+def start_invalidation_listener() -> None:
+    global _listener_task
+    if _listener_task is None:
+        _listener_task = asyncio.create_task(_listen())
+
+
+async def stop_invalidation_listener() -> None:
+    global _listener_task
+    if _listener_task is not None:
+        _listener_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await _listener_task
+        _listener_task = None
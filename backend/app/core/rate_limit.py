@@ -0,0 +1,49 @@
+"""Admission control for CPU-heavy authentication endpoints, shared by all workers through Postgres.
+
+Both checks run on the request session, so a sign-in never holds more than one pooled connection.
+"""
+
+import random
+from datetime import timedelta
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.core.exceptions import TooManyRequestsError
+from app.repositories.rate_limit import RateLimitBucketRepository
+
+# Advisory lock namespace for password verification slots (first key of the two-key lock)
+PASSWORD_SLOT_LOCK_CLASS = 0x6C756E63
+
+PRUNE_PROBABILITY = 0.01
+PRUNE_IDLE_AFTER = timedelta(days=1)
+
+
+async def enforce_rate_limit(session: AsyncSession, key: str, capacity: int, per_minute: float) -> None:
+    """Take one token from the bucket `key`, raising TooManyRequestsError when it is empty.
+
+    Commits the session so that tokens stay consumed when the request itself fails (e.g. a wrong password
+    rolls the request back); call it before the request writes anything else.
+    """
+    repository = RateLimitBucketRepository(session)
+    allowed = await repository.try_consume(key, capacity, per_minute / 60)
+    if random.random() < PRUNE_PROBABILITY:
+        await repository.delete_idle(PRUNE_IDLE_AFTER)
+    await session.commit()
+
+    if not allowed:
+        raise TooManyRequestsError(detail="Too many attempts, please try again later")
+
+
+async def acquire_password_check_slot(session: AsyncSession) -> None:
+    """Take one of `settings.password_check_concurrency` cluster-wide slots until the session's transaction ends.
+
+    Slots are transaction-scoped advisory locks, so they are released even if the worker dies.
+    Raises TooManyRequestsError immediately when all slots are taken.
+    """
+    slots = func.generate_series(0, settings.password_check_concurrency - 1).table_valued("slot").render_derived()
+    query = select(slots.c.slot).where(func.pg_try_advisory_xact_lock(PASSWORD_SLOT_LOCK_CLASS, slots.c.slot)).limit(1)
+    slot = (await session.execute(query)).scalar_one_or_none()
+    if slot is None:
+        raise TooManyRequestsError(detail="Too many sign-in attempts in progress, please try again shortly")
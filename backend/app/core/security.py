@@ -1,3 +1,6 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 
 import bcrypt
@@ -14,6 +17,54 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return bcrypt.checkpw(plain_password.encode(), hashed_password.encode())
 
 
+# bcrypt releases the GIL while hashing, so a small thread pool keeps the event loop responsive
+# without letting a login burst occupy every core.
+_password_executor = ThreadPoolExecutor(
+    max_workers=settings.password_hash_workers,
+    thread_name_prefix="password-hash",
+)
+_password_tasks_in_flight = 0
+_password_tasks_completed = 0
+
+
+@dataclass(frozen=True)
+class PasswordPoolStats:
+    max_workers: int
+    in_flight: int
+    queued: int
+    completed: int
+
+
+async def _run_in_password_pool(func, *args):
+    global _password_tasks_in_flight, _password_tasks_completed
+    _password_tasks_in_flight += 1
+    try:
+        return await asyncio.get_running_loop().run_in_executor(_password_executor, func, *args)
+    finally:
+        _password_tasks_in_flight -= 1
+        _password_tasks_completed += 1
+
+
+async def hash_password_async(password: str) -> str:
+    """Like `hash_password`, but runs in the password worker pool instead of blocking the event loop."""
+    return await _run_in_password_pool(hash_password, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Like `verify_password`, but runs in the password worker pool instead of blocking the event loop."""
+    return await _run_in_password_pool(verify_password, plain_password, hashed_password)
+
+
+def get_password_pool_stats() -> PasswordPoolStats:
+    max_workers = settings.password_hash_workers
+    return PasswordPoolStats(
+        max_workers=max_workers,
+        in_flight=_password_tasks_in_flight,
+        queued=max(0, _password_tasks_in_flight - max_workers),
+        completed=_password_tasks_completed,
+    )
+
+
 def create_access_token(subject: str, expires_delta: timedelta | None = None) -> str:
     if expires_delta:
         expire = datetime.now(UTC) + expires_delta
@@ -24,11 +75,9 @@ def create_access_token(subject: str, expires_delta: timedelta | None = None) ->
     return jwt.encode(to_encode, settings.jwt_secret_key, algorithm=settings.jwt_algorithm)
 
 
-def decode_access_token(token: str) -> str | None:
-    """Decode JWT token and return the subject (user id). Returns None if invalid."""
+def decode_access_token_payload(token: str) -> dict | None:
+    """Decode and verify a JWT token and return its claims. Returns None if invalid or expired."""
     try:
-        payload = jwt.decode(token, settings.jwt_secret_key, algorithms=[settings.jwt_algorithm])
-        subject: str | None = payload.get("sub")
-        return subject
+        return jwt.decode(token, settings.jwt_secret_key, algorithms=[settings.jwt_algorithm])
     except JWTError:
         return None
@@ -1,14 +1,19 @@
+import time
 import uuid
 from typing import Annotated
 
 from fastapi import Cookie, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.email import EmailService
+from app.core.cache import access_token_cache, current_user_cache
 from app.core.exceptions import AuthError, ForbiddenError
-from app.core.security import decode_access_token
+from app.core.security import decode_access_token_payload
 from app.database import get_db
-from app.models.user import User
+from app.repositories.analytics import (
+    GroupAnalyticsRollupRepository,
+    GroupDailySpendRepository,
+    UserSpendSummaryRepository,
+)
 from app.repositories.balance import BalanceHistoryRepository, BalanceRepository
 from app.repositories.group import (
     GroupInvitationRepository,
@@ -16,9 +21,11 @@ from app.repositories.group import (
     GroupMemberRepository,
     GroupRepository,
 )
+from app.repositories.job import JobRepository
 from app.repositories.order import FavoriteDishRepository, OrderItemRepository, OrderRepository
 from app.repositories.restaurant import DishRepository, RestaurantRepository
 from app.repositories.user import UserRepository
+from app.schemas.user import CurrentUser
 from app.workflows.balance.adjust import AdjustBalanceWorkflow
 from app.workflows.group.create import CreateGroupWorkflow
 from app.workflows.group.invite import InviteWorkflow
@@ -59,6 +66,10 @@ def get_dish_repository(session: AsyncSession = Depends(get_db)) -> DishReposito
     return DishRepository(session)
 
 
+def get_job_repository(session: AsyncSession = Depends(get_db)) -> JobRepository:
+    return JobRepository(session)
+
+
 def get_order_repository(session: AsyncSession = Depends(get_db)) -> OrderRepository:
     return OrderRepository(session)
 
@@ -79,11 +90,16 @@ def get_balance_history_repository(session: AsyncSession = Depends(get_db)) -> B
     return BalanceHistoryRepository(session)
 
 
-# --- Service factories ---
+def get_group_analytics_rollup_repository(session: AsyncSession = Depends(get_db)) -> GroupAnalyticsRollupRepository:
+    return GroupAnalyticsRollupRepository(session)
+
 
+def get_user_spend_summary_repository(session: AsyncSession = Depends(get_db)) -> UserSpendSummaryRepository:
+    return UserSpendSummaryRepository(session)
 
-def get_email_service() -> EmailService:
-    return EmailService()
+
+def get_group_daily_spend_repository(session: AsyncSession = Depends(get_db)) -> GroupDailySpendRepository:
+    return GroupDailySpendRepository(session)
 
 
 # --- Workflow factories ---
@@ -124,7 +140,7 @@ def get_invite_workflow(
     invitation_repository: GroupInvitationRepository = Depends(get_group_invitation_repository),
     user_repository: UserRepository = Depends(get_user_repository),
     permission_repository: GroupMemberPermissionRepository = Depends(get_group_member_permission_repository),
-    email_service: EmailService = Depends(get_email_service),
+    job_repository: JobRepository = Depends(get_job_repository),
 ) -> InviteWorkflow:
     return InviteWorkflow(
         group_repository,
@@ -132,7 +148,7 @@ def get_invite_workflow(
         invitation_repository,
         user_repository,
         permission_repository,
-        email_service,
+        job_repository,
     )
 
 
@@ -141,8 +157,15 @@ def get_create_order_workflow(
     group_member_repository: GroupMemberRepository = Depends(get_group_member_repository),
     order_repository: OrderRepository = Depends(get_order_repository),
     restaurant_repository: RestaurantRepository = Depends(get_restaurant_repository),
+    analytics_rollup_repository: GroupAnalyticsRollupRepository = Depends(get_group_analytics_rollup_repository),
 ) -> CreateOrderWorkflow:
-    return CreateOrderWorkflow(group_repository, group_member_repository, order_repository, restaurant_repository)
+    return CreateOrderWorkflow(
+        group_repository,
+        group_member_repository,
+        order_repository,
+        restaurant_repository,
+        analytics_rollup_repository,
+    )
 
 
 CreateOrderWorkflowDep = Annotated[CreateOrderWorkflow, Depends(get_create_order_workflow)]
@@ -155,6 +178,9 @@ def get_order_lifecycle_workflow(
     balance_repository: BalanceRepository = Depends(get_balance_repository),
     balance_history_repository: BalanceHistoryRepository = Depends(get_balance_history_repository),
     dish_repository: DishRepository = Depends(get_dish_repository),
+    analytics_rollup_repository: GroupAnalyticsRollupRepository = Depends(get_group_analytics_rollup_repository),
+    user_spend_summary_repository: UserSpendSummaryRepository = Depends(get_user_spend_summary_repository),
+    daily_spend_repository: GroupDailySpendRepository = Depends(get_group_daily_spend_repository),
 ) -> OrderLifecycleWorkflow:
     return OrderLifecycleWorkflow(
         order_repository,
@@ -163,6 +189,9 @@ def get_order_lifecycle_workflow(
         balance_repository,
         balance_history_repository,
         dish_repository,
+        analytics_rollup_repository,
+        user_spend_summary_repository,
+        daily_spend_repository,
     )
 
 
@@ -180,32 +209,44 @@ def get_adjust_balance_workflow(
 async def get_current_user(
     access_token: str | None = Cookie(default=None),
     user_repository: UserRepository = Depends(get_user_repository),
-) -> User:
+) -> CurrentUser:
     if access_token is None:
         raise AuthError(detail="Not authenticated")
 
-    subject = decode_access_token(access_token)
-    if subject is None:
-        raise AuthError(detail="Invalid or expired token")
-
-    try:
-        user_id = uuid.UUID(subject)
-    except ValueError:
-        raise AuthError(detail="Invalid token payload")
-
-    user = await user_repository.get_by_id(user_id)
-    if user is None:
-        raise AuthError(detail="User not found")
-
-    if not user.is_active:
+    user_id = access_token_cache.get(access_token)
+    if user_id is None:
+        payload = decode_access_token_payload(access_token)
+        if payload is None or payload.get("sub") is None:
+            raise AuthError(detail="Invalid or expired token")
+
+        try:
+            user_id = uuid.UUID(payload["sub"])
+        except ValueError:
+            raise AuthError(detail="Invalid token payload")
+
+        # Never serve a token from the cache past its own expiry
+        expires_in = payload.get("exp", 0) - time.time()
+        if expires_in > 0:
+            access_token_cache.set(access_token, user_id, ttl_seconds=expires_in)
+
+    current_user = current_user_cache.get(user_id)
+    if current_user is None:
+        cache_version = current_user_cache.version
+        user = await user_repository.get_by_id(user_id)
+        if user is None:
+            raise AuthError(detail="User not found")
+        current_user = CurrentUser.model_validate(user)
+        current_user_cache.set(user_id, current_user, version=cache_version)
+
+    if not current_user.is_active:
         raise AuthError(detail="User account is deactivated")
 
-    return user
+    return current_user
 
 
 async def get_current_admin(
-    current_user: User = Depends(get_current_user),
-) -> User:
+    current_user: CurrentUser = Depends(get_current_user),
+) -> CurrentUser:
     from app.models.enums import UserRole
 
     if current_user.role != UserRole.ADMIN:
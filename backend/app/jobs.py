@@ -0,0 +1,33 @@
+"""Background job handlers, run by `app.worker`.
+
+Enqueue with `JobRepository.enqueue(kind, payload)` in the transaction that makes the job necessary.
+Each handler runs in its own transaction, which also deletes the job, so its database writes are
+applied exactly once; side effects outside the database (e.g. email) may repeat on retry.
+"""
+
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.email import EmailService
+
+JobHandler = Callable[[AsyncSession, dict[str, Any]], Awaitable[None]]
+
+SEND_INVITATION_EMAIL = "send_invitation_email"
+
+JOB_HANDLERS: dict[str, JobHandler] = {}
+
+
+def job_handler(kind: str) -> Callable[[JobHandler], JobHandler]:
+    def register(handler: JobHandler) -> JobHandler:
+        JOB_HANDLERS[kind] = handler
+        return handler
+
+    return register
+
+
+@job_handler(SEND_INVITATION_EMAIL)
+async def send_invitation_email(_session: AsyncSession, payload: dict[str, Any]) -> None:
+    """Payload: the keyword arguments of `EmailService.send_invitation_email`."""
+    await EmailService().send_invitation_email(**payload)
@@ -1,4 +1,6 @@
 import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 
 import sentry_sdk
 from fastapi import FastAPI
@@ -6,7 +8,10 @@ from fastapi.middleware.cors import CORSMiddleware
 
 from app.api.router import api_router
 from app.config import settings
+from app.core.email import smtp_pool
+from app.core.invalidation import start_invalidation_listener, stop_invalidation_listener
 from app.core.middleware import ErrorHandlingMiddleware, RequestLoggingMiddleware
+from app.worker import start_worker, stop_worker
 
 # Configure logging
 logging.basicConfig(
@@ -23,6 +28,18 @@ if settings.sentry_dsn:
     )
 
 
+@asynccontextmanager
+async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    # Keeps this worker's in-process caches in sync with writes made by other workers
+    start_invalidation_listener()
+    if settings.job_worker_in_process:
+        start_worker()
+    yield
+    await stop_worker()
+    await smtp_pool.close()
+    await stop_invalidation_listener()
+
+
 def create_app() -> FastAPI:
     app = FastAPI(
         title="LunchTogether API",
@@ -30,6 +47,7 @@ def create_app() -> FastAPI:
         version="0.1.0",
         docs_url="/api/docs" if settings.is_development else None,
         redoc_url="/api/redoc" if settings.is_development else None,
+        lifespan=lifespan,
     )
 
     # Custom middleware (added first = innermost, runs after CORS)
@@ -1,7 +1,10 @@
+from app.models.analytics import GroupAnalyticsRollup, GroupDailySpend, UserSpendSummary
 from app.models.balance import Balance, BalanceHistory
 from app.models.base import Base
 from app.models.group import Group, GroupInvitation, GroupMember, GroupMemberPermission
+from app.models.job import Job
 from app.models.order import FavoriteDish, Order, OrderItem
+from app.models.rate_limit import RateLimitBucket
 from app.models.restaurant import Dish, Restaurant
 from app.models.user import User
 
@@ -12,11 +15,16 @@ __all__ = [
     "Dish",
     "FavoriteDish",
     "Group",
+    "GroupAnalyticsRollup",
+    "GroupDailySpend",
     "GroupInvitation",
     "GroupMember",
     "GroupMemberPermission",
+    "Job",
     "Order",
     "OrderItem",
+    "RateLimitBucket",
     "Restaurant",
     "User",
+    "UserSpendSummary",
 ]
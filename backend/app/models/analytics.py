@@ -0,0 +1,153 @@
+import uuid
+from datetime import date
+from decimal import Decimal
+
+from sqlalchemy import Date, ForeignKey, Integer, Numeric, UniqueConstraint, text
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import BaseModel
+
+
+class GroupAnalyticsRollup(BaseModel):
+    """Running order totals per group, maintained by the order workflows."""
+
+    __tablename__ = "group_analytics_rollup"
+    __table_args__ = (UniqueConstraint("group_id", name="uq_group_analytics_rollup_group"),)
+
+    group_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("groups.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    total_orders: Mapped[int] = mapped_column(
+        Integer,
+        default=0,
+        server_default="0",
+        nullable=False,
+    )
+    completed_orders: Mapped[int] = mapped_column(
+        Integer,
+        default=0,
+        server_default="0",
+        nullable=False,
+    )
+    cancelled_orders: Mapped[int] = mapped_column(
+        Integer,
+        default=0,
+        server_default="0",
+        nullable=False,
+    )
+    items_spent: Mapped[Decimal] = mapped_column(
+        Numeric(12, 2),
+        default=Decimal("0.00"),
+        server_default="0",
+        nullable=False,
+    )
+    delivery_spent: Mapped[Decimal] = mapped_column(
+        Numeric(12, 2),
+        default=Decimal("0.00"),
+        server_default="0",
+        nullable=False,
+    )
+    # Number of orders per restaurant name, e.g. {"Pizza Place": 12}
+    restaurant_counts: Mapped[dict[str, int]] = mapped_column(
+        JSONB,
+        default=dict,
+        server_default=text("'{}'::jsonb"),
+        nullable=False,
+    )
+
+    @property
+    def active_orders(self) -> int:
+        return self.total_orders - self.completed_orders - self.cancelled_orders
+
+    @property
+    def total_spent(self) -> Decimal:
+        return self.items_spent + self.delivery_spent
+
+    @property
+    def most_popular_restaurant(self) -> str | None:
+        if not self.restaurant_counts:
+            return None
+        return max(self.restaurant_counts, key=lambda name: self.restaurant_counts[name])
+
+
+class UserSpendSummary(BaseModel):
+    """Running spend totals of a user within a group, updated when orders are finished."""
+
+    __tablename__ = "user_spend_summary"
+    __table_args__ = (UniqueConstraint("user_id", "group_id", name="uq_user_spend_summary_user_group"),)
+
+    user_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    group_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("groups.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    orders_participated: Mapped[int] = mapped_column(
+        Integer,
+        default=0,
+        server_default="0",
+        nullable=False,
+    )
+    items_spent: Mapped[Decimal] = mapped_column(
+        Numeric(12, 2),
+        default=Decimal("0.00"),
+        server_default="0",
+        nullable=False,
+    )
+    delivery_spent: Mapped[Decimal] = mapped_column(
+        Numeric(12, 2),
+        default=Decimal("0.00"),
+        server_default="0",
+        nullable=False,
+    )
+    # Number of finished orders per restaurant name the user took part in
+    restaurant_counts: Mapped[dict[str, int]] = mapped_column(
+        JSONB,
+        default=dict,
+        server_default=text("'{}'::jsonb"),
+        nullable=False,
+    )
+
+    @property
+    def total_spent(self) -> Decimal:
+        return self.items_spent + self.delivery_spent
+
+
+class GroupDailySpend(BaseModel):
+    """Finished orders and spend of a group per UTC day, used for time-series charts."""
+
+    __tablename__ = "group_daily_spend"
+    __table_args__ = (UniqueConstraint("group_id", "day", name="uq_group_daily_spend_group_day"),)
+
+    group_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("groups.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    day: Mapped[date] = mapped_column(Date, nullable=False)
+    orders_count: Mapped[int] = mapped_column(
+        Integer,
+        default=0,
+        server_default="0",
+        nullable=False,
+    )
+    items_spent: Mapped[Decimal] = mapped_column(
+        Numeric(12, 2),
+        default=Decimal("0.00"),
+        server_default="0",
+        nullable=False,
+    )
+    delivery_spent: Mapped[Decimal] = mapped_column(
+        Numeric(12, 2),
+        default=Decimal("0.00"),
+        server_default="0",
+        nullable=False,
+    )
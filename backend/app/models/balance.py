@@ -1,7 +1,7 @@
 import uuid
 from decimal import Decimal
 
-from sqlalchemy import ForeignKey, Numeric, String, UniqueConstraint
+from sqlalchemy import ForeignKey, Index, Numeric, String, UniqueConstraint
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -46,6 +46,7 @@ class Balance(BaseModel):
 
 class BalanceHistory(BaseModel):
     __tablename__ = "balance_history"
+    __table_args__ = (Index("ix_balance_history_balance_id_created_at", "balance_id", "created_at", "id"),)
 
     balance_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -93,3 +93,15 @@ class InvitationStatus(str, enum.Enum):
 class BalanceChangeType(str, enum.Enum):
     MANUAL = "manual"
     ORDER = "order"
+
+
+class TimeBucket(str, enum.Enum):
+    DAY = "day"
+    WEEK = "week"
+    MONTH = "month"
+
+
+class JobStatus(str, enum.Enum):
+    PENDING = "pending"
+    RUNNING = "running"
+    FAILED = "failed"
@@ -1,6 +1,6 @@
 import uuid
 
-from sqlalchemy import ForeignKey, String, UniqueConstraint
+from sqlalchemy import ForeignKey, Index, String, UniqueConstraint
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -64,7 +64,10 @@ class Group(BaseModel):
 
 class GroupMember(BaseModel):
     __tablename__ = "group_members"
-    __table_args__ = (UniqueConstraint("user_id", "group_id", name="uq_group_member_user_group"),)
+    __table_args__ = (
+        UniqueConstraint("user_id", "group_id", name="uq_group_member_user_group"),
+        Index("ix_group_members_group_id_created_at", "group_id", "created_at", "id"),
+    )
 
     user_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -131,6 +134,9 @@ class GroupMemberPermission(BaseModel):
 
 class GroupInvitation(BaseModel):
     __tablename__ = "group_invitations"
+    __table_args__ = (
+        Index("ix_group_invitations_invitee_email_group_id_status", "invitee_email", "group_id", "status"),
+    )
 
     group_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -0,0 +1,58 @@
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import DateTime, Index, Integer, String, Text, func, text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import BaseModel
+from app.models.enums import JobStatus
+
+
+class Job(BaseModel):
+    """A unit of background work, written in the same transaction as the change that caused it.
+
+    Successful jobs are deleted; jobs that exhaust their attempts stay behind as `failed`.
+    """
+
+    __tablename__ = "jobs"
+    __table_args__ = (
+        # Only pending jobs are polled
+        Index("ix_jobs_pending_run_at", "run_at", postgresql_where=text("status = 'pending'")),
+    )
+
+    kind: Mapped[str] = mapped_column(
+        String(100),
+        nullable=False,
+    )
+    payload: Mapped[dict[str, Any]] = mapped_column(
+        JSONB,
+        nullable=False,
+    )
+    status: Mapped[str] = mapped_column(
+        String(20),
+        default=JobStatus.PENDING,
+        nullable=False,
+    )
+    attempts: Mapped[int] = mapped_column(
+        Integer,
+        default=0,
+        nullable=False,
+    )
+    max_attempts: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+    )
+    run_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+    )
+    locked_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+    )
+    last_error: Mapped[str | None] = mapped_column(
+        Text,
+        nullable=True,
+    )
@@ -1,7 +1,7 @@
 import uuid
 from decimal import Decimal
 
-from sqlalchemy import Boolean, ForeignKey, Integer, Numeric, String, UniqueConstraint
+from sqlalchemy import Boolean, ForeignKey, Index, Integer, Numeric, String, UniqueConstraint, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -11,6 +11,17 @@ from app.models.enums import OrderStatus
 
 class Order(BaseModel):
     __tablename__ = "orders"
+    __table_args__ = (
+        Index("ix_orders_group_id_status", "group_id", "status"),
+        Index("ix_orders_group_id_created_at", "group_id", "created_at", "id"),
+        # At most one unfinished order per group
+        Index(
+            "uq_orders_active_group",
+            "group_id",
+            unique=True,
+            postgresql_where=text("status NOT IN ('finished', 'cancelled')"),
+        ),
+    )
 
     group_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -66,6 +77,10 @@ class Order(BaseModel):
 
 class OrderItem(BaseModel):
     __tablename__ = "order_items"
+    __table_args__ = (
+        Index("ix_order_items_order_id", "order_id"),
+        Index("ix_order_items_user_id", "user_id"),
+    )
 
     order_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -0,0 +1,20 @@
+from sqlalchemy import Float, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import BaseModel
+
+
+class RateLimitBucket(BaseModel):
+    """Token bucket shared by all workers; `updated_at` is the time `tokens` was last refilled."""
+
+    __tablename__ = "rate_limit_buckets"
+
+    key: Mapped[str] = mapped_column(
+        String(320),
+        unique=True,
+        nullable=False,
+    )
+    tokens: Mapped[float] = mapped_column(
+        Float,
+        nullable=False,
+    )
@@ -1,7 +1,7 @@
 import uuid
 from decimal import Decimal
 
-from sqlalchemy import ForeignKey, Numeric, String
+from sqlalchemy import ForeignKey, Index, Numeric, String, UniqueConstraint
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -10,6 +10,7 @@ from app.models.base import BaseModel
 
 class Restaurant(BaseModel):
     __tablename__ = "restaurants"
+    __table_args__ = (Index("ix_restaurants_group_id", "group_id"),)
 
     name: Mapped[str] = mapped_column(
         String(255),
@@ -39,6 +40,10 @@ class Restaurant(BaseModel):
 
 class Dish(BaseModel):
     __tablename__ = "dishes"
+    __table_args__ = (
+        UniqueConstraint("restaurant_id", "name", name="uq_dish_restaurant_name"),
+        Index("ix_dishes_restaurant_id_created_at", "restaurant_id", "created_at", "id"),
+    )
 
     name: Mapped[str] = mapped_column(
         String(255),
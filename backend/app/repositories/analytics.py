@@ -0,0 +1,395 @@
+import uuid
+from datetime import date
+from decimal import Decimal
+
+from sqlalchemy import Date, DateTime, Integer, Text, cast, delete, func, literal_column, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.analytics import GroupAnalyticsRollup, GroupDailySpend, UserSpendSummary
+from app.models.enums import OrderStatus, TimeBucket
+from app.models.group import Group
+from app.models.order import Order, OrderItem
+from app.repositories.base import BaseRepository
+
+# Advisory lock namespace for per-group analytics writes (first key of the two-key lock)
+ANALYTICS_LOCK_CLASS = 0x616E6C79
+
+
+async def _lock_groups(session: AsyncSession, group_ids: list[uuid.UUID]) -> None:
+    """Take the transaction-scoped analytics lock of each group, in id order to avoid deadlocks."""
+    ordered = select(Group.id).where(Group.id.in_(group_ids)).order_by(Group.id).subquery()
+    await session.execute(
+        select(func.pg_advisory_xact_lock(ANALYTICS_LOCK_CLASS, func.hashtext(cast(ordered.c.id, Text))))
+    )
+
+
+class GroupAnalyticsRollupRepository(BaseRepository[GroupAnalyticsRollup]):
+    def __init__(self, session: AsyncSession):
+        super().__init__(GroupAnalyticsRollup, session)
+
+    async def lock_groups(self, group_ids: list[uuid.UUID]) -> None:
+        """Serialize analytics writes for the given groups until the transaction ends.
+
+        Order workflows take this before updating the rollups so that a concurrent rebuild cannot overwrite them.
+        """
+        await _lock_groups(self.session, group_ids)
+
+    async def increment(
+        self,
+        group_id: uuid.UUID,
+        *,
+        total_orders: int = 0,
+        completed_orders: int = 0,
+        cancelled_orders: int = 0,
+        items_spent: Decimal = Decimal("0.00"),
+        delivery_spent: Decimal = Decimal("0.00"),
+        restaurant_name: str | None = None,
+    ) -> None:
+        """Add the given deltas to a group's rollup, creating the row on first use.
+
+        When `restaurant_name` is set, its order count is incremented by one.
+        """
+        rollup = GroupAnalyticsRollup.__table__.c
+        stmt = insert(GroupAnalyticsRollup).values(
+            group_id=group_id,
+            total_orders=total_orders,
+            completed_orders=completed_orders,
+            cancelled_orders=cancelled_orders,
+            items_spent=items_spent,
+            delivery_spent=delivery_spent,
+            restaurant_counts={restaurant_name: 1} if restaurant_name else {},
+        )
+        set_ = {
+            "total_orders": rollup.total_orders + stmt.excluded.total_orders,
+            "completed_orders": rollup.completed_orders + stmt.excluded.completed_orders,
+            "cancelled_orders": rollup.cancelled_orders + stmt.excluded.cancelled_orders,
+            "items_spent": rollup.items_spent + stmt.excluded.items_spent,
+            "delivery_spent": rollup.delivery_spent + stmt.excluded.delivery_spent,
+            "updated_at": func.now(),
+        }
+        if restaurant_name:
+            current = func.coalesce(rollup.restaurant_counts[restaurant_name].astext.cast(Integer), 0)
+            set_["restaurant_counts"] = rollup.restaurant_counts.op("||")(
+                func.jsonb_build_object(restaurant_name, current + 1)
+            )
+        stmt = stmt.on_conflict_do_update(index_elements=[rollup.group_id], set_=set_)
+        await self.session.execute(stmt)
+
+    async def rebuild_for_groups(self, group_ids: list[uuid.UUID]) -> None:
+        """Recompute the rollups of the given groups from their orders, overwriting the stored values."""
+        await _lock_groups(self.session, group_ids)
+        finished = Order.status == OrderStatus.FINISHED
+        order_stats = (
+            select(
+                Order.group_id,
+                func.count().label("total_orders"),
+                func.count().filter(finished).label("completed_orders"),
+                func.count().filter(Order.status == OrderStatus.CANCELLED).label("cancelled_orders"),
+                func.coalesce(func.sum(Order.delivery_fee_total).filter(finished), 0).label("delivery_spent"),
+            )
+            .where(Order.group_id.in_(group_ids))
+            .group_by(Order.group_id)
+            .subquery()
+        )
+        item_stats = (
+            select(
+                Order.group_id,
+                func.sum(OrderItem.price * OrderItem.quantity).label("items_spent"),
+            )
+            .join(Order, OrderItem.order_id == Order.id)
+            .where(Order.group_id.in_(group_ids), finished)
+            .group_by(Order.group_id)
+            .subquery()
+        )
+        per_restaurant = (
+            select(Order.group_id, Order.restaurant_name, func.count().label("order_count"))
+            .where(Order.group_id.in_(group_ids), Order.restaurant_name.isnot(None))
+            .group_by(Order.group_id, Order.restaurant_name)
+            .subquery()
+        )
+        restaurant_stats = (
+            select(
+                per_restaurant.c.group_id,
+                func.jsonb_object_agg(per_restaurant.c.restaurant_name, per_restaurant.c.order_count).label(
+                    "restaurant_counts"
+                ),
+            )
+            .group_by(per_restaurant.c.group_id)
+            .subquery()
+        )
+        source = (
+            select(
+                func.gen_random_uuid(),
+                Group.id,
+                func.coalesce(order_stats.c.total_orders, 0),
+                func.coalesce(order_stats.c.completed_orders, 0),
+                func.coalesce(order_stats.c.cancelled_orders, 0),
+                func.coalesce(item_stats.c.items_spent, 0),
+                func.coalesce(order_stats.c.delivery_spent, 0),
+                func.coalesce(restaurant_stats.c.restaurant_counts, literal_column("'{}'::jsonb")),
+            )
+            .select_from(Group)
+            .outerjoin(order_stats, order_stats.c.group_id == Group.id)
+            .outerjoin(item_stats, item_stats.c.group_id == Group.id)
+            .outerjoin(restaurant_stats, restaurant_stats.c.group_id == Group.id)
+            .where(Group.id.in_(group_ids))
+        )
+        rollup = GroupAnalyticsRollup.__table__.c
+        columns = [
+            "id",
+            "group_id",
+            "total_orders",
+            "completed_orders",
+            "cancelled_orders",
+            "items_spent",
+            "delivery_spent",
+            "restaurant_counts",
+        ]
+        stmt = insert(GroupAnalyticsRollup).from_select(columns, source)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[rollup.group_id],
+            set_={
+                **{name: stmt.excluded[name] for name in columns[2:]},
+                "updated_at": func.now(),
+            },
+        )
+        await self.session.execute(stmt)
+
+
+class UserSpendSummaryRepository(BaseRepository[UserSpendSummary]):
+    def __init__(self, session: AsyncSession):
+        super().__init__(UserSpendSummary, session)
+
+    async def get_for_user(self, user_id: uuid.UUID) -> list[UserSpendSummary]:
+        query = select(UserSpendSummary).where(UserSpendSummary.user_id == user_id)
+        result = await self.session.execute(query)
+        return list(result.scalars().all())
+
+    async def add_finished_order(
+        self,
+        group_id: uuid.UUID,
+        items_spent_by_user: dict[uuid.UUID, Decimal],
+        *,
+        delivery_spent: Decimal,
+        restaurant_name: str | None = None,
+    ) -> None:
+        """Count one more finished order and its spend for each participant, creating rows on first use.
+
+        All participants are written with a single multi-row upsert.
+        """
+        if not items_spent_by_user:
+            return
+        summary = UserSpendSummary.__table__.c
+        stmt = insert(UserSpendSummary).values(
+            [
+                {
+                    "user_id": user_id,
+                    "group_id": group_id,
+                    "orders_participated": 1,
+                    "items_spent": items_spent,
+                    "delivery_spent": delivery_spent,
+                    "restaurant_counts": {restaurant_name: 1} if restaurant_name else {},
+                }
+                for user_id, items_spent in items_spent_by_user.items()
+            ]
+        )
+        set_ = {
+            "orders_participated": summary.orders_participated + 1,
+            "items_spent": summary.items_spent + stmt.excluded.items_spent,
+            "delivery_spent": summary.delivery_spent + stmt.excluded.delivery_spent,
+            "updated_at": func.now(),
+        }
+        if restaurant_name:
+            current = func.coalesce(summary.restaurant_counts[restaurant_name].astext.cast(Integer), 0)
+            set_["restaurant_counts"] = summary.restaurant_counts.op("||")(
+                func.jsonb_build_object(restaurant_name, current + 1)
+            )
+        stmt = stmt.on_conflict_do_update(index_elements=[summary.user_id, summary.group_id], set_=set_)
+        await self.session.execute(stmt)
+
+    async def rebuild_for_groups(self, group_ids: list[uuid.UUID]) -> None:
+        """Recompute the summaries of all users in the given groups from their finished orders."""
+        await _lock_groups(self.session, group_ids)
+        # One row per (user, finished order) with the user's item total for that order
+        per_order = (
+            select(
+                OrderItem.user_id,
+                Order.group_id,
+                Order.restaurant_name,
+                func.coalesce(Order.delivery_fee_per_person, 0).label("delivery_spent"),
+                func.sum(OrderItem.price * OrderItem.quantity).label("items_spent"),
+            )
+            .join(Order, OrderItem.order_id == Order.id)
+            .where(Order.group_id.in_(group_ids), Order.status == OrderStatus.FINISHED)
+            .group_by(OrderItem.user_id, Order.id)
+            .subquery()
+        )
+        totals = (
+            select(
+                per_order.c.user_id,
+                per_order.c.group_id,
+                func.count().label("orders_participated"),
+                func.sum(per_order.c.items_spent).label("items_spent"),
+                func.sum(per_order.c.delivery_spent).label("delivery_spent"),
+            )
+            .group_by(per_order.c.user_id, per_order.c.group_id)
+            .subquery()
+        )
+        per_restaurant = (
+            select(
+                per_order.c.user_id,
+                per_order.c.group_id,
+                per_order.c.restaurant_name,
+                func.count().label("order_count"),
+            )
+            .where(per_order.c.restaurant_name.isnot(None))
+            .group_by(per_order.c.user_id, per_order.c.group_id, per_order.c.restaurant_name)
+            .subquery()
+        )
+        restaurant_stats = (
+            select(
+                per_restaurant.c.user_id,
+                per_restaurant.c.group_id,
+                func.jsonb_object_agg(per_restaurant.c.restaurant_name, per_restaurant.c.order_count).label(
+                    "restaurant_counts"
+                ),
+            )
+            .group_by(per_restaurant.c.user_id, per_restaurant.c.group_id)
+            .subquery()
+        )
+        source = select(
+            func.gen_random_uuid(),
+            totals.c.user_id,
+            totals.c.group_id,
+            totals.c.orders_participated,
+            totals.c.items_spent,
+            totals.c.delivery_spent,
+            func.coalesce(restaurant_stats.c.restaurant_counts, literal_column("'{}'::jsonb")),
+        ).outerjoin(
+            restaurant_stats,
+            (restaurant_stats.c.user_id == totals.c.user_id) & (restaurant_stats.c.group_id == totals.c.group_id),
+        )
+
+        await self.session.execute(delete(UserSpendSummary).where(UserSpendSummary.group_id.in_(group_ids)))
+        await self.session.execute(
+            insert(UserSpendSummary).from_select(
+                [
+                    "id",
+                    "user_id",
+                    "group_id",
+                    "orders_participated",
+                    "items_spent",
+                    "delivery_spent",
+                    "restaurant_counts",
+                ],
+                source,
+            )
+        )
+
+
+class GroupDailySpendRepository(BaseRepository[GroupDailySpend]):
+    def __init__(self, session: AsyncSession):
+        super().__init__(GroupDailySpend, session)
+
+    async def add_finished_order(
+        self,
+        group_id: uuid.UUID,
+        day: date,
+        *,
+        items_spent: Decimal,
+        delivery_spent: Decimal,
+    ) -> None:
+        """Count one more finished order and its spend on the given day, creating the row on first use."""
+        daily = GroupDailySpend.__table__.c
+        stmt = insert(GroupDailySpend).values(
+            group_id=group_id,
+            day=day,
+            orders_count=1,
+            items_spent=items_spent,
+            delivery_spent=delivery_spent,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[daily.group_id, daily.day],
+            set_={
+                "orders_count": daily.orders_count + 1,
+                "items_spent": daily.items_spent + stmt.excluded.items_spent,
+                "delivery_spent": daily.delivery_spent + stmt.excluded.delivery_spent,
+                "updated_at": func.now(),
+            },
+        )
+        await self.session.execute(stmt)
+
+    async def get_series(
+        self,
+        group_id: uuid.UUID,
+        bucket: TimeBucket,
+        start: date,
+        end: date,
+    ) -> list[tuple[date, int, Decimal, Decimal]]:
+        """Merge daily rows between `start` and `end` (inclusive) into buckets.
+
+        Returns `(period_start, orders_count, items_spent, delivery_spent)` per non-empty bucket, oldest first.
+        Weeks start on Monday.
+        """
+        days = (
+            select(
+                cast(func.date_trunc(bucket.value, cast(GroupDailySpend.day, DateTime)), Date).label("period_start"),
+                GroupDailySpend.orders_count,
+                GroupDailySpend.items_spent,
+                GroupDailySpend.delivery_spent,
+            )
+            .where(
+                GroupDailySpend.group_id == group_id,
+                GroupDailySpend.day >= start,
+                GroupDailySpend.day <= end,
+            )
+            .subquery()
+        )
+        query = (
+            select(
+                days.c.period_start,
+                func.sum(days.c.orders_count),
+                func.sum(days.c.items_spent),
+                func.sum(days.c.delivery_spent),
+            )
+            .group_by(days.c.period_start)
+            .order_by(days.c.period_start)
+        )
+        result = await self.session.execute(query)
+        return [tuple(row) for row in result.all()]
+
+    async def rebuild_for_groups(self, group_ids: list[uuid.UUID]) -> None:
+        """Recompute the daily rows of the given groups from their finished orders.
+
+        Orders are bucketed by the UTC day of their last update, which for finished orders is the finish time.
+        """
+        await _lock_groups(self.session, group_ids)
+        per_order = (
+            select(
+                Order.group_id,
+                cast(func.timezone("UTC", Order.updated_at), Date).label("day"),
+                func.coalesce(Order.delivery_fee_total, 0).label("delivery_spent"),
+                func.coalesce(func.sum(OrderItem.price * OrderItem.quantity), 0).label("items_spent"),
+            )
+            .outerjoin(OrderItem, OrderItem.order_id == Order.id)
+            .where(Order.group_id.in_(group_ids), Order.status == OrderStatus.FINISHED)
+            .group_by(Order.id)
+            .subquery()
+        )
+        source = select(
+            func.gen_random_uuid(),
+            per_order.c.group_id,
+            per_order.c.day,
+            func.count(),
+            func.sum(per_order.c.items_spent),
+            func.sum(per_order.c.delivery_spent),
+        ).group_by(per_order.c.group_id, per_order.c.day)
+
+        await self.session.execute(delete(GroupDailySpend).where(GroupDailySpend.group_id.in_(group_ids)))
+        await self.session.execute(
+            insert(GroupDailySpend).from_select(
+                ["id", "group_id", "day", "orders_count", "items_spent", "delivery_spent"],
+                source,
+            )
+        )
@@ -1,11 +1,16 @@
 import uuid
+from collections.abc import AsyncIterator
+from decimal import Decimal
 
-from sqlalchemy import select
+from sqlalchemy import Row, func, select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 
 from app.models.balance import Balance, BalanceHistory
+from app.models.user import User
 from app.repositories.base import BaseRepository
+from app.schemas.base import CursorPage
 
 
 class BalanceRepository(BaseRepository[Balance]):
@@ -31,6 +36,36 @@ class BalanceRepository(BaseRepository[Balance]):
             )
         return balance
 
+    async def apply_delta(self, user_id: uuid.UUID, group_id: uuid.UUID, delta: Decimal) -> Balance:
+        """Add `delta` to a balance, creating it if needed, in one atomic upsert.
+
+        The arithmetic happens in SQL, so concurrent changes to the same balance are never lost;
+        the returned balance's `amount` is the value right after this change.
+        """
+        balances = await self.apply_deltas(group_id, {user_id: delta})
+        return balances[user_id]
+
+    async def apply_deltas(self, group_id: uuid.UUID, deltas: dict[uuid.UUID, Decimal]) -> dict[uuid.UUID, Balance]:
+        """Apply per-user deltas to balances in a group with a single multi-row upsert. Returns balances by user id.
+
+        Rows are written in user id order, so concurrent calls lock shared balances alike and cannot deadlock.
+        """
+        if not deltas:
+            return {}
+        stmt = insert(Balance).values(
+            [{"user_id": user_id, "group_id": group_id, "amount": deltas[user_id]} for user_id in sorted(deltas)]
+        )
+        stmt = (
+            stmt.on_conflict_do_update(
+                constraint="uq_balance_user_group",
+                set_={"amount": Balance.amount + stmt.excluded.amount, "updated_at": func.now()},
+            )
+            .returning(Balance)
+            .execution_options(populate_existing=True)
+        )
+        result = await self.session.execute(stmt)
+        return {balance.user_id: balance for balance in result.scalars().all()}
+
     async def get_balances_for_group(self, group_id: uuid.UUID) -> list[Balance]:
         query = select(Balance).where(Balance.group_id == group_id).options(joinedload(Balance.user))
         result = await self.session.execute(query)
@@ -46,12 +81,33 @@ class BalanceHistoryRepository(BaseRepository[BalanceHistory]):
     def __init__(self, session: AsyncSession):
         super().__init__(BalanceHistory, session)
 
-    async def get_history_for_balance(self, balance_id: uuid.UUID) -> list[BalanceHistory]:
+    async def get_history_for_balance(
+        self,
+        balance_id: uuid.UUID,
+        *,
+        cursor: str | None = None,
+        limit: int = 50,
+        estimate_total: bool = False,
+    ) -> CursorPage:
         query = (
             select(BalanceHistory)
             .where(BalanceHistory.balance_id == balance_id)
-            .order_by(BalanceHistory.created_at.desc())
             .options(joinedload(BalanceHistory.created_by))
         )
-        result = await self.session.execute(query)
-        return list(result.unique().scalars().all())
+        return await self.paginate(query, cursor=cursor, limit=limit, estimate_total=estimate_total)
+
+    async def stream_history_for_balance(self, balance_id: uuid.UUID, batch_size: int = 500) -> AsyncIterator[Row]:
+        """Yield a balance's full history newest first, fetching `batch_size` rows at a time from a server-side cursor.
+
+        Rows carry the history columns plus `created_by_name`; no ORM objects are built, so memory stays flat.
+        """
+        query = (
+            select(*BalanceHistory.__table__.c, User.full_name.label("created_by_name"))
+            .outerjoin(User, User.id == BalanceHistory.created_by_id)
+            .where(BalanceHistory.balance_id == balance_id)
+            .order_by(BalanceHistory.created_at.desc(), BalanceHistory.id.desc())
+            .execution_options(yield_per=batch_size)
+        )
+        result = await self.session.stream(query)
+        async for row in result:
+            yield row
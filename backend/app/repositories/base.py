@@ -1,15 +1,34 @@
+import base64
+import binascii
+import json
 import uuid
+from datetime import datetime
 from typing import Any, Generic, TypeVar
 
-from sqlalchemy import Select, func, select
+from sqlalchemy import ColumnElement, Select, delete, func, insert, select, tuple_, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.exceptions import ValidationError
 from app.models.base import BaseModel
-from app.schemas.base import PaginatedResponse
+from app.schemas.base import CursorPage, PaginatedResponse
 
 ModelType = TypeVar("ModelType", bound=BaseModel)
 
 
+def encode_cursor(instance: BaseModel) -> str:
+    """Opaque page token pointing just past `instance` in (created_at, id) order."""
+    payload = json.dumps([instance.created_at.isoformat(), str(instance.id)])
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, uuid.UUID]:
+    try:
+        created_at, entity_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return datetime.fromisoformat(created_at), uuid.UUID(entity_id)
+    except (binascii.Error, UnicodeError, ValueError, TypeError):
+        raise ValidationError(detail="Invalid pagination cursor") from None
+
+
 class BaseRepository(Generic[ModelType]):
     def __init__(self, model: type[ModelType], session: AsyncSession):
         self.model = model
@@ -61,25 +80,103 @@ class BaseRepository(Generic[ModelType]):
             total_pages=total_pages,
         )
 
-    async def create(self, data: dict[str, Any]) -> ModelType:
-        instance = self.model(**data)
-        self.session.add(instance)
-        await self.session.flush()
-        await self.session.refresh(instance)
+    async def paginate(
+        self,
+        query: Select,
+        *,
+        cursor: str | None = None,
+        limit: int = 50,
+        estimate_total: bool = False,
+        scalars: bool = True,
+    ) -> CursorPage:
+        """Keyset-paginate `query` newest first on (created_at, id).
+
+        Each page is a single index range scan, so deep pages cost the same as the first one.
+        With `estimate_total`, the planner's row estimate for `query` is returned instead of an exact count.
+        Pass `scalars=False` for queries selecting extra columns; items are then rows whose first element
+        is the model instance.
+        """
+        estimated_total = await self._estimate_count(query) if estimate_total else None
+
+        if cursor is not None:
+            created_at, entity_id = decode_cursor(cursor)
+            query = query.where(tuple_(self.model.created_at, self.model.id) < tuple_(created_at, entity_id))
+        query = query.order_by(None).order_by(self.model.created_at.desc(), self.model.id.desc()).limit(limit + 1)
+        result = await self.session.execute(query)
+        items = list(result.unique().scalars().all()) if scalars else list(result.all())
+
+        next_cursor = None
+        if len(items) > limit:
+            items = items[:limit]
+            next_cursor = encode_cursor(items[-1] if scalars else items[-1][0])
+        return CursorPage(items=items, next_cursor=next_cursor, estimated_total=estimated_total)
+
+    async def _estimate_count(self, query: Select) -> int:
+        """The planner's row estimate for `query`, from EXPLAIN run with the query's own bind parameters."""
+        connection = await self.session.connection()
+        compiled = query.compile(dialect=connection.dialect, compile_kwargs={"render_postcompile": True})
+        params = compiled.construct_params()
+        parameters = tuple(params[name] for name in compiled.positiontup or ())
+        result = await connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled}", parameters)
+        plan = result.scalar_one()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
+
+    async def create(self, data: dict[str, Any], *, refresh: bool = False) -> ModelType:
+        """Insert one row with INSERT ... RETURNING, so server defaults come back without a second query.
+
+        Relationships are not loaded; pass `refresh=True` to also load eagerly configured ones.
+        """
+        stmt = insert(self.model).values(**data).returning(self.model)
+        result = await self.session.execute(stmt)
+        instance = result.scalar_one()
+        if refresh:
+            await self.session.refresh(instance)
         return instance
 
     async def update(self, entity_id: uuid.UUID, data: dict[str, Any]) -> ModelType | None:
-        instance = await self.get_by_id(entity_id)
-        if instance is None:
-            return None
-
-        for key, value in data.items():
-            if value is not None:
-                setattr(instance, key, value)
+        """Update one row with UPDATE ... RETURNING. `None` values are skipped; returns None if the row is missing.
+
+        An instance of the row already loaded in the session is refreshed with the returned values.
+        """
+        values = {key: value for key, value in data.items() if value is not None}
+        if not values:
+            return await self.get_by_id(entity_id)
+
+        stmt = (
+            update(self.model)
+            .where(self.model.id == entity_id)
+            .values(**values)
+            .returning(self.model)
+            .execution_options(populate_existing=True, synchronize_session=False)
+        )
+        result = await self.session.execute(stmt)
+        return result.scalar_one_or_none()
 
-        await self.session.flush()
-        await self.session.refresh(instance)
-        return instance
+    async def create_many(self, rows: list[dict[str, Any]]) -> list[ModelType]:
+        """Insert many rows in one multi-row INSERT ... RETURNING; instances come back in input order."""
+        if not rows:
+            return []
+        stmt = insert(self.model).returning(self.model, sort_by_parameter_order=True)
+        result = await self.session.execute(stmt, rows)
+        return list(result.scalars().all())
+
+    async def update_many(self, rows: list[dict[str, Any]]) -> None:
+        """Update many rows by primary key in one executemany; every dict must contain "id".
+
+        Unlike `update`, values are written as given (including None) and instances already
+        loaded in the session are not refreshed.
+        """
+        if not rows:
+            return
+        await self.session.execute(update(self.model), rows)
+
+    async def delete_where(self, *criteria: ColumnElement[bool]) -> int:
+        """Delete all rows matching `criteria` in one statement. Returns the number of rows deleted."""
+        stmt = delete(self.model).where(*criteria)
+        result = await self.session.execute(stmt)
+        return result.rowcount
 
     async def delete(self, entity_id: uuid.UUID) -> bool:
         instance = await self.get_by_id(entity_id)
@@ -1,11 +1,42 @@
 import uuid
+from dataclasses import dataclass
+from typing import Any
 
 from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import joinedload, selectinload
 
+from app.core.cache import member_permissions_cache
+from app.core.invalidation import publish_invalidation
+from app.models.enums import PermissionType
 from app.models.group import Group, GroupInvitation, GroupMember, GroupMemberPermission
 from app.repositories.base import BaseRepository
+from app.schemas.base import CursorPage
+
+
+@dataclass(frozen=True)
+class MemberPermissions:
+    """Read-only snapshot of a membership's permission levels, safe to share across requests."""
+
+    member_id: uuid.UUID
+    user_id: uuid.UUID
+    group_id: uuid.UUID
+    levels: dict[str, str]
+
+    @classmethod
+    def from_member(cls, member: GroupMember) -> "MemberPermissions":
+        return cls(
+            member_id=member.id,
+            user_id=member.user_id,
+            group_id=member.group_id,
+            levels={perm.permission_type: perm.level for perm in member.permissions},
+        )
+
+    def get_permission(self, permission_type: str | PermissionType) -> str | None:
+        """Get the level for a given permission type, or None if not set."""
+        pt = permission_type.value if isinstance(permission_type, PermissionType) else permission_type
+        return self.levels.get(pt)
 
 
 class GroupRepository(BaseRepository[Group]):
@@ -22,6 +53,15 @@ class GroupRepository(BaseRepository[Group]):
         result = await self.session.execute(query)
         return result.scalar_one()
 
+    async def delete(self, entity_id: uuid.UUID) -> bool:
+        """Delete a group; the cached permissions of all its members are invalidated in every worker."""
+        member_ids = await self.session.execute(select(GroupMember.user_id).where(GroupMember.group_id == entity_id))
+        keys = [(user_id, entity_id) for user_id in member_ids.scalars()]
+        if not await super().delete(entity_id):
+            return False
+        await publish_invalidation(self.session, member_permissions_cache, keys)
+        return True
+
     async def get_groups_for_user(self, user_id: uuid.UUID) -> list[Group]:
         """Get all groups where user is a member."""
         query = select(Group).join(GroupMember, Group.id == GroupMember.group_id).where(GroupMember.user_id == user_id)
@@ -40,12 +80,37 @@ class GroupRepository(BaseRepository[Group]):
         result = await self.session.execute(query)
         return result.unique().scalar_one_or_none()
 
+    async def get_ids_after(self, after_id: uuid.UUID | None, limit: int) -> list[uuid.UUID]:
+        """Get the next batch of group ids in id order, for batch jobs walking over all groups."""
+        query = select(Group.id).order_by(Group.id).limit(limit)
+        if after_id is not None:
+            query = query.where(Group.id > after_id)
+        result = await self.session.execute(query)
+        return list(result.scalars().all())
+
 
 class GroupMemberRepository(BaseRepository[GroupMember]):
     def __init__(self, session: AsyncSession):
         super().__init__(GroupMember, session)
+        # Memberships already loaded by this repository. The repository is created once per request and
+        # shared by the route and its workflow, so each (user, group) pair is queried at most once per request.
+        self._memberships: dict[tuple[uuid.UUID, uuid.UUID], GroupMember | None] = {}
+
+    async def get_membership(
+        self,
+        user_id: uuid.UUID,
+        group_id: uuid.UUID,
+        *,
+        refresh: bool = False,
+    ) -> GroupMember | None:
+        """Get a membership with its permissions.
+
+        Pass `refresh=True` after changing the member's permissions to reload them from the database.
+        """
+        key = (user_id, group_id)
+        if not refresh and key in self._memberships:
+            return self._memberships[key]
 
-    async def get_membership(self, user_id: uuid.UUID, group_id: uuid.UUID) -> GroupMember | None:
         query = (
             select(GroupMember)
             .where(
@@ -54,17 +119,62 @@ class GroupMemberRepository(BaseRepository[GroupMember]):
             )
             .options(joinedload(GroupMember.permissions))
         )
+        if refresh:
+            query = query.execution_options(populate_existing=True)
         result = await self.session.execute(query)
-        return result.unique().scalar_one_or_none()
+        membership = result.unique().scalar_one_or_none()
+        self._memberships[key] = membership
+        return membership
+
+    async def get_permissions(self, user_id: uuid.UUID, group_id: uuid.UUID) -> MemberPermissions | None:
+        """Get a membership's permission levels, served from the process-wide cache when possible.
 
-    async def get_members_for_group(self, group_id: uuid.UUID) -> list[GroupMember]:
+        Use this for permission checks; use `get_membership` when the ORM object itself is needed.
+        """
+        key = (user_id, group_id)
+        cached = member_permissions_cache.get(key)
+        if cached is not None:
+            return cached
+
+        cache_version = member_permissions_cache.version
+        membership = await self.get_membership(user_id, group_id)
+        if membership is None:
+            return None
+        permissions = MemberPermissions.from_member(membership)
+        member_permissions_cache.set(key, permissions, version=cache_version)
+        return permissions
+
+    async def create(self, data: dict[str, Any], *, refresh: bool = False) -> GroupMember:
+        member = await super().create(data, refresh=refresh)
+        self._memberships.pop((member.user_id, member.group_id), None)
+        return member
+
+    async def get_members_for_group(
+        self,
+        group_id: uuid.UUID,
+        *,
+        cursor: str | None = None,
+        limit: int = 50,
+        estimate_total: bool = False,
+    ) -> CursorPage:
+        # Permissions are loaded in a second query so the join does not multiply rows under LIMIT
         query = (
             select(GroupMember)
             .where(GroupMember.group_id == group_id)
-            .options(joinedload(GroupMember.user), joinedload(GroupMember.permissions))
+            .options(joinedload(GroupMember.user), selectinload(GroupMember.permissions))
+        )
+        return await self.paginate(query, cursor=cursor, limit=limit, estimate_total=estimate_total)
+
+    async def get_member_user_ids(self, user_ids: list[uuid.UUID], group_id: uuid.UUID) -> set[uuid.UUID]:
+        """Return which of `user_ids` are members of the group."""
+        if not user_ids:
+            return set()
+        query = select(GroupMember.user_id).where(
+            GroupMember.user_id.in_(user_ids),
+            GroupMember.group_id == group_id,
         )
         result = await self.session.execute(query)
-        return list(result.unique().scalars().all())
+        return set(result.scalars().all())
 
     async def count_members(self, group_id: uuid.UUID) -> int:
         query = select(func.count()).select_from(GroupMember).where(GroupMember.group_id == group_id)
@@ -83,6 +193,8 @@ class GroupMemberRepository(BaseRepository[GroupMember]):
             return False
         await self.session.delete(member)
         await self.session.flush()
+        self._memberships[(user_id, group_id)] = None
+        await publish_invalidation(self.session, member_permissions_cache, [(user_id, group_id)])
         return True
 
 
@@ -95,32 +207,29 @@ class GroupMemberPermissionRepository(BaseRepository[GroupMemberPermission]):
         group_member_id: uuid.UUID,
         permissions: dict[str, str],
     ) -> list[GroupMemberPermission]:
-        """Set permissions for a group member. Creates or updates each permission type."""
-        result = []
-        for perm_type, level in permissions.items():
-            existing = await self.session.execute(
-                select(GroupMemberPermission).where(
-                    GroupMemberPermission.group_member_id == group_member_id,
-                    GroupMemberPermission.permission_type == perm_type,
-                )
+        """Set permissions for a group member in one upsert. Creates or updates each permission type."""
+        member = await self.session.get(GroupMember, group_member_id)
+        if member is not None:
+            await publish_invalidation(self.session, member_permissions_cache, [(member.user_id, member.group_id)])
+
+        if not permissions:
+            return []
+        stmt = insert(GroupMemberPermission).values(
+            [
+                {"group_member_id": group_member_id, "permission_type": perm_type, "level": level}
+                for perm_type, level in permissions.items()
+            ]
+        )
+        stmt = (
+            stmt.on_conflict_do_update(
+                constraint="uq_group_member_permission_type",
+                set_={"level": stmt.excluded.level, "updated_at": func.now()},
             )
-            existing_perm = existing.scalar_one_or_none()
-            if existing_perm:
-                existing_perm.level = level
-                await self.session.flush()
-                await self.session.refresh(existing_perm)
-                result.append(existing_perm)
-            else:
-                perm = GroupMemberPermission(
-                    group_member_id=group_member_id,
-                    permission_type=perm_type,
-                    level=level,
-                )
-                self.session.add(perm)
-                await self.session.flush()
-                await self.session.refresh(perm)
-                result.append(perm)
-        return result
+            .returning(GroupMemberPermission)
+            .execution_options(populate_existing=True)
+        )
+        result = await self.session.execute(stmt)
+        return list(result.scalars().all())
 
     async def get_for_member(self, group_member_id: uuid.UUID) -> list[GroupMemberPermission]:
         query = select(GroupMemberPermission).where(GroupMemberPermission.group_member_id == group_member_id)
@@ -146,6 +255,16 @@ class GroupInvitationRepository(BaseRepository[GroupInvitation]):
         result = await self.session.execute(query)
         return result.scalar_one_or_none()
 
+    async def get_pending_emails(self, emails: list[str], group_id: uuid.UUID) -> set[str]:
+        """Return which of `emails` already have a pending invitation to the group."""
+        query = select(GroupInvitation.invitee_email).where(
+            GroupInvitation.invitee_email.in_(emails),
+            GroupInvitation.group_id == group_id,
+            GroupInvitation.status == "pending",
+        )
+        result = await self.session.execute(query)
+        return set(result.scalars().all())
+
     async def get_pending_for_user(self, user_id: uuid.UUID) -> list[GroupInvitation]:
         query = (
             select(GroupInvitation)
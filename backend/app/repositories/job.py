@@ -0,0 +1,106 @@
+import uuid
+from datetime import timedelta
+from typing import Any
+
+from sqlalchemy import case, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.models.enums import JobStatus
+from app.models.job import Job
+from app.repositories.base import BaseRepository
+
+
+class JobRepository(BaseRepository[Job]):
+    def __init__(self, session: AsyncSession):
+        super().__init__(Job, session)
+
+    async def enqueue(self, kind: str, payload: dict[str, Any], *, max_attempts: int | None = None) -> Job:
+        """Queue a job in the current transaction; workers only see it once that transaction commits.
+
+        `payload` must be JSON-serializable.
+        """
+        return await self.create(
+            {
+                "kind": kind,
+                "payload": payload,
+                "status": JobStatus.PENDING,
+                "max_attempts": max_attempts or settings.job_max_attempts,
+            }
+        )
+
+    async def enqueue_many(
+        self, kind: str, payloads: list[dict[str, Any]], *, max_attempts: int | None = None
+    ) -> list[Job]:
+        """Queue one job per payload with a single multi-row INSERT; see `enqueue`."""
+        return await self.create_many(
+            [
+                {
+                    "kind": kind,
+                    "payload": payload,
+                    "status": JobStatus.PENDING,
+                    "max_attempts": max_attempts or settings.job_max_attempts,
+                }
+                for payload in payloads
+            ]
+        )
+
+    async def claim_batch(self, limit: int) -> list[Job]:
+        """Mark up to `limit` due jobs as running and return them.
+
+        Rows locked by other workers are skipped, so concurrent workers never claim the same job.
+        """
+        due = (
+            select(Job.id)
+            .where(Job.status == JobStatus.PENDING, Job.run_at <= func.now())
+            .order_by(Job.run_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        stmt = (
+            update(Job)
+            .where(Job.id.in_(due.scalar_subquery()))
+            .values(status=JobStatus.RUNNING, locked_at=func.now(), attempts=Job.attempts + 1)
+            .returning(Job)
+            .execution_options(populate_existing=True, synchronize_session=False)
+        )
+        result = await self.session.execute(stmt)
+        return list(result.scalars().all())
+
+    async def complete(self, job_id: uuid.UUID) -> None:
+        await self.delete_where(Job.id == job_id)
+
+    async def fail(self, job: Job, error: str) -> None:
+        """Schedule a retry with exponential backoff, or give up once the job is out of attempts."""
+        if job.attempts >= job.max_attempts:
+            values: dict[str, Any] = {"status": JobStatus.FAILED}
+        else:
+            delay = min(settings.job_retry_base_seconds * 2 ** (job.attempts - 1), settings.job_retry_max_seconds)
+            values = {"status": JobStatus.PENDING, "run_at": func.now() + timedelta(seconds=delay)}
+        stmt = (
+            update(Job)
+            .where(Job.id == job.id)
+            .values(**values, locked_at=None, last_error=error)
+            .execution_options(synchronize_session=False)
+        )
+        await self.session.execute(stmt)
+
+    async def requeue_stale(self, locked_for: timedelta) -> int:
+        """Return jobs stuck in `running` for longer than `locked_for` (e.g. after a worker crash) to the queue.
+
+        Jobs that have used up their attempts are marked failed instead, so a job that takes its worker
+        down every time it runs is not retried forever.
+        """
+        out_of_attempts = Job.attempts >= Job.max_attempts
+        stmt = (
+            update(Job)
+            .where(Job.status == JobStatus.RUNNING, Job.locked_at < func.now() - locked_for)
+            .values(
+                status=case((out_of_attempts, JobStatus.FAILED), else_=JobStatus.PENDING),
+                locked_at=None,
+                last_error=case((out_of_attempts, "Worker stopped while running the job"), else_=Job.last_error),
+            )
+            .execution_options(synchronize_session=False)
+        )
+        result = await self.session.execute(stmt)
+        return result.rowcount
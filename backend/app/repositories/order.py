@@ -1,22 +1,66 @@
 import uuid
+from datetime import datetime
 
-from sqlalchemy import func, select
+from sqlalchemy import distinct, func, select, true
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 
 from app.models.enums import OrderStatus
 from app.models.order import FavoriteDish, Order, OrderItem
 from app.repositories.base import BaseRepository
+from app.schemas.base import CursorPage
 
 
 class OrderRepository(BaseRepository[Order]):
     def __init__(self, session: AsyncSession):
         super().__init__(Order, session)
 
-    async def get_by_group(self, group_id: uuid.UUID) -> list[Order]:
-        query = select(Order).where(Order.group_id == group_id).order_by(Order.created_at.desc())
+    async def get_by_group(
+        self,
+        group_id: uuid.UUID,
+        *,
+        status: OrderStatus | None = None,
+        created_from: datetime | None = None,
+        created_before: datetime | None = None,
+        cursor: str | None = None,
+        limit: int = 50,
+        estimate_total: bool = False,
+    ) -> CursorPage:
+        """Page through a group's orders, newest first.
+
+        Items are (order, item_count, participant_count, total_amount) rows; the totals are aggregated
+        per order in SQL so listing does not need to load any items.
+        """
+        totals = (
+            select(
+                func.coalesce(func.sum(OrderItem.quantity), 0).label("item_count"),
+                func.count(distinct(OrderItem.user_id)).label("participant_count"),
+                func.coalesce(func.sum(OrderItem.price * OrderItem.quantity), 0).label("total_amount"),
+            )
+            .where(OrderItem.order_id == Order.id)
+            .lateral("order_totals")
+        )
+        query = (
+            select(Order, totals.c.item_count, totals.c.participant_count, totals.c.total_amount)
+            .join(totals, true())
+            .where(Order.group_id == group_id)
+        )
+        if status is not None:
+            query = query.where(Order.status == status)
+        if created_from is not None:
+            query = query.where(Order.created_at >= created_from)
+        if created_before is not None:
+            query = query.where(Order.created_at < created_before)
+        return await self.paginate(query, cursor=cursor, limit=limit, estimate_total=estimate_total, scalars=False)
+
+    async def get_for_update(self, order_id: uuid.UUID) -> Order | None:
+        """Load an order and lock its row until the transaction ends.
+
+        An instance already loaded in the session is refreshed, so callers always see the committed status.
+        """
+        query = select(Order).where(Order.id == order_id).with_for_update().execution_options(populate_existing=True)
         result = await self.session.execute(query)
-        return list(result.scalars().all())
+        return result.scalar_one_or_none()
 
     async def get_active_for_group(self, group_id: uuid.UUID) -> Order | None:
         """Get the current active (non-finished, non-cancelled) order for a group."""
@@ -0,0 +1,40 @@
+from datetime import timedelta
+
+from sqlalchemy import delete, func
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.rate_limit import RateLimitBucket
+from app.repositories.base import BaseRepository
+
+
+class RateLimitBucketRepository(BaseRepository[RateLimitBucket]):
+    def __init__(self, session: AsyncSession):
+        super().__init__(RateLimitBucket, session)
+
+    async def try_consume(self, key: str, capacity: int, refill_per_second: float) -> bool:
+        """Refill the bucket for the elapsed time and take one token in a single statement.
+
+        Returns False, leaving the bucket untouched, when less than one token is available.
+        """
+        bucket = RateLimitBucket.__table__.c
+        elapsed = func.extract("epoch", func.now() - bucket.updated_at)
+        refilled = func.least(capacity, bucket.tokens + elapsed * refill_per_second)
+        stmt = (
+            insert(RateLimitBucket)
+            .values(key=key, tokens=capacity - 1)
+            .on_conflict_do_update(
+                index_elements=[bucket.key],
+                set_={"tokens": refilled - 1, "updated_at": func.now()},
+                where=refilled >= 1,
+            )
+            .returning(bucket.tokens)
+        )
+        result = await self.session.execute(stmt)
+        return result.first() is not None
+
+    async def delete_idle(self, idle_for: timedelta) -> int:
+        """Delete buckets untouched for `idle_for`; a missing bucket behaves like a full one."""
+        stmt = delete(RateLimitBucket).where(RateLimitBucket.updated_at < func.now() - idle_for)
+        result = await self.session.execute(stmt)
+        return result.rowcount
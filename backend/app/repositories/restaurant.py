@@ -1,11 +1,14 @@
 import uuid
+from typing import Any
 
-from sqlalchemy import select
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 
 from app.models.restaurant import Dish, Restaurant
 from app.repositories.base import BaseRepository
+from app.schemas.base import CursorPage
 
 
 class RestaurantRepository(BaseRepository[Restaurant]):
@@ -35,15 +38,29 @@ class DishRepository(BaseRepository[Dish]):
     def __init__(self, session: AsyncSession):
         super().__init__(Dish, session)
 
-    async def get_by_restaurant(self, restaurant_id: uuid.UUID) -> list[Dish]:
+    async def get_by_restaurant(
+        self,
+        restaurant_id: uuid.UUID,
+        *,
+        cursor: str | None = None,
+        limit: int = 50,
+        estimate_total: bool = False,
+    ) -> CursorPage:
         query = select(Dish).where(Dish.restaurant_id == restaurant_id)
-        result = await self.session.execute(query)
-        return list(result.scalars().all())
+        return await self.paginate(query, cursor=cursor, limit=limit, estimate_total=estimate_total)
+
+    async def upsert_many(self, restaurant_id: uuid.UUID, dishes: list[dict[str, Any]]) -> None:
+        """Create or reprice dishes of a restaurant by name in one statement.
 
-    async def get_by_name_and_restaurant(self, name: str, restaurant_id: uuid.UUID) -> Dish | None:
-        query = select(Dish).where(
-            Dish.name == name,
-            Dish.restaurant_id == restaurant_id,
+        Each dict needs "name", "detail" and "price"; names must be unique within the list. Existing dishes
+        only get their price updated, and only when it actually changed.
+        """
+        if not dishes:
+            return
+        stmt = insert(Dish).values([{**dish, "restaurant_id": restaurant_id} for dish in dishes])
+        stmt = stmt.on_conflict_do_update(
+            constraint="uq_dish_restaurant_name",
+            set_={"price": stmt.excluded.price, "updated_at": func.now()},
+            where=Dish.price.is_distinct_from(stmt.excluded.price),
         )
-        result = await self.session.execute(query)
-        return result.scalar_one_or_none()
+        await self.session.execute(stmt)
@@ -14,6 +14,13 @@ class UserRepository(BaseRepository[User]):
         result = await self.session.execute(query)
         return result.scalar_one_or_none()
 
+    async def get_by_emails(self, emails: list[str]) -> list[User]:
+        if not emails:
+            return []
+        query = select(User).where(User.email.in_(emails))
+        result = await self.session.execute(query)
+        return list(result.scalars().all())
+
     async def exists_by_email(self, email: str) -> bool:
         user = await self.get_by_email(email)
         return user is not None
@@ -1,5 +1,7 @@
+from datetime import date
 from decimal import Decimal
 
+from app.models.enums import TimeBucket
 from app.schemas.base import BaseSchema
 
 
@@ -22,3 +24,18 @@ class UserAnalytics(BaseSchema):
     average_order_value: Decimal = Decimal("0.00")
     favorite_restaurant: str | None = None
     total_balance_across_groups: Decimal = Decimal("0.00")
+
+
+class SpendingPoint(BaseSchema):
+    period_start: date
+    orders_count: int = 0
+    items_spent: Decimal = Decimal("0.00")
+    delivery_spent: Decimal = Decimal("0.00")
+    total_spent: Decimal = Decimal("0.00")
+
+
+class SpendingTimeseries(BaseSchema):
+    bucket: TimeBucket
+    date_from: date
+    date_to: date
+    points: list[SpendingPoint] = []
@@ -25,5 +25,17 @@ class PaginatedResponse(BaseSchema, Generic[T]):
     total_pages: int
 
 
+class CursorPage(BaseSchema, Generic[T]):
+    """One page of a keyset-paginated list, newest first.
+
+    Pass `next_cursor` back as `cursor` to get the following page; it is None on the last page.
+    `estimated_total` is the planner's row estimate, only filled in when requested.
+    """
+
+    items: list[T]
+    next_cursor: str | None = None
+    estimated_total: int | None = None
+
+
 class MessageResponse(BaseSchema):
     message: str
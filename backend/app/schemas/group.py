@@ -1,5 +1,6 @@
 import uuid
 from datetime import datetime
+from typing import Annotated
 
 from pydantic import Field
 
@@ -82,6 +83,11 @@ class InvitationCreate(BaseSchema):
     role: GroupRole = GroupRole.MEMBER
 
 
+class InvitationBulkCreate(BaseSchema):
+    emails: list[Annotated[str, Field(max_length=255)]] = Field(min_length=1, max_length=100)
+    role: GroupRole = GroupRole.MEMBER
+
+
 class InvitationResponse(BaseSchema):
     id: uuid.UUID
     group_id: uuid.UUID
@@ -94,6 +100,16 @@ class InvitationResponse(BaseSchema):
     updated_at: datetime
 
 
+class InvitationSkipped(BaseSchema):
+    email: str
+    reason: str
+
+
+class InvitationBulkResponse(BaseSchema):
+    invitations: list[InvitationResponse] = []
+    skipped: list[InvitationSkipped] = []
+
+
 class InvitationAcceptResponse(BaseSchema):
     message: str
     group_id: uuid.UUID
@@ -0,0 +1,24 @@
+from app.schemas.base import BaseSchema
+
+
+class CacheMetrics(BaseSchema):
+    name: str
+    size: int
+    max_entries: int
+    hits: int
+    misses: int
+
+
+class PasswordPoolMetrics(BaseSchema):
+    max_workers: int
+    in_flight: int
+    queued: int
+    completed: int
+
+
+class MetricsResponse(BaseSchema):
+    """Counters of the worker process that served the request."""
+
+    pid: int
+    caches: list[CacheMetrics] = []
+    password_pool: PasswordPoolMetrics
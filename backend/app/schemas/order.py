@@ -38,6 +38,12 @@ class OrderResponse(BaseSchema):
     updated_at: datetime
 
 
+class OrderSummaryResponse(OrderResponse):
+    item_count: int = 0
+    participant_count: int = 0
+    total_amount: Decimal = Decimal("0.00")
+
+
 class OrderDetailResponse(OrderResponse):
     items: list["OrderItemResponse"] = []
     initiator_name: str | None = None
@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime
 
-from pydantic import EmailStr, Field
+from pydantic import ConfigDict, EmailStr, Field
 
 from app.models.enums import UserRole
 from app.schemas.base import BaseSchema
@@ -55,5 +55,15 @@ class UserResponse(BaseSchema):
     updated_at: datetime
 
 
+class CurrentUser(UserResponse):
+    """Immutable snapshot of the authenticated user, cached across requests by `get_current_user`."""
+
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+    @property
+    def is_admin(self) -> bool:
+        return self.role == UserRole.ADMIN
+
+
 class UserInDB(UserResponse):
     hashed_password: str
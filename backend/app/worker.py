@@ -0,0 +1,110 @@
+"""Background job worker.
+
+Claims due jobs in batches with FOR UPDATE SKIP LOCKED, so any number of workers can poll the same
+table, and runs each batch concurrently. Failed jobs are retried with exponential backoff; jobs left
+running by a crashed worker are requeued after JOB_LOCK_TIMEOUT_SECONDS.
+
+Runs inside each API worker process by default (see `app.main`), or standalone:
+
+Usage: python -m app.worker
+"""
+
+import asyncio
+import contextlib
+import logging
+import signal
+from datetime import timedelta
+
+from app.config import settings
+from app.core.email import smtp_pool
+from app.database import async_session_factory, engine
+from app.jobs import JOB_HANDLERS
+from app.models.job import Job
+from app.repositories.job import JobRepository
+
+logger = logging.getLogger(__name__)
+
+_worker_task: asyncio.Task | None = None
+
+
+async def _claim_jobs() -> list[Job]:
+    async with async_session_factory() as session:
+        repository = JobRepository(session)
+        await repository.requeue_stale(timedelta(seconds=settings.job_lock_timeout_seconds))
+        jobs = await repository.claim_batch(settings.job_batch_size)
+        await session.commit()
+    return jobs
+
+
+async def _run_job(job: Job) -> None:
+    try:
+        handler = JOB_HANDLERS.get(job.kind)
+        if handler is None:
+            raise LookupError(f"No handler registered for job kind {job.kind!r}")
+        async with async_session_factory() as session:
+            await handler(session, job.payload)
+            await JobRepository(session).complete(job.id)
+            await session.commit()
+    except Exception as exc:
+        logger.exception("Job %s (%s) failed on attempt %d/%d", job.id, job.kind, job.attempts, job.max_attempts)
+        async with async_session_factory() as session:
+            await JobRepository(session).fail(job, repr(exc))
+            await session.commit()
+
+
+async def run_worker() -> None:
+    """Process jobs until cancelled."""
+    while True:
+        try:
+            jobs = await _claim_jobs()
+            # Jobs in a batch are independent and mostly wait on I/O (SMTP, database), so run them together
+            await asyncio.gather(*(_run_job(job) for job in jobs))
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception("Job worker iteration failed")
+            jobs = []
+
+        # Keep draining without pause while full batches come back
+        if len(jobs) < settings.job_batch_size:
+            await asyncio.sleep(settings.job_poll_interval_seconds)
+
+
+def start_worker() -> None:
+    global _worker_task
+    if _worker_task is None:
+        _worker_task = asyncio.create_task(run_worker())
+
+
+async def stop_worker() -> None:
+    global _worker_task
+    if _worker_task is not None:
+        _worker_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await _worker_task
+        _worker_task = None
+
+
+async def _main() -> None:
+    loop = asyncio.get_running_loop()
+    task = asyncio.current_task()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, task.cancel)
+
+    logger.info("Job worker started")
+    try:
+        await run_worker()
+    except asyncio.CancelledError:
+        logger.info("Job worker stopped")
+    finally:
+        await smtp_pool.close()
+        await engine.dispose()
+
+
+def main() -> None:
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    asyncio.run(_main())
+
+
+if __name__ == "__main__":
+    main()
@@ -2,7 +2,9 @@ import uuid
 
 from pydantic import BaseModel
 
+from app.core.cache import user_analytics_cache
 from app.core.exceptions import ForbiddenError, NotFoundError
+from app.core.invalidation import publish_invalidation
 from app.models.enums import BalanceChangeType, BalancesScope, PermissionType
 from app.models.user import User
 from app.repositories.balance import BalanceHistoryRepository, BalanceRepository
@@ -39,39 +41,36 @@ class AdjustBalanceWorkflow:
 
         # Check user has Balances Editor permission
         if not user.is_admin:
-            membership = await self.group_member_repository.get_membership(user.id, input_data.group_id)
+            membership = await self.group_member_repository.get_permissions(user.id, input_data.group_id)
             if membership is None:
                 raise ForbiddenError(detail="You are not a member of this group")
             if membership.get_permission(PermissionType.BALANCES) != BalancesScope.EDITOR:
                 raise ForbiddenError(detail="You do not have permission to adjust balances")
 
         # Check target user is a member
-        target_membership = await self.group_member_repository.get_membership(
+        target_membership = await self.group_member_repository.get_permissions(
             input_data.data.user_id, input_data.group_id
         )
         if target_membership is None:
             raise NotFoundError(detail="Target user is not a member of this group")
 
-        # Get or create balance
-        balance = await self.balance_repository.get_or_create(input_data.data.user_id, input_data.group_id)
-
-        # Apply adjustment
-        new_amount = balance.amount + input_data.data.amount
-        await self.balance_repository.update(balance.id, {"amount": new_amount})
+        # Apply adjustment, creating the balance if needed
+        balance = await self.balance_repository.apply_delta(
+            input_data.data.user_id, input_data.group_id, input_data.data.amount
+        )
 
         # Create history entry
         await self.balance_history_repository.create(
             {
                 "balance_id": balance.id,
                 "amount": input_data.data.amount,
-                "balance_after": new_amount,
+                "balance_after": balance.amount,
                 "note": input_data.data.note,
                 "change_type": BalanceChangeType.MANUAL,
                 "created_by_id": user.id,
             }
         )
 
-        # Refresh balance
-        balance = await self.balance_repository.get_by_id(balance.id)
+        await publish_invalidation(self.balance_repository.session, user_analytics_cache, [input_data.data.user_id])
 
         return AdjustBalanceOutput(balance=BalanceResponse.model_validate(balance))
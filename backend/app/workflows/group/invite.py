@@ -1,11 +1,12 @@
-import logging
 import secrets
 import uuid
 
 from pydantic import BaseModel
 
-from app.core.email import EmailService
+from app.core.cache import group_analytics_cache, user_analytics_cache
 from app.core.exceptions import ConflictError, ForbiddenError, NotFoundError
+from app.core.invalidation import publish_invalidation
+from app.jobs import SEND_INVITATION_EMAIL
 from app.models.enums import GROUP_ROLE_PRESETS, GroupRole, InvitationStatus
 from app.models.user import User
 from app.repositories.group import (
@@ -14,10 +15,17 @@ from app.repositories.group import (
     GroupMemberRepository,
     GroupRepository,
 )
+from app.repositories.job import JobRepository
 from app.repositories.user import UserRepository
-from app.schemas.group import InvitationAcceptResponse, InvitationCreate, InvitationResponse
-
-logger = logging.getLogger(__name__)
+from app.schemas.group import (
+    InvitationAcceptResponse,
+    InvitationBulkCreate,
+    InvitationBulkResponse,
+    InvitationCreate,
+    InvitationResponse,
+    InvitationSkipped,
+)
+from app.schemas.user import CurrentUser
 
 
 class InviteInput(BaseModel):
@@ -33,6 +41,19 @@ class InviteOutput(BaseModel):
     invitation: InvitationResponse
 
 
+class BulkInviteInput(BaseModel):
+    group_id: uuid.UUID
+    data: InvitationBulkCreate
+    current_user: object
+
+    class Config:
+        arbitrary_types_allowed = True
+
+
+class BulkInviteOutput(BaseModel):
+    result: InvitationBulkResponse
+
+
 class AcceptInviteInput(BaseModel):
     token: str
     current_user: object
@@ -53,14 +74,14 @@ class InviteWorkflow:
         invitation_repository: GroupInvitationRepository,
         user_repository: UserRepository,
         permission_repository: GroupMemberPermissionRepository,
-        email_service: EmailService,
+        job_repository: JobRepository,
     ):
         self.group_repository = group_repository
         self.group_member_repository = group_member_repository
         self.invitation_repository = invitation_repository
         self.user_repository = user_repository
         self.permission_repository = permission_repository
-        self.email_service = email_service
+        self.job_repository = job_repository
 
     async def create_invitation(self, input_data: InviteInput) -> InviteOutput:
         user: User = input_data.current_user  # type: ignore[assignment]
@@ -70,7 +91,7 @@ class InviteWorkflow:
             raise NotFoundError(detail="Group not found")
 
         # Check current user is a member
-        membership = await self.group_member_repository.get_membership(user.id, input_data.group_id)
+        membership = await self.group_member_repository.get_permissions(user.id, input_data.group_id)
         if membership is None and not user.is_admin:
             raise ForbiddenError(detail="You are not a member of this group")
 
@@ -82,7 +103,7 @@ class InviteWorkflow:
         # Check if already a member (look up by email)
         invitee = await self.user_repository.get_by_email(input_data.data.email)
         if invitee is not None:
-            existing_member = await self.group_member_repository.get_membership(invitee.id, input_data.group_id)
+            existing_member = await self.group_member_repository.get_permissions(invitee.id, input_data.group_id)
             if existing_member is not None:
                 raise ConflictError(detail="This user is already a member of the group")
 
@@ -99,19 +120,90 @@ class InviteWorkflow:
             }
         )
 
-        # Send invitation email (fire-and-forget, don't block on failure)
-        try:
-            await self.email_service.send_invitation_email(
-                to_email=input_data.data.email,
-                inviter_name=user.full_name,
-                group_name=group.name,
-                token=token,
-            )
-        except Exception:
-            logger.exception("Failed to send invitation email to %s", input_data.data.email)
+        # Sent by the job worker once the invitation is committed, with retries
+        await self.job_repository.enqueue(
+            SEND_INVITATION_EMAIL,
+            {
+                "to_email": input_data.data.email,
+                "inviter_name": user.full_name,
+                "group_name": group.name,
+                "token": token,
+            },
+        )
 
         return InviteOutput(invitation=InvitationResponse.model_validate(invitation))
 
+    async def create_invitations(self, input_data: BulkInviteInput) -> BulkInviteOutput:
+        """Invite many emails at once.
+
+        Emails that already have a pending invitation or belong to a member are skipped rather than
+        failing the request. Lookups and inserts take one query each regardless of the number of emails.
+        """
+        user: User = input_data.current_user  # type: ignore[assignment]
+        group_id = input_data.group_id
+
+        group = await self.group_repository.get_by_id(group_id)
+        if group is None:
+            raise NotFoundError(detail="Group not found")
+
+        membership = await self.group_member_repository.get_permissions(user.id, group_id)
+        if membership is None and not user.is_admin:
+            raise ForbiddenError(detail="You are not a member of this group")
+
+        emails = list(dict.fromkeys(input_data.data.emails))
+        pending_emails = await self.invitation_repository.get_pending_emails(emails, group_id)
+        invitees = {
+            invitee.email: invitee
+            for invitee in await self.user_repository.get_by_emails([e for e in emails if e not in pending_emails])
+        }
+        member_user_ids = await self.group_member_repository.get_member_user_ids(
+            [invitee.id for invitee in invitees.values()], group_id
+        )
+
+        rows: list[dict] = []
+        skipped: list[InvitationSkipped] = []
+        for email in emails:
+            invitee = invitees.get(email)
+            if email in pending_emails:
+                skipped.append(InvitationSkipped(email=email, reason="An invitation is already pending for this email"))
+            elif invitee is not None and invitee.id in member_user_ids:
+                skipped.append(InvitationSkipped(email=email, reason="This user is already a member of the group"))
+            else:
+                rows.append(
+                    {
+                        "group_id": group_id,
+                        "inviter_id": user.id,
+                        "invitee_email": email,
+                        "invitee_id": invitee.id if invitee else None,
+                        "status": InvitationStatus.PENDING,
+                        "token": secrets.token_urlsafe(32),
+                    }
+                )
+
+        invitations = await self.invitation_repository.create_many(rows)
+
+        # One job per invitation, so a retry only resends the message that failed; the worker
+        # claims them in batches and sends each batch concurrently
+        await self.job_repository.enqueue_many(
+            SEND_INVITATION_EMAIL,
+            [
+                {
+                    "to_email": invitation.invitee_email,
+                    "inviter_name": user.full_name,
+                    "group_name": group.name,
+                    "token": invitation.token,
+                }
+                for invitation in invitations
+            ],
+        )
+
+        return BulkInviteOutput(
+            result=InvitationBulkResponse(
+                invitations=[InvitationResponse.model_validate(i) for i in invitations],
+                skipped=skipped,
+            )
+        )
+
     async def accept_invitation(self, input_data: AcceptInviteInput) -> AcceptInviteOutput:
         user: User = input_data.current_user  # type: ignore[assignment]
 
@@ -152,6 +244,10 @@ class InviteWorkflow:
         # Update invitation status
         await self.invitation_repository.update(invitation.id, {"status": InvitationStatus.ACCEPTED})
 
+        session = self.group_member_repository.session
+        await publish_invalidation(session, group_analytics_cache, [invitation.group_id])
+        await publish_invalidation(session, user_analytics_cache, [user.id])
+
         return AcceptInviteOutput(
             result=InvitationAcceptResponse(
                 message="Successfully joined the group",
@@ -159,7 +255,7 @@ class InviteWorkflow:
             )
         )
 
-    async def decline_invitation(self, token: str, user: User) -> None:
+    async def decline_invitation(self, token: str, user: CurrentUser) -> None:
         invitation = await self.invitation_repository.get_by_token(token)
         if invitation is None:
             raise NotFoundError(detail="Invitation not found")
@@ -2,7 +2,9 @@ import uuid
 
 from pydantic import BaseModel
 
+from app.core.cache import group_analytics_cache, user_analytics_cache
 from app.core.exceptions import ConflictError, ForbiddenError, NotFoundError, ValidationError
+from app.core.invalidation import publish_invalidation
 from app.models.enums import GROUP_ROLE_PRESETS, MembersScope, PermissionType
 from app.models.group import Group
 from app.models.user import User
@@ -74,12 +76,18 @@ class ManageMembersWorkflow:
         self.user_repository = user_repository
         self.permission_repository = permission_repository
 
+    async def _invalidate_analytics(self, group_id: uuid.UUID, member_user_id: uuid.UUID) -> None:
+        """Membership changes affect the group's member count and the user's group count."""
+        session = self.group_member_repository.session
+        await publish_invalidation(session, group_analytics_cache, [group_id])
+        await publish_invalidation(session, user_analytics_cache, [member_user_id])
+
     async def _check_editor_permission(self, user: User, group: Group, group_id: uuid.UUID) -> None:
         """Check that the current user has Members Editor permission."""
         if user.is_admin:
             return
 
-        membership = await self.group_member_repository.get_membership(user.id, group_id)
+        membership = await self.group_member_repository.get_permissions(user.id, group_id)
         if membership is None:
             raise ForbiddenError(detail="You are not a member of this group")
         if membership.get_permission(PermissionType.MEMBERS) != MembersScope.EDITOR:
@@ -110,7 +118,7 @@ class ManageMembersWorkflow:
             raise NotFoundError(detail="User not found")
 
         # Check not already a member
-        existing = await self.group_member_repository.get_membership(input_data.data.user_id, input_data.group_id)
+        existing = await self.group_member_repository.get_permissions(input_data.data.user_id, input_data.group_id)
         if existing is not None:
             raise ConflictError(detail="User is already a member of this group")
 
@@ -132,9 +140,12 @@ class ManageMembersWorkflow:
                 permissions_data[perm.permission_type.value] = perm.level
 
         await self.permission_repository.set_permissions(member.id, permissions_data)
+        await self._invalidate_analytics(input_data.group_id, input_data.data.user_id)
 
         # Reload member with permissions
-        member = await self.group_member_repository.get_membership(input_data.data.user_id, input_data.group_id)
+        member = await self.group_member_repository.get_membership(
+            input_data.data.user_id, input_data.group_id, refresh=True
+        )
 
         return AddMemberOutput(member=_build_member_response(member, target_user))
 
@@ -168,7 +179,9 @@ class ManageMembersWorkflow:
             await self.permission_repository.set_permissions(membership.id, permissions_data)
 
         # Reload member with updated permissions
-        member = await self.group_member_repository.get_membership(input_data.member_user_id, input_data.group_id)
+        member = await self.group_member_repository.get_membership(
+            input_data.member_user_id, input_data.group_id, refresh=True
+        )
         target_user = await self.user_repository.get_by_id(input_data.member_user_id)
 
         return UpdateMemberOutput(member=_build_member_response(member, target_user))
@@ -185,4 +198,7 @@ class ManageMembersWorkflow:
             await self._check_editor_permission(user, group, input_data.group_id)
             await self._check_not_owner(group, input_data.member_user_id)
 
-        return await self.group_member_repository.delete_membership(input_data.member_user_id, input_data.group_id)
+        deleted = await self.group_member_repository.delete_membership(input_data.member_user_id, input_data.group_id)
+        if deleted:
+            await self._invalidate_analytics(input_data.group_id, input_data.member_user_id)
+        return deleted
@@ -1,15 +1,21 @@
 import uuid
 
 from pydantic import BaseModel
+from sqlalchemy.exc import IntegrityError
 
+from app.core.cache import group_analytics_cache
 from app.core.exceptions import ForbiddenError, NotFoundError
+from app.core.invalidation import publish_invalidation
 from app.models.enums import OrdersScope, OrderStatus, PermissionType
 from app.models.user import User
+from app.repositories.analytics import GroupAnalyticsRollupRepository
 from app.repositories.group import GroupMemberRepository, GroupRepository
 from app.repositories.order import OrderRepository
 from app.repositories.restaurant import RestaurantRepository
 from app.schemas.order import OrderCreate, OrderResponse
 
+ACTIVE_ORDER_INDEX = "uq_orders_active_group"
+
 
 class CreateOrderInput(BaseModel):
     group_id: uuid.UUID
@@ -31,11 +37,13 @@ class CreateOrderWorkflow:
         group_member_repository: GroupMemberRepository,
         order_repository: OrderRepository,
         restaurant_repository: RestaurantRepository,
+        analytics_rollup_repository: GroupAnalyticsRollupRepository,
     ):
         self.group_repository = group_repository
         self.group_member_repository = group_member_repository
         self.order_repository = order_repository
         self.restaurant_repository = restaurant_repository
+        self.analytics_rollup_repository = analytics_rollup_repository
 
     async def execute(self, input_data: CreateOrderInput) -> CreateOrderOutput:
         user: User = input_data.current_user  # type: ignore[assignment]
@@ -46,7 +54,7 @@ class CreateOrderWorkflow:
             raise NotFoundError(detail="Group not found")
 
         # Check permission
-        membership = await self.group_member_repository.get_membership(user.id, input_data.group_id)
+        membership = await self.group_member_repository.get_permissions(user.id, input_data.group_id)
         if membership is None and not user.is_admin:
             raise ForbiddenError(detail="You are not a member of this group")
 
@@ -54,11 +62,6 @@ class CreateOrderWorkflow:
         if membership and orders_level not in (OrdersScope.EDITOR, OrdersScope.INITIATOR):
             raise ForbiddenError(detail="You do not have permission to create orders")
 
-        # Check no active order exists
-        active_order = await self.order_repository.get_active_for_group(input_data.group_id)
-        if active_order is not None:
-            raise ForbiddenError(detail="There is already an active order in this group")
-
         # Resolve restaurant
         restaurant_id = input_data.data.restaurant_id
         restaurant_name = input_data.data.restaurant_name
@@ -82,14 +85,28 @@ class CreateOrderWorkflow:
                 )
                 restaurant_id = new_restaurant.id
 
-        order = await self.order_repository.create(
-            {
-                "group_id": input_data.group_id,
-                "restaurant_id": restaurant_id,
-                "restaurant_name": restaurant_name,
-                "initiator_id": user.id,
-                "status": OrderStatus.INITIATED,
-            }
+        # The partial unique index on active orders rejects a second one, even under concurrent starts
+        try:
+            order = await self.order_repository.create(
+                {
+                    "group_id": input_data.group_id,
+                    "restaurant_id": restaurant_id,
+                    "restaurant_name": restaurant_name,
+                    "initiator_id": user.id,
+                    "status": OrderStatus.INITIATED,
+                }
+            )
+        except IntegrityError as exc:
+            if ACTIVE_ORDER_INDEX not in str(exc.orig):
+                raise
+            raise ForbiddenError(detail="There is already an active order in this group") from None
+
+        await self.analytics_rollup_repository.lock_groups([input_data.group_id])
+        await self.analytics_rollup_repository.increment(
+            input_data.group_id,
+            total_orders=1,
+            restaurant_name=restaurant_name,
         )
+        await publish_invalidation(self.order_repository.session, group_analytics_cache, [input_data.group_id])
 
         return CreateOrderOutput(order=OrderResponse.model_validate(order))
@@ -1,11 +1,19 @@
 import uuid
+from datetime import UTC, datetime
 from decimal import Decimal
 
 from pydantic import BaseModel
 
+from app.core.cache import group_analytics_cache, user_analytics_cache
 from app.core.exceptions import ForbiddenError, NotFoundError, ValidationError
+from app.core.invalidation import publish_invalidation
 from app.models.enums import BalanceChangeType, OrdersScope, OrderStatus, PermissionType
 from app.models.user import User
+from app.repositories.analytics import (
+    GroupAnalyticsRollupRepository,
+    GroupDailySpendRepository,
+    UserSpendSummaryRepository,
+)
 from app.repositories.balance import BalanceHistoryRepository, BalanceRepository
 from app.repositories.group import GroupMemberRepository
 from app.repositories.order import OrderItemRepository, OrderRepository
@@ -52,6 +60,9 @@ class OrderLifecycleWorkflow:
         balance_repository: BalanceRepository,
         balance_history_repository: BalanceHistoryRepository,
         dish_repository: DishRepository,
+        analytics_rollup_repository: GroupAnalyticsRollupRepository,
+        user_spend_summary_repository: UserSpendSummaryRepository,
+        daily_spend_repository: GroupDailySpendRepository,
     ):
         self.order_repository = order_repository
         self.order_item_repository = order_item_repository
@@ -59,6 +70,9 @@ class OrderLifecycleWorkflow:
         self.balance_repository = balance_repository
         self.balance_history_repository = balance_history_repository
         self.dish_repository = dish_repository
+        self.analytics_rollup_repository = analytics_rollup_repository
+        self.user_spend_summary_repository = user_spend_summary_repository
+        self.daily_spend_repository = daily_spend_repository
 
     async def transition(self, input_data: TransitionOrderInput) -> TransitionOrderOutput:
         user: User = input_data.current_user  # type: ignore[assignment]
@@ -68,26 +82,37 @@ class OrderLifecycleWorkflow:
             raise NotFoundError(detail="Order not found")
 
         # Check user is the initiator or has editor permission
-        membership = await self.group_member_repository.get_membership(user.id, order.group_id)
+        membership = await self.group_member_repository.get_permissions(user.id, order.group_id)
         is_initiator = order.initiator_id == user.id
         is_editor = membership and membership.get_permission(PermissionType.ORDERS) == OrdersScope.EDITOR
 
         if not is_initiator and not is_editor and not user.is_admin:
             raise ForbiddenError(detail="Only the order initiator or an editor can change order status")
 
-        # Validate transition
-        current_status = OrderStatus(order.status)
         new_status = OrderStatus(input_data.new_status)
+        if new_status in (OrderStatus.FINISHED, OrderStatus.CANCELLED):
+            await self.analytics_rollup_repository.lock_groups([order.group_id])
 
+        # Re-read the status under a row lock: a concurrent transition of the same order may have committed
+        # since the read above, and validating the stale status would settle a finished order twice
+        order = await self.order_repository.get_for_update(order.id)
+        if order is None:
+            raise NotFoundError(detail="Order not found")
+
+        # Validate transition
+        current_status = OrderStatus(order.status)
         allowed = VALID_TRANSITIONS.get(current_status, [])
         if new_status not in allowed:
             raise ValidationError(detail=f"Cannot transition from {current_status.value} to {new_status.value}")
 
-        # Handle finishing: update balances and restaurant dishes
+        # Handle finishing: update balances, analytics and restaurant dishes
         if new_status == OrderStatus.FINISHED:
             await self._handle_finish(order)
+        elif new_status == OrderStatus.CANCELLED:
+            await self.analytics_rollup_repository.increment(order.group_id, cancelled_orders=1)
 
         updated = await self.order_repository.update(order.id, {"status": new_status.value})
+        await publish_invalidation(self.order_repository.session, group_analytics_cache, [order.group_id])
 
         return TransitionOrderOutput(order=OrderResponse.model_validate(updated))
 
@@ -102,7 +127,7 @@ class OrderLifecycleWorkflow:
             raise ValidationError(detail="Delivery fees cannot be changed on finished or cancelled orders")
 
         # Only initiator or editor
-        membership = await self.group_member_repository.get_membership(user.id, order.group_id)
+        membership = await self.group_member_repository.get_permissions(user.id, order.group_id)
         is_initiator = order.initiator_id == user.id
         is_editor = membership and membership.get_permission(PermissionType.ORDERS) == OrdersScope.EDITOR
 
@@ -131,8 +156,24 @@ class OrderLifecycleWorkflow:
         return TransitionOrderOutput(order=OrderResponse.model_validate(updated))
 
     async def _handle_finish(self, order) -> None:
-        """Handle order finishing: update balances and restaurant dishes."""
+        """Handle order finishing: update balances, analytics and restaurant dishes."""
         items = await self.order_item_repository.get_items_for_order(order.id)
+
+        items_spent = sum((item.price * (item.quantity or 1) for item in items), Decimal("0.00"))
+        delivery_spent = order.delivery_fee_total or Decimal("0.00")
+        await self.analytics_rollup_repository.increment(
+            order.group_id,
+            completed_orders=1,
+            items_spent=items_spent,
+            delivery_spent=delivery_spent,
+        )
+        await self.daily_spend_repository.add_finished_order(
+            order.group_id,
+            datetime.now(UTC).date(),
+            items_spent=items_spent,
+            delivery_spent=delivery_spent,
+        )
+
         if not items:
             return
 
@@ -142,46 +183,38 @@ class OrderLifecycleWorkflow:
             user_totals.setdefault(item.user_id, Decimal("0.00"))
             user_totals[item.user_id] += item.price * (item.quantity or 1)
 
-        # Add delivery fee per person if set
-        if order.delivery_fee_per_person:
-            for uid in user_totals:
-                user_totals[uid] += order.delivery_fee_per_person
+        await publish_invalidation(self.order_repository.session, user_analytics_cache, user_totals)
 
-        # Update balances for each participant
-        for uid, total in user_totals.items():
-            balance = await self.balance_repository.get_or_create(uid, order.group_id)
-            new_amount = balance.amount - total
-            await self.balance_repository.update(balance.id, {"amount": new_amount})
+        # Record per-user spend before the delivery fee is folded into the totals
+        delivery_per_person = order.delivery_fee_per_person or Decimal("0.00")
+        await self.user_spend_summary_repository.add_finished_order(
+            order.group_id,
+            user_totals,
+            delivery_spent=delivery_per_person,
+            restaurant_name=order.restaurant_name,
+        )
 
-            await self.balance_history_repository.create(
+        # Settle all participants at once: one balance upsert and one history insert, whatever the order size
+        charges = {uid: -(total + delivery_per_person) for uid, total in user_totals.items()}
+        balances = await self.balance_repository.apply_deltas(order.group_id, charges)
+        await self.balance_history_repository.create_many(
+            [
                 {
-                    "balance_id": balance.id,
-                    "amount": -total,
-                    "balance_after": new_amount,
+                    "balance_id": balances[uid].id,
+                    "amount": charge,
+                    "balance_after": balances[uid].amount,
                     "note": f"Order #{str(order.id)[:8]}",
                     "change_type": BalanceChangeType.ORDER,
                     "order_id": order.id,
                 }
-            )
+                for uid, charge in charges.items()
+            ]
+        )
 
-        # Update restaurant dishes if restaurant is linked
+        # Update restaurant dishes if restaurant is linked; the last item with a given name sets its price
         if order.restaurant_id:
-            for item in items:
-                existing_dish = await self.dish_repository.get_by_name_and_restaurant(item.name, order.restaurant_id)
-                if existing_dish:
-                    # Update price if different
-                    if existing_dish.price != item.price:
-                        await self.dish_repository.update(existing_dish.id, {"price": item.price})
-                else:
-                    # Create new dish
-                    await self.dish_repository.create(
-                        {
-                            "name": item.name,
-                            "detail": item.detail,
-                            "price": item.price,
-                            "restaurant_id": order.restaurant_id,
-                        }
-                    )
+            dishes = {item.name: {"name": item.name, "detail": item.detail, "price": item.price} for item in items}
+            await self.dish_repository.upsert_many(order.restaurant_id, list(dishes.values()))
 
     async def get_order_detail(self, order_id: uuid.UUID) -> OrderDetailResponse:
         order = await self.order_repository.get_with_items(order_id)
@@ -1,13 +1,16 @@
 from pydantic import BaseModel
 
+from app.config import settings
 from app.core.exceptions import AuthError
-from app.core.security import create_access_token, verify_password
+from app.core.rate_limit import acquire_password_check_slot, enforce_rate_limit
+from app.core.security import create_access_token, verify_password_async
 from app.repositories.user import UserRepository
 from app.schemas.user import UserLogin, UserResponse
 
 
 class LoginInput(BaseModel):
     data: UserLogin
+    client_ip: str
 
 
 class LoginOutput(BaseModel):
@@ -20,13 +23,30 @@ class LoginWorkflow:
         self.user_repository = user_repository
 
     async def execute(self, input_data: LoginInput) -> LoginOutput:
+        # Reject floods before any lookup or bcrypt work
+        session = self.user_repository.session
+        await enforce_rate_limit(
+            session,
+            f"login:ip:{input_data.client_ip}",
+            settings.auth_rate_limit_ip_burst,
+            settings.auth_rate_limit_ip_per_minute,
+        )
+        await enforce_rate_limit(
+            session,
+            f"login:email:{input_data.data.email.lower()}",
+            settings.auth_rate_limit_email_burst,
+            settings.auth_rate_limit_email_per_minute,
+        )
+
+        await acquire_password_check_slot(session)
+
         # Find user by email
         user = await self.user_repository.get_by_email(input_data.data.email)
         if user is None:
             raise AuthError(detail="Invalid email or password")
 
         # Verify password
-        if not verify_password(input_data.data.password, user.hashed_password):
+        if not await verify_password_async(input_data.data.password, user.hashed_password):
             raise AuthError(detail="Invalid email or password")
 
         # Check if user is active
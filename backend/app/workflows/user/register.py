@@ -1,13 +1,16 @@
 from pydantic import BaseModel
 
+from app.config import settings
 from app.core.exceptions import ConflictError
-from app.core.security import hash_password
+from app.core.rate_limit import acquire_password_check_slot, enforce_rate_limit
+from app.core.security import hash_password_async
 from app.repositories.user import UserRepository
 from app.schemas.user import UserCreate, UserResponse
 
 
 class RegisterInput(BaseModel):
     data: UserCreate
+    client_ip: str
 
 
 class RegisterOutput(BaseModel):
@@ -19,15 +22,25 @@ class RegisterWorkflow:
         self.user_repository = user_repository
 
     async def execute(self, input_data: RegisterInput) -> RegisterOutput:
+        # Reject floods before any lookup or bcrypt work
+        await enforce_rate_limit(
+            self.user_repository.session,
+            f"register:ip:{input_data.client_ip}",
+            settings.auth_rate_limit_ip_burst,
+            settings.auth_rate_limit_ip_per_minute,
+        )
+
         # Check if email already exists
         if await self.user_repository.exists_by_email(input_data.data.email):
             raise ConflictError(detail="User with this email already exists")
 
         # Hash password and create user
+        await acquire_password_check_slot(self.user_repository.session)
+        hashed_password = await hash_password_async(input_data.data.password)
         user = await self.user_repository.create(
             {
                 "email": input_data.data.email,
-                "hashed_password": hash_password(input_data.data.password),
+                "hashed_password": hashed_password,
                 "full_name": input_data.data.full_name,
             }
         )
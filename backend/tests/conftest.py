@@ -0,0 +1,97 @@
+import os
+from collections.abc import AsyncIterator, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+import pytest
+from alembic.command import upgrade
+from alembic.config import Config
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from app.config import settings
+from app.core.cache import clear_all_caches
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+
+@pytest.fixture(scope="session")
+def migrated_database() -> None:
+    """Bring the database at DATABASE_URL to the latest migration once per test run.
+
+    Tests that need Postgres are skipped when DATABASE_URL is not set, so the rest of the suite runs anywhere.
+    """
+    if not os.environ.get("DATABASE_URL"):
+        pytest.skip("DATABASE_URL is not set; skipping tests that need Postgres")
+    config = Config(str(BACKEND_DIR / "alembic.ini"))
+    config.set_main_option("script_location", str(BACKEND_DIR / "alembic"))
+    upgrade(config, "head")
+
+
+@pytest.fixture
+async def engine(migrated_database: None) -> AsyncIterator[AsyncEngine]:
+    engine = create_async_engine(settings.database_url, poolclass=NullPool)
+    yield engine
+    await engine.dispose()
+
+
+@pytest.fixture
+async def session(engine: AsyncEngine) -> AsyncIterator[AsyncSession]:
+    """A session whose work is rolled back after the test; commits inside it become savepoints."""
+    async with engine.connect() as connection:
+        transaction = await connection.begin()
+        session = AsyncSession(bind=connection, expire_on_commit=False, join_transaction_mode="create_savepoint")
+        try:
+            yield session
+        finally:
+            await session.close()
+            await transaction.rollback()
+
+
+@pytest.fixture(autouse=True)
+def _clear_caches() -> Iterator[None]:
+    clear_all_caches()
+    yield
+    clear_all_caches()
+
+
+SAVEPOINT_STATEMENTS = ("SAVEPOINT", "RELEASE SAVEPOINT", "ROLLBACK TO SAVEPOINT")
+
+
+class StatementCounter:
+    def __init__(self) -> None:
+        # (SQL, driver parameters) of every statement sent, in order
+        self.executed: list[tuple[str, Any]] = []
+
+    @property
+    def statements(self) -> list[str]:
+        return [statement for statement, _parameters in self.executed]
+
+    @property
+    def count(self) -> int:
+        return len(self.executed)
+
+
+@pytest.fixture
+def count_statements(session: AsyncSession):
+    """Count the SQL statements the session sends while the returned context manager is open."""
+
+    @contextmanager
+    def counting() -> Iterator[StatementCounter]:
+        counter = StatementCounter()
+
+        def before_cursor_execute(_conn, _cursor, statement, parameters, _context, _executemany) -> None:
+            # Savepoints come from the test's wrapping transaction, not from the code under test
+            if not statement.startswith(SAVEPOINT_STATEMENTS):
+                counter.executed.append((statement, parameters))
+
+        connection = session.bind.sync_connection
+        event.listen(connection, "before_cursor_execute", before_cursor_execute)
+        try:
+            yield counter
+        finally:
+            event.remove(connection, "before_cursor_execute", before_cursor_execute)
+
+    return counting
@@ -0,0 +1,162 @@
+"""Helpers that insert minimal valid rows for tests."""
+
+import uuid
+from collections.abc import Sequence
+from decimal import Decimal
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.enums import GROUP_ROLE_PRESETS, GroupRole, OrderStatus, UserRole
+from app.models.group import Group, GroupMember, GroupMemberPermission
+from app.models.order import Order, OrderItem
+from app.models.restaurant import Restaurant
+from app.models.user import User
+from app.repositories.analytics import (
+    GroupAnalyticsRollupRepository,
+    GroupDailySpendRepository,
+    UserSpendSummaryRepository,
+)
+from app.repositories.balance import BalanceHistoryRepository, BalanceRepository
+from app.repositories.group import (
+    GroupInvitationRepository,
+    GroupMemberPermissionRepository,
+    GroupMemberRepository,
+    GroupRepository,
+)
+from app.repositories.job import JobRepository
+from app.repositories.order import OrderItemRepository, OrderRepository
+from app.repositories.restaurant import DishRepository, RestaurantRepository
+from app.repositories.user import UserRepository
+from app.schemas.order import OrderCreate
+from app.schemas.user import CurrentUser
+from app.workflows.group.invite import InviteWorkflow
+from app.workflows.order.create import CreateOrderInput, CreateOrderWorkflow
+from app.workflows.order.lifecycle import OrderLifecycleWorkflow
+
+
+async def create_user(session: AsyncSession, *, role: str = UserRole.USER) -> User:
+    user = User(
+        email=f"{uuid.uuid4().hex}@example.com",
+        hashed_password="not-a-real-hash",
+        full_name="Test User",
+        role=role,
+    )
+    session.add(user)
+    await session.flush()
+    return user
+
+
+def as_current_user(user: User) -> CurrentUser:
+    return CurrentUser.model_validate(user)
+
+
+async def create_group(
+    session: AsyncSession,
+    owner: User,
+    members: Sequence[User] = (),
+    *,
+    owner_role: GroupRole = GroupRole.MEMBER,
+) -> Group:
+    """Create a group owned by `owner`, with the owner under `owner_role` and `members` under the Member role."""
+    group = Group(name="Test Group", owner_id=owner.id)
+    session.add(group)
+    await session.flush()
+    for user in [owner, *members]:
+        member = GroupMember(user_id=user.id, group_id=group.id)
+        session.add(member)
+        await session.flush()
+        role = owner_role if user is owner else GroupRole.MEMBER
+        session.add_all(
+            GroupMemberPermission(group_member_id=member.id, permission_type=permission_type, level=level)
+            for permission_type, level in GROUP_ROLE_PRESETS[role].items()
+        )
+    await session.flush()
+    return group
+
+
+async def create_order(
+    session: AsyncSession,
+    group: Group,
+    initiator: User,
+    participants: list[User],
+    *,
+    status: str = OrderStatus.ORDERED,
+) -> Order:
+    """Create an order in which every participant ordered one distinct dish."""
+    restaurant = Restaurant(name="Test Restaurant", group_id=group.id)
+    session.add(restaurant)
+    await session.flush()
+    order = Order(
+        group_id=group.id,
+        restaurant_id=restaurant.id,
+        restaurant_name=restaurant.name,
+        initiator_id=initiator.id,
+        status=status,
+    )
+    session.add(order)
+    await session.flush()
+    session.add_all(
+        OrderItem(order_id=order.id, user_id=user.id, name=f"Dish {i}", price=Decimal("100.00"), quantity=1)
+        for i, user in enumerate(participants)
+    )
+    await session.flush()
+    return order
+
+
+async def start_order(
+    session: AsyncSession,
+    group: Group,
+    initiator: User,
+    participants: list[User],
+    *,
+    restaurant_name: str,
+) -> Order:
+    """Start an order through CreateOrderWorkflow, then add one distinct dish per participant."""
+    output = await make_create_order_workflow(session).execute(
+        CreateOrderInput(
+            group_id=group.id,
+            data=OrderCreate(restaurant_name=restaurant_name),
+            current_user=initiator,
+        )
+    )
+    session.add_all(
+        OrderItem(order_id=output.order.id, user_id=user.id, name=f"Dish {i}", price=Decimal("100.00"), quantity=1)
+        for i, user in enumerate(participants)
+    )
+    await session.flush()
+    return await session.get_one(Order, output.order.id)
+
+
+def make_create_order_workflow(session: AsyncSession) -> CreateOrderWorkflow:
+    return CreateOrderWorkflow(
+        GroupRepository(session),
+        GroupMemberRepository(session),
+        OrderRepository(session),
+        RestaurantRepository(session),
+        GroupAnalyticsRollupRepository(session),
+    )
+
+
+def make_lifecycle_workflow(session: AsyncSession) -> OrderLifecycleWorkflow:
+    return OrderLifecycleWorkflow(
+        OrderRepository(session),
+        OrderItemRepository(session),
+        GroupMemberRepository(session),
+        BalanceRepository(session),
+        BalanceHistoryRepository(session),
+        DishRepository(session),
+        GroupAnalyticsRollupRepository(session),
+        UserSpendSummaryRepository(session),
+        GroupDailySpendRepository(session),
+    )
+
+
+def make_invite_workflow(session: AsyncSession) -> InviteWorkflow:
+    return InviteWorkflow(
+        GroupRepository(session),
+        GroupMemberRepository(session),
+        GroupInvitationRepository(session),
+        UserRepository(session),
+        GroupMemberPermissionRepository(session),
+        JobRepository(session),
+    )
@@ -0,0 +1,94 @@
+from decimal import Decimal
+
+from app.api.analytics import get_group_analytics
+from app.core.cache import clear_all_caches
+from app.models.enums import GroupRole, OrderStatus, UserRole
+from app.repositories.group import GroupMemberRepository
+from app.workflows.order.lifecycle import TransitionOrderInput
+from tests.factories import as_current_user, create_group, create_user, make_lifecycle_workflow, start_order
+
+FINISH_PATH = [OrderStatus.CONFIRMED, OrderStatus.ORDERED, OrderStatus.FINISHED]
+
+
+async def _transition(session, order, user, statuses) -> None:
+    for status in statuses:
+        await make_lifecycle_workflow(session).transition(
+            TransitionOrderInput(order_id=order.id, new_status=status, current_user=user)
+        )
+
+
+async def _seed_orders(session):
+    """A group with two finished Pizza Place orders, one cancelled and one active order elsewhere."""
+    owner = await create_user(session)
+    members = [await create_user(session) for _ in range(3)]
+    group = await create_group(session, owner, members, owner_role=GroupRole.ADMIN)
+    participants = [owner, *members]
+    for _ in range(2):
+        order = await start_order(session, group, owner, participants, restaurant_name="Pizza Place")
+        await _transition(session, order, owner, FINISH_PATH)
+    order = await start_order(session, group, owner, participants, restaurant_name="Sushi Bar")
+    await _transition(session, order, owner, [OrderStatus.CANCELLED])
+    await start_order(session, group, owner, participants, restaurant_name="Burger Joint")
+    return group, owner
+
+
+def _assert_seeded_figures(analytics) -> None:
+    assert analytics.total_orders == 4
+    assert analytics.completed_orders == 2
+    assert analytics.cancelled_orders == 1
+    assert analytics.active_orders == 1
+    assert analytics.total_spent == Decimal("800.00")
+    assert analytics.most_popular_restaurant == "Pizza Place"
+    assert analytics.total_members == 4
+
+
+async def test_group_analytics_is_one_statement(session, count_statements):
+    admin = await create_user(session, role=UserRole.ADMIN)
+    group, _owner = await _seed_orders(session)
+
+    with count_statements() as counter:
+        analytics = await get_group_analytics(
+            group.id,
+            current_user=as_current_user(admin),
+            group_member_repository=GroupMemberRepository(session),
+            session=session,
+        )
+
+    assert counter.count == 1, counter.statements
+    _assert_seeded_figures(analytics)
+
+
+async def test_group_analytics_for_member_adds_one_permission_lookup(session, count_statements):
+    group, owner = await _seed_orders(session)
+    clear_all_caches()
+
+    with count_statements() as counter:
+        analytics = await get_group_analytics(
+            group.id,
+            current_user=as_current_user(owner),
+            group_member_repository=GroupMemberRepository(session),
+            session=session,
+        )
+
+    # The membership with its permissions, then the analytics aggregate
+    assert counter.count == 2, counter.statements
+    _assert_seeded_figures(analytics)
+
+
+async def test_group_analytics_is_served_from_cache(session, count_statements):
+    admin = await create_user(session, role=UserRole.ADMIN)
+    group = await create_group(session, await create_user(session))
+    current_user = as_current_user(admin)
+    await get_group_analytics(
+        group.id, current_user=current_user, group_member_repository=GroupMemberRepository(session), session=session
+    )
+
+    with count_statements() as counter:
+        await get_group_analytics(
+            group.id,
+            current_user=current_user,
+            group_member_repository=GroupMemberRepository(session),
+            session=session,
+        )
+
+    assert counter.count == 0
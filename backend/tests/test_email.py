@@ -0,0 +1,155 @@
+import asyncio
+import socket
+from collections.abc import Iterator
+from email.message import EmailMessage
+
+import aiosmtplib
+import pytest
+from aiosmtpd.controller import Controller
+
+from app.config import settings
+from app.core.email import SMTPConnectionPool, smtp_pool
+from app.jobs import JOB_HANDLERS, SEND_INVITATION_EMAIL
+
+
+class RecordingHandler:
+    """aiosmtpd handler that records which connection delivered each message and how many overlapped."""
+
+    def __init__(self) -> None:
+        self.delivered: list[tuple[tuple[str, int], str]] = []
+        self.active = 0
+        self.max_active = 0
+        self.drop_next = False
+        self.drop_next_noop = False
+
+    @property
+    def connections(self) -> set[tuple[str, int]]:
+        return {peer for peer, _to in self.delivered}
+
+    async def handle_NOOP(self, server, session, envelope, arg) -> str:  # noqa: N802 (name set by aiosmtpd)
+        if self.drop_next_noop:
+            # Behave like a server that timed out the connection while it sat in the pool
+            self.drop_next_noop = False
+            server.transport.close()
+            return "421 Closing connection"
+        return "250 OK"
+
+    async def handle_DATA(self, server, session, envelope) -> str:  # noqa: N802 (name set by aiosmtpd)
+        if self.drop_next:
+            # Drop the connection once the message transaction has started
+            self.drop_next = False
+            server.transport.close()
+            return "421 Closing connection"
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        # Hold the connection long enough for concurrent senders to overlap
+        await asyncio.sleep(0.05)
+        self.active -= 1
+        self.delivered.append((session.peer, envelope.rcpt_tos[0]))
+        return "250 OK"
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.fixture
+def smtp_server(monkeypatch: pytest.MonkeyPatch) -> Iterator[RecordingHandler]:
+    handler = RecordingHandler()
+    controller = Controller(handler, hostname="127.0.0.1", port=_free_port())
+    controller.start()
+    monkeypatch.setattr(settings, "smtp_host", controller.hostname)
+    monkeypatch.setattr(settings, "smtp_port", controller.port)
+    monkeypatch.setattr(settings, "smtp_use_tls", False)
+    monkeypatch.setattr(settings, "smtp_user", "")
+    monkeypatch.setattr(settings, "smtp_password", "")
+    try:
+        yield handler
+    finally:
+        controller.stop()
+
+
+def _message(to: str) -> EmailMessage:
+    message = EmailMessage()
+    message["From"] = "LunchTogether <noreply@example.com>"
+    message["To"] = to
+    message["Subject"] = "Test"
+    message.set_content("Hello")
+    return message
+
+
+async def test_sequential_sends_reuse_one_connection(smtp_server):
+    pool = SMTPConnectionPool(max_size=2, idle_timeout=60)
+    for i in range(3):
+        await pool.send(_message(f"user{i}@example.com"))
+    await pool.close()
+
+    assert len(smtp_server.delivered) == 3
+    assert len(smtp_server.connections) == 1
+
+
+async def test_max_size_bounds_concurrent_sends(smtp_server):
+    pool = SMTPConnectionPool(max_size=2, idle_timeout=60)
+    await asyncio.gather(*(pool.send(_message(f"user{i}@example.com")) for i in range(6)))
+    await pool.close()
+
+    assert len(smtp_server.delivered) == 6
+    assert smtp_server.max_active == 2
+    assert len(smtp_server.connections) == 2
+
+
+async def test_idle_connections_are_replaced(smtp_server):
+    pool = SMTPConnectionPool(max_size=2, idle_timeout=0)
+    for i in range(3):
+        await pool.send(_message(f"user{i}@example.com"))
+    await pool.close()
+
+    assert len(smtp_server.delivered) == 3
+    assert len(smtp_server.connections) == 3
+
+
+async def test_connection_dropped_while_pooled_is_replaced(smtp_server):
+    pool = SMTPConnectionPool(max_size=1, idle_timeout=60)
+    await pool.send(_message("first@example.com"))
+    smtp_server.drop_next_noop = True
+    await pool.send(_message("second@example.com"))
+    await pool.close()
+
+    assert [to for _peer, to in smtp_server.delivered] == ["first@example.com", "second@example.com"]
+    assert len(smtp_server.connections) == 2
+
+
+async def test_disconnect_during_data_is_not_resent(smtp_server):
+    pool = SMTPConnectionPool(max_size=1, idle_timeout=60)
+    await pool.send(_message("first@example.com"))
+    smtp_server.drop_next = True
+    with pytest.raises(aiosmtplib.SMTPException):
+        await pool.send(_message("second@example.com"))
+    await pool.send(_message("third@example.com"))
+    await pool.close()
+
+    assert [to for _peer, to in smtp_server.delivered] == ["first@example.com", "third@example.com"]
+
+
+async def test_connection_survives_errors_unrelated_to_smtp(smtp_server):
+    pool = SMTPConnectionPool(max_size=1, idle_timeout=60)
+    with pytest.raises(RuntimeError):
+        async with pool.connection():
+            raise RuntimeError("rendering failed")
+    await pool.send(_message("first@example.com"))
+    await pool.close()
+
+    assert len(smtp_server.connections) == 1
+
+
+async def test_invitation_email_failure_reaches_the_job(monkeypatch):
+    async def refuse(_message: EmailMessage) -> None:
+        raise aiosmtplib.SMTPConnectError("connection refused")
+
+    monkeypatch.setattr(smtp_pool, "send", refuse)
+    with pytest.raises(aiosmtplib.SMTPConnectError):
+        await JOB_HANDLERS[SEND_INVITATION_EMAIL](
+            None, {"to_email": "a@example.com", "inviter_name": "A", "group_name": "G", "token": "t"}
+        )
@@ -0,0 +1,22 @@
+from app.core.cache import member_permissions_cache
+from app.repositories.group import GroupMemberRepository, GroupRepository
+from tests.factories import create_group, create_user
+
+
+async def test_deleting_a_group_invalidates_member_permissions(session, count_statements):
+    owner = await create_user(session)
+    member = await create_user(session)
+    group = await create_group(session, owner, [member])
+    for user in (owner, member):
+        await GroupMemberRepository(session).get_permissions(user.id, group.id)
+
+    with count_statements() as counter:
+        assert await GroupRepository(session).delete(group.id)
+
+    assert member_permissions_cache.get((owner.id, group.id)) is None
+    assert member_permissions_cache.get((member.id, group.id)) is None
+    # Other workers hear about both memberships through one notification
+    notifications = [str(parameters) for statement, parameters in counter.executed if "pg_notify" in statement]
+    assert len(notifications) == 1, counter.statements
+    assert str(owner.id) in notifications[0]
+    assert str(member.id) in notifications[0]
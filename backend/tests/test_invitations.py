@@ -0,0 +1,32 @@
+from sqlalchemy import select
+
+from app.jobs import SEND_INVITATION_EMAIL
+from app.models.job import Job
+from app.schemas.group import InvitationBulkCreate
+from app.workflows.group.invite import BulkInviteInput
+from tests.factories import as_current_user, create_group, create_user, make_invite_workflow
+
+
+async def test_bulk_invite_enqueues_one_email_job_per_invitation(session, count_statements):
+    owner = await create_user(session)
+    member = await create_user(session)
+    group = await create_group(session, owner, [member])
+    emails = ["ann@example.com", "bob@example.com", member.email, "ann@example.com"]
+
+    with count_statements() as counter:
+        output = await make_invite_workflow(session).create_invitations(
+            BulkInviteInput(
+                group_id=group.id, data=InvitationBulkCreate(emails=emails), current_user=as_current_user(owner)
+            )
+        )
+
+    invited = [invitation.invitee_email for invitation in output.result.invitations]
+    assert invited == ["ann@example.com", "bob@example.com"]
+    assert [skipped.email for skipped in output.result.skipped] == [member.email]
+
+    job_inserts = [statement for statement in counter.statements if statement.startswith("INSERT INTO jobs")]
+    assert len(job_inserts) == 1, job_inserts
+    jobs = (await session.execute(select(Job).where(Job.kind == SEND_INVITATION_EMAIL))).scalars().all()
+    assert sorted(job.payload["to_email"] for job in jobs) == invited
+    tokens = {invitation.invitee_email: invitation.token for invitation in output.result.invitations}
+    assert all(job.payload["token"] == tokens[job.payload["to_email"]] for job in jobs)
@@ -0,0 +1,29 @@
+from datetime import timedelta
+
+from sqlalchemy import func, update
+
+from app.models.enums import JobStatus
+from app.models.job import Job
+from app.repositories.job import JobRepository
+
+
+async def test_requeue_stale_fails_jobs_out_of_attempts(session):
+    repository = JobRepository(session)
+    retryable = await repository.enqueue("test", {}, max_attempts=3)
+    exhausted = await repository.enqueue("test", {}, max_attempts=1)
+
+    # Simulate a worker that claimed both jobs and died an hour ago. The jobs are marked directly rather
+    # than through claim_batch, which could pick other pending jobs already in the database instead.
+    await session.execute(
+        update(Job)
+        .where(Job.id.in_([retryable.id, exhausted.id]))
+        .values(status=JobStatus.RUNNING, attempts=1, locked_at=func.now() - timedelta(hours=1))
+    )
+    # Stale jobs left in the database by anything else are requeued too, so only a lower bound holds
+    assert await repository.requeue_stale(timedelta(minutes=5)) >= 2
+
+    await session.refresh(retryable)
+    await session.refresh(exhausted)
+    assert (retryable.status, retryable.locked_at) == (JobStatus.PENDING, None)
+    assert (exhausted.status, exhausted.locked_at) == (JobStatus.FAILED, None)
+    assert exhausted.last_error is not None
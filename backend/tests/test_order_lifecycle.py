@@ -0,0 +1,108 @@
+import asyncio
+import time
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import delete, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.exceptions import ValidationError
+from app.models.analytics import GroupAnalyticsRollup
+from app.models.balance import Balance, BalanceHistory
+from app.models.enums import OrderStatus
+from app.models.restaurant import Dish
+from app.models.user import User
+from app.repositories.balance import BalanceRepository
+from app.workflows.order.lifecycle import TransitionOrderInput
+from tests.factories import create_group, create_order, create_user, make_lifecycle_workflow
+
+PARTICIPANT_COUNTS = [5, 25, 100]
+
+
+async def test_finishing_an_order_takes_constant_statements(session, count_statements):
+    statement_counts = {}
+    timings = {}
+    for participant_count in PARTICIPANT_COUNTS:
+        owner = await create_user(session)
+        members = [await create_user(session) for _ in range(participant_count - 1)]
+        group = await create_group(session, owner, members)
+        order = await create_order(session, group, owner, [owner, *members])
+
+        started = time.perf_counter()
+        with count_statements() as counter:
+            await make_lifecycle_workflow(session).transition(
+                TransitionOrderInput(order_id=order.id, new_status=OrderStatus.FINISHED, current_user=owner)
+            )
+        timings[participant_count] = time.perf_counter() - started
+        statement_counts[participant_count] = counter.count
+
+        balances = (await session.execute(select(Balance.amount).where(Balance.group_id == group.id))).scalars().all()
+        assert sorted(balances) == [Decimal("-100.00")] * participant_count
+        history_rows = await session.scalar(
+            select(func.count()).select_from(BalanceHistory).where(BalanceHistory.order_id == order.id)
+        )
+        assert history_rows == participant_count
+        dishes = await session.scalar(
+            select(func.count()).select_from(Dish).where(Dish.restaurant_id == order.restaurant_id)
+        )
+        assert dishes == participant_count
+
+    assert len(set(statement_counts.values())) == 1, f"statements: {statement_counts}, seconds: {timings}"
+
+
+async def test_balance_deltas_are_written_in_user_id_order(session, count_statements):
+    owner = await create_user(session)
+    members = [await create_user(session) for _ in range(4)]
+    group = await create_group(session, owner, members)
+    users = sorted([owner, *members], key=lambda user: user.id, reverse=True)
+
+    with count_statements() as counter:
+        await BalanceRepository(session).apply_deltas(group.id, {user.id: Decimal("-1.00") for user in users})
+
+    # Concurrent settlements must lock shared balance rows in one global order
+    _statement, parameters = counter.executed[0]
+    written = [value for value in parameters if any(value == user.id for user in users)]
+    assert written == sorted(user.id for user in users)
+
+
+async def test_concurrent_finishes_settle_the_order_once(engine):
+    # Each request needs its own committed transaction, so this test cannot use the rolled-back `session`
+    async with AsyncSession(engine, expire_on_commit=False) as setup:
+        owner = await create_user(setup)
+        members = [await create_user(setup) for _ in range(2)]
+        group = await create_group(setup, owner, members)
+        order = await create_order(setup, group, owner, [owner, *members])
+        await setup.commit()
+
+    def finish(session: AsyncSession):
+        return make_lifecycle_workflow(session).transition(
+            TransitionOrderInput(order_id=order.id, new_status=OrderStatus.FINISHED, current_user=owner)
+        )
+
+    try:
+        async with AsyncSession(engine) as first, AsyncSession(engine) as second:
+            await finish(first)
+            second_finish = asyncio.create_task(finish(second))
+            done, _pending = await asyncio.wait([second_finish], timeout=0.5)
+            assert not done, "the second finish should wait for the first to commit"
+
+            await first.commit()
+            with pytest.raises(ValidationError):
+                await second_finish
+
+        async with AsyncSession(engine) as check:
+            balances = (await check.scalars(select(Balance.amount).where(Balance.group_id == group.id))).all()
+            assert sorted(balances) == [Decimal("-100.00")] * 3
+            history_rows = await check.scalar(
+                select(func.count()).select_from(BalanceHistory).where(BalanceHistory.order_id == order.id)
+            )
+            assert history_rows == 3
+            completed = await check.scalar(
+                select(GroupAnalyticsRollup.completed_orders).where(GroupAnalyticsRollup.group_id == group.id)
+            )
+            assert completed == 1
+    finally:
+        async with AsyncSession(engine) as cleanup:
+            # Groups and everything under them cascade from their owner
+            await cleanup.execute(delete(User).where(User.id.in_([owner.id, *(member.id for member in members)])))
+            await cleanup.commit()
@@ -0,0 +1,22 @@
+from datetime import UTC, datetime, timedelta
+
+from app.models.enums import OrderStatus
+from app.repositories.order import OrderRepository
+from tests.factories import create_group, create_order, create_user
+
+
+async def test_estimated_total_binds_uuid_datetime_and_enum_filters(session):
+    owner = await create_user(session)
+    group = await create_group(session, owner)
+    await create_order(session, group, owner, [owner], status=OrderStatus.FINISHED)
+
+    page = await OrderRepository(session).get_by_group(
+        group.id,
+        status=OrderStatus.FINISHED,
+        created_from=datetime.now(UTC) - timedelta(days=1),
+        estimate_total=True,
+    )
+
+    assert len(page.items) == 1
+    assert page.estimated_total is not None
+    assert page.estimated_total >= 1
@@ -0,0 +1,28 @@
+import uuid
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.exceptions import TooManyRequestsError
+from app.core.rate_limit import acquire_password_check_slot, enforce_rate_limit
+
+
+async def test_rate_limit_rejects_once_the_bucket_is_empty(session):
+    key = f"test:{uuid.uuid4()}"
+    await enforce_rate_limit(session, key, 2, 1)
+    await enforce_rate_limit(session, key, 2, 1)
+
+    with pytest.raises(TooManyRequestsError):
+        await enforce_rate_limit(session, key, 2, 1)
+
+
+async def test_password_check_slot_is_held_until_the_transaction_ends(engine, session, monkeypatch):
+    monkeypatch.setattr("app.core.rate_limit.settings.password_check_concurrency", 1)
+    await acquire_password_check_slot(session)
+
+    async with AsyncSession(engine) as other_request:
+        with pytest.raises(TooManyRequestsError):
+            await acquire_password_check_slot(other_request)
+
+        await session.rollback()
+        await acquire_password_check_slot(other_request)
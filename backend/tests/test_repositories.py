@@ -0,0 +1,38 @@
+from sqlalchemy import select
+
+from app.models.restaurant import Restaurant
+from app.repositories.restaurant import RestaurantRepository
+from tests.factories import create_group, create_user
+
+
+async def test_bulk_writes_take_one_statement_each(session, count_statements):
+    owner = await create_user(session)
+    group = await create_group(session, owner)
+    repository = RestaurantRepository(session)
+
+    with count_statements() as counter:
+        restaurants = await repository.create_many(
+            [{"name": f"Restaurant {i}", "description": "old", "group_id": group.id} for i in range(3)]
+        )
+    assert counter.count == 1
+    assert [restaurant.name for restaurant in restaurants] == ["Restaurant 0", "Restaurant 1", "Restaurant 2"]
+
+    with count_statements() as counter:
+        await repository.update_many(
+            [
+                {"id": restaurants[0].id, "description": "new"},
+                {"id": restaurants[1].id, "description": None},
+            ]
+        )
+    assert counter.count == 1
+    rows = await session.execute(select(Restaurant.name, Restaurant.description).where(Restaurant.group_id == group.id))
+    descriptions = {name: description for name, description in rows}
+    # None is written as given, and rows left out of the batch are untouched
+    assert descriptions == {"Restaurant 0": "new", "Restaurant 1": None, "Restaurant 2": "old"}
+
+    with count_statements() as counter:
+        deleted = await repository.delete_where(Restaurant.id.in_([restaurants[0].id, restaurants[1].id]))
+    assert counter.count == 1
+    assert deleted == 2
+    remaining = await session.scalars(select(Restaurant.name).where(Restaurant.group_id == group.id))
+    assert list(remaining) == ["Restaurant 2"]
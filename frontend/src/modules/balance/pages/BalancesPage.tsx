@@ -11,7 +11,7 @@ import { Label } from "@/components/ui/label";
 import { useAuth } from "@/hooks";
 import {
   useAdjustBalanceMutation,
-  useGetBalanceHistoryQuery,
+  useGetBalanceHistoryInfiniteQuery,
   useGetBalancesQuery,
 } from "@/store/api/balanceApi";
 import type { Balance } from "@/types";
@@ -33,10 +33,16 @@ export function BalancesPage() {
 
   // History state
   const [historyUserId, setHistoryUserId] = useState<string | null>(null);
-  const { data: history } = useGetBalanceHistoryQuery(
+  const {
+    data: historyPages,
+    hasNextPage: hasMoreHistory,
+    fetchNextPage: fetchMoreHistory,
+    isFetchingNextPage: isFetchingMoreHistory,
+  } = useGetBalanceHistoryInfiniteQuery(
     { groupId: groupId!, userId: historyUserId! },
     { skip: !historyUserId }
   );
+  const history = historyPages?.pages.flatMap((page) => page.items);
 
   const openAdjustDialog = (balance: Balance) => {
     setAdjustTarget(balance);
@@ -264,6 +270,17 @@ export function BalancesPage() {
                             </div>
                           </div>
                         ))}
+                        {hasMoreHistory && (
+                          <Button
+                            variant="ghost"
+                            size="sm"
+                            className="w-full"
+                            onClick={() => fetchMoreHistory()}
+                            disabled={isFetchingMoreHistory}
+                          >
+                            {isFetchingMoreHistory ? "Loading..." : "Load more"}
+                          </Button>
+                        )}
                       </div>
                     )}
                   </div>
@@ -11,7 +11,7 @@ import {
 import { Label } from "@/components/ui/label";
 import {
   useCreateOrderMutation,
-  useGetOrdersQuery,
+  useGetOrdersInfiniteQuery,
 } from "@/store/api/orderApi";
 import { useGetRestaurantsQuery } from "@/store/api/restaurantApi";
 import { cn } from "@/utils";
@@ -42,7 +42,14 @@ const STATUS_STYLES: Record<string, { bg: string; text: string; dot: string }> =
 
 export function OrderListPage() {
   const { groupId } = useParams<{ groupId: string }>();
-  const { data: orders, isLoading } = useGetOrdersQuery(groupId!);
+  const {
+    data: orderPages,
+    isLoading,
+    hasNextPage,
+    fetchNextPage,
+    isFetchingNextPage,
+  } = useGetOrdersInfiniteQuery(groupId!);
+  const orders = orderPages?.pages.flatMap((page) => page.items);
   const { data: restaurants } = useGetRestaurantsQuery(groupId!);
   const [createOrder] = useCreateOrderMutation();
 
@@ -170,6 +177,10 @@ export function OrderListPage() {
                         </p>
                         <p className="text-sm text-muted-foreground">
                           {new Date(order.created_at).toLocaleDateString()}
+                          {" · "}
+                          {order.participant_count} participants
+                          {" · "}
+                          {Number(order.total_amount).toFixed(2)} ₴
                         </p>
                       </div>
                     </div>
@@ -193,6 +204,17 @@ export function OrderListPage() {
               </Link>
             );
           })}
+          {hasNextPage && (
+            <div className="flex justify-center pt-2">
+              <Button
+                variant="outline"
+                onClick={() => fetchNextPage()}
+                disabled={isFetchingNextPage}
+              >
+                {isFetchingNextPage ? "Loading..." : "Load more"}
+              </Button>
+            </div>
+          )}
         </div>
       )}
     </div>
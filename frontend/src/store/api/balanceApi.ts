@@ -3,6 +3,7 @@ import type {
   Balance,
   BalanceAdjustmentRequest,
   BalanceHistory,
+  CursorPage,
 } from "@/types";
 import { baseApi } from "./baseApi";
 
@@ -42,12 +43,20 @@ export const balanceApi = baseApi.injectEndpoints({
       ],
     }),
 
-    getBalanceHistory: builder.query<
-      BalanceHistory[],
-      { groupId: string; userId: string }
+    // Newest first, one page per "Load more"; pageParam is the cursor of the next page
+    getBalanceHistory: builder.infiniteQuery<
+      CursorPage<BalanceHistory>,
+      { groupId: string; userId: string },
+      string | null
     >({
-      query: ({ groupId, userId }) =>
-        API_ENDPOINTS.BALANCES.HISTORY(groupId, userId),
+      infiniteQueryOptions: {
+        initialPageParam: null,
+        getNextPageParam: (lastPage) => lastPage.next_cursor,
+      },
+      query: ({ queryArg: { groupId, userId }, pageParam }) => ({
+        url: API_ENDPOINTS.BALANCES.HISTORY(groupId, userId),
+        params: pageParam ? { cursor: pageParam } : undefined,
+      }),
       providesTags: (_result, _error, { userId }) => [
         { type: "Balance" as const, id: `HISTORY_${userId}` },
       ],
@@ -59,5 +68,5 @@ export const {
   useGetBalancesQuery,
   useGetMyBalanceQuery,
   useAdjustBalanceMutation,
-  useGetBalanceHistoryQuery,
+  useGetBalanceHistoryInfiniteQuery,
 } = balanceApi;
@@ -1,5 +1,6 @@
 import { API_ENDPOINTS } from "@/constants";
 import type {
+  CursorPage,
   Group,
   GroupCreateRequest,
   GroupDetail,
@@ -70,8 +71,23 @@ export const groupApi = baseApi.injectEndpoints({
     }),
 
     // Members
+    // Groups are small, so every page is fetched and callers get the full member list
     getGroupMembers: builder.query<GroupMember[], string>({
-      query: (groupId) => API_ENDPOINTS.GROUPS.MEMBERS(groupId),
+      async queryFn(groupId, _api, _extraOptions, baseQuery) {
+        const members: GroupMember[] = [];
+        let cursor: string | null = null;
+        do {
+          const result = await baseQuery({
+            url: API_ENDPOINTS.GROUPS.MEMBERS(groupId),
+            params: cursor ? { limit: 200, cursor } : { limit: 200 },
+          });
+          if (result.error) return { error: result.error };
+          const page = result.data as CursorPage<GroupMember>;
+          members.push(...page.items);
+          cursor = page.next_cursor;
+        } while (cursor);
+        return { data: members };
+      },
       providesTags: (result) =>
         result
           ? [
@@ -1,5 +1,6 @@
 import { API_ENDPOINTS } from "@/constants";
 import type {
+  CursorPage,
   FavoriteDish,
   MessageResponse,
   Order,
@@ -9,20 +10,35 @@ import type {
   OrderItemCreateRequest,
   OrderItemUpdateRequest,
   OrderSetDeliveryFeeRequest,
+  OrderSummary,
 } from "@/types";
 import { baseApi } from "./baseApi";
 
 export const orderApi = baseApi.injectEndpoints({
   endpoints: (builder) => ({
-    getOrders: builder.query<Order[], string>({
-      query: (groupId) => API_ENDPOINTS.ORDERS.LIST(groupId),
+    // Newest first, one page per "Load more"; pageParam is the cursor of the next page
+    getOrders: builder.infiniteQuery<
+      CursorPage<OrderSummary>,
+      string,
+      string | null
+    >({
+      infiniteQueryOptions: {
+        initialPageParam: null,
+        getNextPageParam: (lastPage) => lastPage.next_cursor,
+      },
+      query: ({ queryArg: groupId, pageParam }) => ({
+        url: API_ENDPOINTS.ORDERS.LIST(groupId),
+        params: pageParam ? { cursor: pageParam } : undefined,
+      }),
       providesTags: (result) =>
         result
           ? [
-              ...result.map(({ id }) => ({
-                type: "Order" as const,
-                id,
-              })),
+              ...result.pages.flatMap((page) =>
+                page.items.map(({ id }) => ({
+                  type: "Order" as const,
+                  id,
+                }))
+              ),
               { type: "Order" as const, id: "LIST" },
             ]
           : [{ type: "Order" as const, id: "LIST" }],
@@ -190,7 +206,7 @@ export const orderApi = baseApi.injectEndpoints({
 });
 
 export const {
-  useGetOrdersQuery,
+  useGetOrdersInfiniteQuery,
   useGetActiveOrderQuery,
   useGetOrderQuery,
   useCreateOrderMutation,
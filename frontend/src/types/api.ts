@@ -164,3 +164,9 @@ export interface PaginatedResponse<T> {
   page_size: number;
   total_pages: number;
 }
+
+export interface CursorPage<T> {
+  items: T[];
+  next_cursor: string | null;
+  estimated_total: number | null;
+}
@@ -12,6 +12,7 @@ export type {
   Order,
   OrderDetail,
   OrderItem,
+  OrderSummary,
   Restaurant,
   RestaurantDetail,
   User,
@@ -35,6 +36,7 @@ export type {
   ApiErrorResponse,
   AuthResponse,
   BalanceAdjustmentRequest,
+  CursorPage,
   DishCreateRequest,
   DishUpdateRequest,
   GroupCreateRequest,
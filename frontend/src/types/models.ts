@@ -104,6 +104,12 @@ export interface Order {
   updated_at: string;
 }
 
+export interface OrderSummary extends Order {
+  item_count: number;
+  participant_count: number;
+  total_amount: number;
+}
+
 export interface OrderDetail extends Order {
   items: OrderItem[];
   initiator_name: string | null;